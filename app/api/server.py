@@ -1,13 +1,28 @@
 """Flask API server for Semantic Web KMS."""
 
+import csv
+import gzip
+import hashlib
+import io
 import logging
 import os
 import re
 import shutil
 import tempfile
+import threading
 import time
+import zlib
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import as_completed
 from datetime import datetime
-from typing import Any, Dict, List, Union, cast
+from functools import lru_cache, wraps
+from operator import itemgetter
+from string import Template
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple, Union, cast
+from urllib.parse import urlencode
 
 # Load environment variables from .env if present
 try:
@@ -17,12 +32,49 @@ try:
 except ImportError:
     pass  # python-dotenv not installed; skip loading .env
 
+# orjson is optional; the stdlib-backed Flask JSON provider is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# psutil is optional; health checks omit memory and disk usage without it
+try:
+    import psutil
+except ImportError:
+    psutil = None  # type: ignore[assignment]
+
+# pyoxigraph (native Turtle parser) is optional; rdflib converts exports without it
+try:
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None  # type: ignore[assignment]
+
 import requests
-from flask import Flask, jsonify, request
+from flask import (
+    Flask,
+    Response,
+    copy_current_request_context,
+    has_request_context,
+    jsonify,
+    request,
+    send_file,
+)
 from flask_caching import Cache
 from flask_cors import CORS
-
-from app.core.paths import get_output_path
+from rdflib import Graph
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.core.config import (
+    API_DEBUG,
+    API_HOST,
+    API_PORT,
+    DASHBOARD_AGGREGATES_GRAPH,
+    OUTPUT_DIR,
+    get_default_input_dir,
+)
+from app.core.paths import get_output_path, set_input_dir
 
 # Import progress tracking
 from app.core.progress_tracker import create_tracker, get_tracker_by_id
@@ -35,6 +87,16 @@ AGRAPH_URL = os.environ.get("AGRAPH_CLOUD_URL") or os.environ.get("AGRAPH_SERVER
 AGRAPH_REPO = os.environ.get("AGRAPH_REPO")
 AGRAPH_USER = os.environ.get("AGRAPH_USERNAME")
 AGRAPH_PASS = os.environ.get("AGRAPH_PASSWORD")
+# Compressing request bodies needs server-side support, so it is opt-in
+AGRAPH_GZIP_REQUESTS = os.environ.get("AGRAPH_GZIP_REQUESTS", "false").lower() == "true"
+# Queries smaller than this are sent uncompressed even when enabled
+AGRAPH_GZIP_MIN_BYTES = 1024
+# Cloud URLs already include the repository path; server URLs need it appended
+AGRAPH_ENDPOINT = (
+    AGRAPH_URL
+    if AGRAPH_URL and "/repositories/" in AGRAPH_URL
+    else f"{AGRAPH_URL}/repositories/{AGRAPH_REPO}"
+)
 
 app = Flask(__name__)
 
@@ -48,30 +110,232 @@ CORS(
     supports_credentials=True,
 )
 
-# Initialize Flask-Caching with better configuration
-cache = Cache(
-    app,
-    config={
+# Initialize Flask-Caching with better configuration. SimpleCache is per
+# process; setting REDIS_URL shares cached responses between workers
+# (requires the redis package)
+REDIS_URL = os.environ.get("REDIS_URL")
+# Redis keys are namespaced so cache.clear() deletes only this app's entries;
+# without a prefix RedisCache.clear() flushes the whole database
+REDIS_CACHE_KEY_PREFIX = "semantic-web-kms:"
+
+
+def _cache_config(redis_url: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the Flask-Caching configuration for the given Redis URL.
+
+    Args:
+        redis_url (Optional[str]): Redis connection URL, or None for an
+            in-process cache.
+
+    Returns:
+        Dict[str, Any]: Configuration passed to Cache.
+    """
+    if redis_url:
+        return {
+            "CACHE_TYPE": "RedisCache",
+            "CACHE_REDIS_URL": redis_url,
+            "CACHE_KEY_PREFIX": REDIS_CACHE_KEY_PREFIX,
+            "CACHE_DEFAULT_TIMEOUT": 60,
+        }
+    return {
         "CACHE_TYPE": "SimpleCache",
         "CACHE_DEFAULT_TIMEOUT": 60,  # 1 minute default
         "CACHE_THRESHOLD": 1000,  # Maximum number of items in cache
-    },
-)
+    }
+
+
+cache = Cache(app, config=_cache_config(REDIS_URL))
+
+
+# JSON responses at least this large are gzip-compressed for clients that
+# accept it; level 1 is enough for repetitive JSON keys at little CPU cost
+RESPONSE_GZIP_MIN_BYTES = 512
+RESPONSE_GZIP_LEVEL = 1
+
+
+@app.after_request
+def gzip_json_response(response: Response) -> Response:
+    """
+    Gzip-compress large JSON responses when the client accepts gzip.
+
+    Args:
+        response: The outgoing response.
+
+    Returns:
+        The response, compressed in place when eligible.
+    """
+    if (
+        response.mimetype != "application/json"
+        or response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code >= 300
+        or "Content-Encoding" in response.headers
+        or not request.accept_encodings["gzip"]
+    ):
+        return response
+    data = response.get_data()
+    if len(data) < RESPONSE_GZIP_MIN_BYTES:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=RESPONSE_GZIP_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    # The compressed body is a different byte sequence, so a strong ETag
+    # computed from the identity body may only be kept as a weak one
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def jsonify_fast(obj: Any, status: int = 200) -> Response:
+    """
+    Serialize a JSON response with orjson when it is installed.
+
+    Falls back to Flask's ``jsonify`` otherwise. Meant for the endpoints
+    that return large node, entity or repository lists.
+
+    Args:
+        obj: The JSON-serializable object to return.
+        status: The HTTP status code.
+
+    Returns:
+        Response: The JSON response.
+    """
+    if orjson is None:
+        response = jsonify(obj)
+        response.status_code = status
+        return response
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
+def fallback_json(obj: Any) -> Response:
+    """
+    Build the degraded 200 response a view returns after a query failure.
+
+    The response is marked ``Cache-Control: no-store`` so neither clients
+    nor etag_conditional treat the placeholder as cacheable data.
+
+    Args:
+        obj: The JSON-serializable placeholder payload.
+
+    Returns:
+        Response: The uncacheable JSON response.
+    """
+    response = jsonify(obj)
+    response.cache_control.no_store = True
+    return response
+
+
+def etag_conditional(view: Callable[..., Any]) -> Callable[..., Response]:
+    """
+    Add a content-hash ETag to a read-only JSON endpoint and honor If-None-Match.
+
+    Successful responses get a BLAKE2 ETag of the body and a short
+    ``Cache-Control: max-age`` so browsers and proxies can revalidate with a
+    304 instead of downloading the payload again. Error responses and
+    fallbacks built with fallback_json are passed through untouched, so a
+    client never revalidates against stale error data.
+
+    Args:
+        view: The Flask view function to wrap.
+
+    Returns:
+        The wrapped view function.
+    """
+
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Response:
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code != 200 or response.cache_control.no_store:
+            return response
+        response.set_etag(
+            hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+        )
+        response.cache_control.max_age = 30
+        return response.make_conditional(request)
+
+    return wrapper
+
 
 # Global session for connection pooling
 _agraph_session = None
+_AGRAPH_SESSION_LOCK = threading.Lock()
 
 
 def get_agraph_session():
     """Get or create a global session for AllegroGraph connections."""
     global _agraph_session
-    if _agraph_session is None:
-        _agraph_session = requests.Session()
-        if AGRAPH_USER and AGRAPH_PASS:
-            _agraph_session.auth = (AGRAPH_USER, AGRAPH_PASS)
+    if _agraph_session is not None:
+        return _agraph_session
+    # Concurrent fan-out (analytics, repository metrics) may make the first
+    # call from several threads at once; build a single shared pool and only
+    # publish it once it is fully configured
+    with _AGRAPH_SESSION_LOCK:
+        if _agraph_session is None:
+            session = requests.Session()
+            # Keep a pool of keep-alive connections so concurrent requests
+            # reuse sockets; retries cover dropped connections, not HTTP errors
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=64,
+                max_retries=Retry(total=3, backoff_factor=0.2),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            # Ask AllegroGraph to compress results; requests decodes transparently
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            if AGRAPH_USER and AGRAPH_PASS:
+                session.auth = (AGRAPH_USER, AGRAPH_PASS)
+            _agraph_session = session
     return _agraph_session
 
 
+# Shared pool for the per-request query fan-out of the read endpoints. Its
+# threads are reused across requests, and it caps the queries those
+# endpoints have in flight against the store at once, however many
+# requests arrive together. Tasks run single queries and never submit to it
+SPARQL_FANOUT_WORKERS = 16
+_SPARQL_FANOUT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=SPARQL_FANOUT_WORKERS, thread_name_prefix="sparql-fanout"
+)
+
+
+def post_sparql_form(
+    form: Dict[str, str], accept: str, timeout: Any = (5, 75), stream: bool = False
+) -> requests.Response:
+    """
+    POST a SPARQL protocol form to AllegroGraph over the pooled session.
+
+    When ``AGRAPH_GZIP_REQUESTS`` is enabled, bodies larger than
+    ``AGRAPH_GZIP_MIN_BYTES`` are sent gzip-compressed with
+    ``Content-Encoding: gzip``. Responses are always requested compressed
+    (see ``get_agraph_session``).
+
+    Args:
+        form: The form fields, e.g. ``{"query": ...}``.
+        accept: The Accept header for the response format.
+        timeout: The requests timeout.
+        stream: Leave the response body unread, for iterating over it.
+
+    Returns:
+        requests.Response: The raw HTTP response.
+    """
+    session = get_agraph_session()
+    headers = {"Accept": accept}
+    data: Union[Dict[str, str], bytes] = form
+    if AGRAPH_GZIP_REQUESTS:
+        body = urlencode(form).encode("utf-8")
+        if len(body) > AGRAPH_GZIP_MIN_BYTES:
+            data = gzip.compress(body, compresslevel=6)
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+            headers["Content-Encoding"] = "gzip"
+    return session.post(
+        AGRAPH_ENDPOINT, data=data, headers=headers, timeout=timeout, stream=stream
+    )
+
+
 # Development terms that should be treated as optional in searches
 _DEV_OPTIONAL_TERMS = {
     "commit", "commits",
@@ -102,6 +366,40 @@ _TERM_EXPANSIONS = {
 }
 
 
+def _sparql_escape_string(value: str) -> str:
+    """
+    Escape a value for use inside a double-quoted SPARQL string literal.
+
+    Args:
+        value: The raw string.
+
+    Returns:
+        str: The escaped string, without surrounding quotes.
+    """
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _binding_value(binding: Dict[str, Any], key: str, default: Any = "") -> Any:
+    """
+    Get the value of a variable from a SPARQL JSON result binding.
+
+    Args:
+        binding: One entry of ``results.bindings``.
+        key: The variable name.
+        default: Returned when the variable is unbound in this row.
+
+    Returns:
+        The bound value, or ``default``.
+    """
+    term = binding.get(key)
+    return term["value"] if term else default
+
+
 def _flexify_query_regex(raw: str) -> str:
     """
     Build a regex that:
@@ -112,8 +410,7 @@ def _flexify_query_regex(raw: str) -> str:
     """
     tokens = re.findall(r"[A-Za-z0-9_+-]+", raw, flags=re.UNICODE)
     if not tokens:
-        pat = re.escape(raw)
-        return pat.replace("\\", "\\\\").replace('"', '\\"')
+        return _sparql_escape_string(re.escape(raw))
 
     def pluralize(token: str) -> str:
         esc = re.escape(token)
@@ -157,41 +454,7 @@ def _flexify_query_regex(raw: str) -> str:
     pat = "".join(parts)
     if pat.endswith(".*"):
         pat = pat[:-2]
-    # escape for SPARQL string literal
-    return pat.replace("\\", "\\\\").replace('"', '\\"')
-
-
-def run_graph_sparql(construct_query: str, accept="application/ld+json"):
-    """
-    Execute a CONSTRUCT SPARQL query with proper Accept headers.
-    
-    Args:
-        construct_query: SPARQL CONSTRUCT query
-        accept: Accept header for response format
-        
-    Returns:
-        Query results in requested format
-    """
-    endpoint = (AGRAPH_URL if AGRAPH_URL and "/repositories/" in AGRAPH_URL
-                else f"{AGRAPH_URL}/repositories/{AGRAPH_REPO}")
-    session = get_agraph_session()
-    resp = session.post(endpoint, data={"query": construct_query},
-                        headers={"Accept": accept}, timeout=(5, 75))
-    resp.raise_for_status()
-    return resp.text if "json" not in accept else resp.json()
-
-
-def _csv_escape(s: str) -> str:
-    """
-    Properly escape a string for CSV output.
-    
-    Args:
-        s: String to escape
-        
-    Returns:
-        CSV-safe escaped string with quotes
-    """
-    return '"' + s.replace('"', '""') + '"'
+    return _sparql_escape_string(pat)
 
 
 # Common SPARQL prefixes for cleaner queries
@@ -204,7 +467,7 @@ PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
 
 # Memory-efficient dashboard stats queries based on WDO ontology
 DASHBOARD_QUERIES = {
-    "repositories": "SELECT (COUNT(DISTINCT ?repo) AS ?count) WHERE { ?repo a <http://web-development-ontology.netlify.app/wdo#Repository> . }",
+    "repositories": "SELECT (COUNT(?repo) AS ?count) WHERE { ?repo a <http://web-development-ontology.netlify.app/wdo#Repository> . }",
     "files": "SELECT (COUNT(DISTINCT ?file) AS ?count) WHERE { ?file a ?fileType . ?fileType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#DigitalInformationCarrier> . }",
     "source_files": "SELECT (COUNT(DISTINCT ?file) AS ?count) WHERE { ?file a ?fileType . ?fileType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#SourceCodeFile> . }",
     "doc_files": "SELECT (COUNT(DISTINCT ?file) AS ?count) WHERE { ?file a ?fileType . ?fileType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#DocumentationFile> . }",
@@ -216,7 +479,8 @@ DASHBOARD_QUERIES = {
     "attributes": "SELECT (COUNT(DISTINCT ?attr) AS ?count) WHERE { ?attr a ?attrType . ?attrType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#AttributeDeclaration> . }",
     "variables": "SELECT (COUNT(DISTINCT ?var) AS ?count) WHERE { ?var a ?varType . ?varType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#VariableDeclaration> . }",
     "parameters": "SELECT (COUNT(DISTINCT ?param) AS ?count) WHERE { ?param a ?paramType . ?paramType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#Parameter> . }",
-    "relationships": "SELECT (COUNT(*) AS ?count) WHERE { ?s ?p ?o . ?p a <http://www.w3.org/2002/07/owl#ObjectProperty> . }",
+    # Sum per-predicate counts so the store can answer from its predicate index
+    "relationships": "SELECT (SUM(?c) AS ?count) WHERE { ?p a <http://www.w3.org/2002/07/owl#ObjectProperty> . { SELECT ?p (COUNT(*) AS ?c) WHERE { ?s ?p ?o . } GROUP BY ?p } }",
     "imports": "SELECT (COUNT(*) AS ?count) WHERE { ?s <http://web-development-ontology.netlify.app/wdo#imports> ?o . }",
     "complexity": "SELECT (AVG(?complexity) AS ?avg) (SUM(?complexity) AS ?sum) WHERE { ?func a ?funcType . ?funcType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> . ?func <http://web-development-ontology.netlify.app/wdo#hasCyclomaticComplexity> ?complexity . }",
     "language_distribution": "SELECT ?extension (COUNT(DISTINCT ?file) AS ?files) WHERE { ?file a ?fileType . ?fileType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#SourceCodeFile> . ?file <http://web-development-ontology.netlify.app/wdo#hasExtension> ?extension . } GROUP BY ?extension ORDER BY DESC(?files)",
@@ -226,6 +490,78 @@ DASHBOARD_QUERIES = {
     "contributors": "SELECT (COUNT(DISTINCT ?person) AS ?count) WHERE { ?person a ?personType . ?personType rdfs:subClassOf* <http://xmlns.com/foaf/0.1/Person> . }",
 }
 
+# Result keys of the single-row DASHBOARD_QUERIES, by query name and the
+# aggregate variable each query projects
+_DASHBOARD_STAT_VARS = {
+    "repositories": {"count": "totalRepos"},
+    "files": {"count": "totalFiles"},
+    "source_files": {"count": "sourceFiles"},
+    "doc_files": {"count": "docFiles"},
+    "asset_files": {"count": "assetFiles"},
+    "all_entities": {"count": "totalAllEntities"},
+    "functions": {"count": "totalFunctions"},
+    "classes": {"count": "totalClasses"},
+    "interfaces": {"count": "totalInterfaces"},
+    "attributes": {"count": "totalAttributes"},
+    "variables": {"count": "totalVariables"},
+    "parameters": {"count": "totalParameters"},
+    "relationships": {"count": "totalRelationships"},
+    "imports": {"count": "totalImports"},
+    "complexity": {"avg": "averageComplexity", "sum": "totalComplexity"},
+    "documentation": {"count": "totalDocumentation"},
+    "commits": {"count": "totalCommits"},
+    "issues": {"count": "totalIssues"},
+    "contributors": {"count": "totalContributors"},
+}
+
+
+def _build_dashboard_stats_query() -> str:
+    """
+    Combine the single-row DASHBOARD_QUERIES into one multi-aggregate query.
+
+    Each query becomes a sub-select with its aggregates renamed to their
+    result keys; as every sub-select yields exactly one row, the join is a
+    single row holding all of the statistics.
+
+    Returns:
+        The combined SPARQL query.
+    """
+    subqueries = []
+    for name, variables in _DASHBOARD_STAT_VARS.items():
+        query = DASHBOARD_QUERIES[name]
+        for var, key in variables.items():
+            query = query.replace(f"AS ?{var})", f"AS ?{key})")
+        subqueries.append(f"    {{ {query} }}")
+    return "SELECT * WHERE {\n" + "\n".join(subqueries) + "\n}"
+
+
+DASHBOARD_STATS_QUERY = _build_dashboard_stats_query()
+
+# Default dashboard statistics returned when the triplestore is unavailable,
+# serialized once so the error path does no per-request encoding
+_DEFAULT_DASHBOARD_STATS = {
+    "totalRepos": 0,
+    "totalFiles": 0,
+    "sourceFiles": 0,
+    "docFiles": 0,
+    "assetFiles": 0,
+    "totalFunctions": 0,
+    "totalClasses": 0,
+    "totalInterfaces": 0,
+    "totalAttributes": 0,
+    "totalVariables": 0,
+    "totalParameters": 0,
+    "totalRelationships": 0,
+    "averageComplexity": 0.0,
+    "totalComplexity": 0,
+    "totalDocumentation": 0,
+    "totalCommits": 0,
+    "totalIssues": 0,
+    "totalContributors": 0,
+    "topLanguages": [],
+}
+_DEFAULT_DASHBOARD_STATS_JSON = app.json.dumps(_DEFAULT_DASHBOARD_STATS)
+
 
 def detect_organization_directory(temp_dir: str) -> str:
     """
@@ -260,10 +596,97 @@ def detect_organization_directory(temp_dir: str) -> str:
     return temp_dir
 
 
+# Short-lived cache of SPARQL results for the read-only dashboard endpoints,
+# keyed by a digest of the full query text. Entries remember the graph
+# version they were fetched under, so bumping the version on every write
+# also discards results of queries that were still in flight at the time.
+_SPARQL_CACHE: "OrderedDict[bytes, Tuple[int, float, Any]]" = OrderedDict()
+_SPARQL_CACHE_LOCK = threading.Lock()
+_SPARQL_CACHE_MAXSIZE = 512
+_SPARQL_CACHE_TTL = 60
+_sparql_cache_stats = {"hits": 0, "misses": 0}
+_graph_version = 0
+
+
+def clear_sparql_cache() -> None:
+    """Drop all cached SPARQL results, e.g. after the triplestore changes."""
+    global _graph_version
+    with _SPARQL_CACHE_LOCK:
+        _graph_version += 1
+        _SPARQL_CACHE.clear()
+
+
+def get_sparql_cache_stats() -> Dict[str, Any]:
+    """
+    Get statistics for the dashboard SPARQL cache.
+
+    Returns:
+        Dictionary with cache size, limits, hit/miss counts and graph version.
+    """
+    with _SPARQL_CACHE_LOCK:
+        return {
+            "size": len(_SPARQL_CACHE),
+            "maxsize": _SPARQL_CACHE_MAXSIZE,
+            "ttl": _SPARQL_CACHE_TTL,
+            "hits": _sparql_cache_stats["hits"],
+            "misses": _sparql_cache_stats["misses"],
+            "graphVersion": _graph_version,
+        }
+
+
+def _sparql_cache_bypassed() -> bool:
+    """Return True if the current HTTP request asked to skip the SPARQL cache."""
+    return has_request_context() and request.args.get("no_cache") == "1"
+
+
+# Distinguishes graph-version ETags issued by this process from those of an
+# earlier run, whose version counter started from the same value
+_ETAG_BOOT_ID = os.urandom(4).hex()
+
+
+def graph_version_etag(view: Callable[..., Any]) -> Callable[..., Response]:
+    """
+    Answer If-None-Match with a 304 without running the view if the graph is unchanged.
+
+    The weak ETag combines the graph version with the current SPARQL cache
+    TTL window, so a matching client skips every query the view would have
+    made, and changes made outside this process still surface within one
+    TTL, as they do for the result cache. Degraded responses built with
+    fallback_json get no ETag, so clients do not keep them for the window.
+
+    Args:
+        view: The Flask view function to wrap.
+
+    Returns:
+        The wrapped view function.
+    """
+
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Response:
+        window = int(time.time()) // _SPARQL_CACHE_TTL
+        etag = f"{_ETAG_BOOT_ID}-{_graph_version}-{window}"
+        if request.if_none_match.contains_weak(etag) and not _sparql_cache_bypassed():
+            response = Response(status=304)
+        else:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200 or response.cache_control.no_store:
+                return response
+        response.set_etag(etag, weak=True)
+        response.cache_control.private = True
+        response.cache_control.max_age = 30
+        return response
+
+    return wrapper
+
+
 def run_dashboard_sparql(query: str) -> Any:
     """
     Run a SPARQL query for the dashboard with auto-prepended prefixes.
 
+    Results are cached for ``_SPARQL_CACHE_TTL`` seconds and shared between
+    callers, so they must be treated as read-only. Pass ``?no_cache=1`` on
+    the HTTP request to force a fresh query.
+
     Args:
         query (str): The SPARQL query string to execute.
 
@@ -275,32 +698,119 @@ def run_dashboard_sparql(query: str) -> Any:
         Exception: For other unexpected errors during the request.
 
     Side Effects:
-        Sends a POST request to the AllegroGraph server.
+        Sends a POST request to the AllegroGraph server on a cache miss.
     """
-    # Handle both cloud and server URL formats
-    if AGRAPH_URL and "/repositories/" in AGRAPH_URL:
-        # Cloud URL already includes repository path
-        agraph_endpoint = AGRAPH_URL
-    else:
-        # Server URL needs repository appended
-        agraph_endpoint = f"{AGRAPH_URL}/repositories/{AGRAPH_REPO}"
+    return _run_cached_sparql(query, "json", _post_dashboard_sparql)
+
+
+def run_dashboard_sparql_scalar(query: str) -> Optional[str]:
+    """
+    Run a single-value SPARQL query for the dashboard, e.g. a COUNT or SUM.
+
+    The results are requested as CSV rather than SPARQL JSON, which for one
+    value is a fraction of the size and needs no JSON decoding. Results
+    share the dashboard SPARQL cache with run_dashboard_sparql.
+
+    Args:
+        query (str): The SPARQL query string to execute.
+
+    Returns:
+        The first column of the first result row, or None if there are no
+        rows or the value is unbound.
+
+    Raises:
+        requests.HTTPError: If the HTTP request to the endpoint fails.
+    """
+    rows = _run_cached_sparql(query, "csv", _post_dashboard_sparql_csv)
+    if not rows or not rows[0] or not rows[0][0]:
+        return None
+    return rows[0][0]
+
+
+@lru_cache(maxsize=256)
+def _prepare_dashboard_query(query: str, kind: str) -> Tuple[str, bytes]:
+    """
+    Prefix a dashboard query and derive its result cache key.
 
+    Dashboard queries are constants or rendered once per graph version, so
+    the prefixed text and its digest are memoized instead of being rebuilt
+    and rehashed on every call.
+
+    Args:
+        query (str): The SPARQL query string.
+        kind (str): Result format, kept apart in the cache key.
+
+    Returns:
+        The query with PREFIXES prepended if absent, and its cache key.
+    """
     # Auto-prepend PREFIXES if not already present
     if not query.lstrip().upper().startswith("PREFIX"):
         query = PREFIXES + query
+    key = hashlib.blake2b(
+        query.encode("utf-8"), digest_size=16, person=kind.encode("ascii")
+    ).digest()
+    return query, key
 
-    # Use global session for connection pooling
-    session = get_agraph_session()
 
+def _run_cached_sparql(query: str, kind: str, post: Callable[[str], Any]) -> Any:
+    """
+    Run a dashboard query through the shared SPARQL result cache.
+
+    Args:
+        query (str): The SPARQL query string; PREFIXES are prepended if absent.
+        kind (str): Result format, kept apart in the cache key.
+        post: Sends the prefixed query and decodes the response.
+
+    Returns:
+        The (possibly cached) decoded result returned by ``post``.
+    """
+    query, key = _prepare_dashboard_query(query, kind)
+    bypass = _sparql_cache_bypassed()
+    with _SPARQL_CACHE_LOCK:
+        version = _graph_version
+        if not bypass:
+            entry = _SPARQL_CACHE.get(key)
+            if entry is not None:
+                if time.monotonic() - entry[1] < _SPARQL_CACHE_TTL:
+                    _SPARQL_CACHE.move_to_end(key)
+                    _sparql_cache_stats["hits"] += 1
+                    return entry[2]
+                del _SPARQL_CACHE[key]
+        _sparql_cache_stats["misses"] += 1
+
+    result = post(query)
+
+    with _SPARQL_CACHE_LOCK:
+        # Do not store results fetched before the graph last changed
+        if version == _graph_version:
+            _SPARQL_CACHE[key] = (version, time.monotonic(), result)
+            _SPARQL_CACHE.move_to_end(key)
+            while len(_SPARQL_CACHE) > _SPARQL_CACHE_MAXSIZE:
+                _SPARQL_CACHE.popitem(last=False)
+    return result
+
+
+def _post_dashboard_sparql(query: str, timeout: Any = (5, 75)) -> Any:
+    """
+    Send a prefixed SPARQL query to AllegroGraph and decode the JSON results.
+
+    Args:
+        query (str): The complete SPARQL query string to execute.
+        timeout: The requests (connect, read) timeout.
+
+    Returns:
+        dict: The JSON-decoded response from the AllegroGraph endpoint.
+
+    Raises:
+        requests.HTTPError: If the HTTP request to the endpoint fails.
+    """
     # Debug logging
-    logger.debug(f"SPARQL endpoint: {agraph_endpoint}")
+    logger.debug(f"SPARQL endpoint: {AGRAPH_ENDPOINT}")
     logger.debug(f"SPARQL query: {query[:200]}...")  # Log first 200 chars
 
-    resp = session.post(
-        agraph_endpoint,
-        data={"query": query},
-        headers={"Accept": "application/sparql-results+json"},
-        timeout=(5, 75),  # Optimized timeout (5s connection, 75s read)
+    # Default timeout: 5s connection, 75s read
+    resp = post_sparql_form(
+        {"query": query}, "application/sparql-results+json", timeout=timeout
     )
 
     # Debug logging
@@ -309,9 +819,156 @@ def run_dashboard_sparql(query: str) -> Any:
         logger.error(f"SPARQL response text: {resp.text}")
 
     resp.raise_for_status()
+    if orjson is not None:
+        # Decode straight from the body bytes, skipping the str round-trip
+        return orjson.loads(resp.content)
     return resp.json()
 
 
+def _post_dashboard_sparql_csv(query: str) -> List[List[str]]:
+    """
+    Send a prefixed SPARQL query to AllegroGraph and parse the CSV results.
+
+    Args:
+        query (str): The complete SPARQL query string to execute.
+
+    Returns:
+        list: The result rows as lists of strings, without the header row.
+
+    Raises:
+        requests.HTTPError: If the HTTP request to the endpoint fails.
+    """
+    logger.debug(f"SPARQL query (CSV): {query[:200]}...")
+    resp = post_sparql_form({"query": query}, "text/csv")
+    if resp.status_code != 200:
+        logger.error(f"SPARQL response text: {resp.text}")
+    resp.raise_for_status()
+    return list(csv.reader(io.StringIO(resp.text)))[1:]
+
+
+def clear_triplestore() -> bool:
+    """
+    Remove all triples from the AllegroGraph repository.
+
+    Issues ``CLEAR ALL`` so the store can truncate the repository directly
+    instead of matching and deleting every triple one by one.
+
+    Returns:
+        bool: True if the store accepted the update, False otherwise.
+    """
+    try:
+        resp = post_sparql_form(
+            {"update": "CLEAR ALL"}, "application/sparql-results+json", timeout=60
+        )
+    except Exception as clear_exc:
+        logger.warning(f"Exception clearing triplestore: {clear_exc}")
+        return False
+    # Any cached result may now describe data that no longer exists
+    clear_sparql_cache()
+    if resp.status_code != 200:
+        logger.warning(f"Failed to clear triplestore: {resp.text}")
+        return False
+    logger.info("Triplestore cleared before new upload.")
+    return True
+
+
+def _run_pipeline_job(
+    job_id: str, org_dir: str, tracker: Any, cleanup_dir: Optional[str] = None
+) -> None:
+    """
+    Clear the triplestore and run the knowledge pipeline for a background job.
+
+    Args:
+        job_id: The job ID used for logging.
+        org_dir: The organization directory to analyze.
+        tracker: The progress tracker for the job.
+        cleanup_dir: Optional temporary directory to remove once the job ends.
+    """
+    try:
+        logger.info(f"[Job {job_id}] Starting triplestore clear...")
+        # Clear the triplestore before loading new data
+        clear_triplestore()
+        logger.info(f"[Job {job_id}] Triplestore clear finished")
+
+        # Set the input directory for the pipeline
+        set_input_dir(org_dir)
+
+        # Imported lazily: the pipeline module parses sys.argv and configures
+        # logging at import time, which must not happen when the server loads
+        from app.knowledge_pipeline import main as run_pipeline
+
+        run_pipeline()
+    except Exception as e:
+        logger.error(f"[Job {job_id}] Error in run_analysis: {e}")
+        tracker.end_job(success=False, error=str(e))
+        logger.info(f"[Job {job_id}] Marked as error.")
+    else:
+        # Drop anything cached while the pipeline was loading, then
+        # precompute the dashboard aggregates over the new graph
+        clear_sparql_cache()
+        compute_and_store_dashboard_aggregates()
+        tracker.end_job(success=True)
+        logger.info(f"[Job {job_id}] Marked as completed.")
+    finally:
+        # The pipeline loaded new triples; stop serving pre-upload results
+        clear_sparql_cache()
+        if cleanup_dir:
+            # Clean up temporary directory
+            try:
+                shutil.rmtree(cleanup_dir)
+            except Exception as cleanup_error:
+                logger.warning(
+                    f"Failed to clean up temporary directory {cleanup_dir}: {cleanup_error}"
+                )
+
+
+# Seconds a request waits for another request's in-flight cache fill
+SINGLE_FLIGHT_TIMEOUT = 30
+# Cache fills in progress, by key, so concurrent misses run them only once
+_inflight_fills: Dict[str, Future] = {}
+_INFLIGHT_FILLS_LOCK = threading.Lock()
+
+
+def _single_flight(key: str, fill: Callable[[], Any]) -> Any:
+    """
+    Call a cache-backed function without concurrent callers repeating a miss.
+
+    The first caller for ``key`` runs ``fill``; callers arriving while it
+    runs wait for it and then call ``fill`` themselves, which is served
+    from the cache the first call populated. Each caller therefore gets
+    its own result object.
+
+    Args:
+        key: Identifies the cached value being filled.
+        fill: The cache-backed function to call.
+
+    Returns:
+        The result of ``fill``.
+    """
+    with _INFLIGHT_FILLS_LOCK:
+        future = _inflight_fills.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight_fills[key] = Future()
+    if not leader:
+        try:
+            future.result(timeout=SINGLE_FLIGHT_TIMEOUT)
+        except Exception:
+            # The leader failed or is stuck; fall through and try ourselves
+            pass
+        return fill()
+    try:
+        result = fill()
+        future.set_result(None)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_FILLS_LOCK:
+            del _inflight_fills[key]
+
+
 @cache.cached(timeout=60)  # Cache for 1 minute instead of 5 minutes
 def dashboard_stats() -> Any:
     """
@@ -354,108 +1011,42 @@ def dashboard_stats() -> Any:
             "topLanguages": [],
         }
 
-        # Run separate queries to avoid memory issues
-        for query_name, query in DASHBOARD_QUERIES.items():
+        # The combined statistics and the language distribution are
+        # independent round-trips, so send both to the shared pool before
+        # waiting on either
+        run_stats = copy_current_request_context(run_dashboard_sparql)
+        run_languages = copy_current_request_context(run_dashboard_sparql)
+        stats_future = _SPARQL_FANOUT_EXECUTOR.submit(run_stats, DASHBOARD_STATS_QUERY)
+        languages_future = _SPARQL_FANOUT_EXECUTOR.submit(
+            run_languages, DASHBOARD_QUERIES["language_distribution"]
+        )
+
+        # All single-row statistics in one round-trip
+        try:
+            bindings = stats_future.result()["results"]["bindings"]
+            binding = bindings[0] if bindings else {}
+            for name, variables in _DASHBOARD_STAT_VARS.items():
+                if name != "complexity":
+                    key = variables["count"]
+                    results[key] = int(_binding_value(binding, key, "0"))
             try:
-                data = run_dashboard_sparql(query)
-                bindings = data["results"]["bindings"]
-
-                if bindings and bindings[0]:
-                    binding = bindings[0]
-
-                    if query_name == "repositories":
-                        results["totalRepos"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "files":
-                        results["totalFiles"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "source_files":
-                        results["sourceFiles"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "doc_files":
-                        results["docFiles"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "asset_files":
-                        results["assetFiles"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "all_entities":
-                        results["totalAllEntities"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "functions":
-                        results["totalFunctions"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "classes":
-                        results["totalClasses"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "interfaces":
-                        results["totalInterfaces"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "attributes":
-                        results["totalAttributes"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "variables":
-                        results["totalVariables"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "parameters":
-                        results["totalParameters"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "relationships":
-                        results["totalRelationships"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "imports":
-                        results["totalImports"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "complexity":
-                        avg_val = binding.get("avg", {}).get("value", "0")
-                        try:
-                            results["averageComplexity"] = round(float(avg_val), 2)
-                        except Exception:
-                            results["averageComplexity"] = 0.0
-                        try:
-                            results["totalComplexity"] = int(
-                                binding.get("sum", {}).get("value", "0")
-                            )
-                        except Exception:
-                            results["totalComplexity"] = 0
-                    elif query_name == "documentation":
-                        results["totalDocumentation"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "commits":
-                        results["totalCommits"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "issues":
-                        results["totalIssues"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-                    elif query_name == "contributors":
-                        results["totalContributors"] = int(
-                            binding.get("count", {}).get("value", "0")
-                        )
-
-            except Exception as e:
-                logger.warning(f"Query {query_name} failed: {e}")
-                # Continue with other queries even if one fails
+                results["averageComplexity"] = round(
+                    float(_binding_value(binding, "averageComplexity", "0")), 2
+                )
+            except Exception:
+                results["averageComplexity"] = 0.0
+            try:
+                results["totalComplexity"] = int(
+                    _binding_value(binding, "totalComplexity", "0")
+                )
+            except Exception:
+                results["totalComplexity"] = 0
+        except Exception as e:
+            logger.warning(f"Dashboard statistics query failed: {e}")
 
         # Add language distribution to results
         try:
-            data = run_dashboard_sparql(DASHBOARD_QUERIES["language_distribution"])
-            bindings = data["results"]["bindings"]
+            bindings = languages_future.result()["results"]["bindings"]
             total = sum(int(b["files"]["value"]) for b in bindings) or 1
 
             # Extension to language mapping
@@ -505,6 +1096,7 @@ def dashboard_stats() -> Any:
             logger.warning(f"Language distribution query failed: {e}")
 
         # Transform results to match frontend expectations
+        now_iso = datetime.now().isoformat()
         transformed_results = {
             "totalEntities": results["totalAllEntities"],
             "totalRelationships": results["totalRelationships"],
@@ -514,46 +1106,29 @@ def dashboard_stats() -> Any:
             "totalLines": 0,  # Not calculated in current queries
             "averageComplexity": results["averageComplexity"],
             "recentActivity": {
-                "lastUpdated": datetime.now().isoformat(),
+                "lastUpdated": now_iso,
                 "newEntities": 0,  # Not tracked in current implementation
                 "newRelationships": 0,  # Not tracked in current implementation
             },
             "topLanguages": results["topLanguages"],
             "processingStatus": {
                 "status": "completed",
-                "lastProcessed": datetime.now().isoformat(),
-                "nextScheduled": datetime.now().isoformat(),
+                "lastProcessed": now_iso,
+                "nextScheduled": now_iso,
             },
         }
 
-        return jsonify(transformed_results)
+        response = jsonify(transformed_results)
+        # Content-hash ETag lets polling clients revalidate with a 304
+        response.set_etag(
+            hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+        )
+        return response
 
     except Exception as e:
         logger.error(f"Dashboard stats failed: {e}")
         # Return default values on error
-        return jsonify(
-            {
-                "totalRepos": 0,
-                "totalFiles": 0,
-                "sourceFiles": 0,
-                "docFiles": 0,
-                "assetFiles": 0,
-                "totalFunctions": 0,
-                "totalClasses": 0,
-                "totalInterfaces": 0,
-                "totalAttributes": 0,
-                "totalVariables": 0,
-                "totalParameters": 0,
-                "totalRelationships": 0,
-                "averageComplexity": 0.0,
-                "totalComplexity": 0,
-                "totalDocumentation": 0,
-                "totalCommits": 0,
-                "totalIssues": 0,
-                "totalContributors": 0,
-                "topLanguages": [],
-            }
-        )
+        return Response(_DEFAULT_DASHBOARD_STATS_JSON, mimetype="application/json")
 
 
 @app.route("/api/progress/<job_id>", methods=["GET"])
@@ -641,8 +1216,6 @@ def analyze_organization() -> Any:
             return jsonify({"error": "Organization name is required"}), 400
 
         # Create a job ID based on organization name and timestamp
-        import time
-
         job_id = f"{organization_name}_{int(time.time())}"
 
         # Create a new tracker
@@ -650,63 +1223,12 @@ def analyze_organization() -> Any:
         tracker.start_job()
 
         # Determine organization directory (from request or default)
-        org_dir = data.get("org_dir") or os.environ.get(
-            "DEFAULT_INPUT_DIR", "~/downloads/repos/Thinkster/"
-        )
+        org_dir = data.get("org_dir") or get_default_input_dir()
 
         # Start the analysis in a background thread
-        import threading
-
-        def run_analysis(org_dir: str):
-            try:
-                logger.info(f"[Job {job_id}] Starting triplestore clear...")
-                # Clear the triplestore before loading new data
-                try:
-                    clear_query = """
-                    DELETE { ?s ?p ?o }
-                    WHERE  { ?s ?p ?o }
-                    """
-                    if AGRAPH_URL and "/repositories/" in AGRAPH_URL:
-                        agraph_endpoint = AGRAPH_URL
-                    else:
-                        agraph_endpoint = f"{AGRAPH_URL}/repositories/{AGRAPH_REPO}"
-                    headers = {"Accept": "application/sparql-results+json"}
-                    session = get_agraph_session()
-                    resp = session.post(
-                        agraph_endpoint,
-                        data={"update": clear_query},
-                        headers=headers,
-                        timeout=60,
-                    )
-                    logger.info(
-                        f"[Job {job_id}] Triplestore clear finished with status {resp.status_code}"
-                    )
-                    if resp.status_code != 200:
-                        logger.warning(f"Failed to clear triplestore: {resp.text}")
-                    else:
-                        logger.info("Triplestore cleared before new upload.")
-                except Exception as clear_exc:
-                    logger.warning(f"Exception clearing triplestore: {clear_exc}")
-
-                # Set the input directory for the pipeline
-                from app.core.paths import set_input_dir
-
-                set_input_dir(org_dir)
-
-                # Import and run the knowledge pipeline
-                from app.knowledge_pipeline import main as run_pipeline
-
-                run_pipeline()
-            except Exception as e:
-                logger.error(f"[Job {job_id}] Error in run_analysis: {e}")
-                tracker.end_job(success=False, error=str(e))
-                logger.info(f"[Job {job_id}] Marked as error.")
-            else:
-                tracker.end_job(success=True)
-                logger.info(f"[Job {job_id}] Marked as completed.")
-            # No temp_dir cleanup needed here
-
-        thread = threading.Thread(target=run_analysis, args=(org_dir,))
+        thread = threading.Thread(
+            target=_run_pipeline_job, args=(job_id, org_dir, tracker)
+        )
         thread.daemon = True
         thread.start()
 
@@ -756,8 +1278,6 @@ def upload_organization() -> Any:
             org_dir = detect_organization_directory(temp_dir)
 
             # Create a job ID based on timestamp
-            import time
-
             job_id = f"upload_{int(time.time())}"
 
             # Create a new tracker
@@ -765,65 +1285,9 @@ def upload_organization() -> Any:
             tracker.start_job()
 
             # Start the analysis in a background thread
-            import threading
-
-            def run_analysis():
-                try:
-                    logger.info(f"[Job {job_id}] Starting triplestore clear...")
-                    # Clear the triplestore before loading new data
-                    try:
-                        clear_query = """
-                        DELETE { ?s ?p ?o }
-                        WHERE  { ?s ?p ?o }
-                        """
-                        if AGRAPH_URL and "/repositories/" in AGRAPH_URL:
-                            agraph_endpoint = AGRAPH_URL
-                        else:
-                            agraph_endpoint = f"{AGRAPH_URL}/repositories/{AGRAPH_REPO}"
-                        headers = {"Accept": "application/sparql-results+json"}
-                        session = get_agraph_session()
-                        resp = session.post(
-                            agraph_endpoint,
-                            data={"update": clear_query},
-                            headers=headers,
-                            timeout=60,
-                        )
-                        logger.info(
-                            f"[Job {job_id}] Triplestore clear finished with status {resp.status_code}"
-                        )
-                        if resp.status_code != 200:
-                            logger.warning(f"Failed to clear triplestore: {resp.text}")
-                        else:
-                            logger.info("Triplestore cleared before new upload.")
-                    except Exception as clear_exc:
-                        logger.warning(f"Exception clearing triplestore: {clear_exc}")
-
-                    # Set the input directory for the pipeline
-                    from app.core.paths import set_input_dir
-
-                    set_input_dir(org_dir)
-
-                    # Import and run the knowledge pipeline
-                    from app.knowledge_pipeline import main as run_pipeline
-
-                    run_pipeline()
-                except Exception as e:
-                    logger.error(f"[Job {job_id}] Error in run_analysis: {e}")
-                    tracker.end_job(success=False, error=str(e))
-                    logger.info(f"[Job {job_id}] Marked as error.")
-                else:
-                    tracker.end_job(success=True)
-                    logger.info(f"[Job {job_id}] Marked as completed.")
-                finally:
-                    # Clean up temporary directory
-                    try:
-                        shutil.rmtree(temp_dir)
-                    except Exception as cleanup_error:
-                        logger.warning(
-                            f"Failed to clean up temporary directory {temp_dir}: {cleanup_error}"
-                        )
-
-            thread = threading.Thread(target=run_analysis)
+            thread = threading.Thread(
+                target=_run_pipeline_job, args=(job_id, org_dir, tracker, temp_dir)
+            )
             thread.daemon = True
             thread.start()
 
@@ -851,6 +1315,7 @@ def upload_organization() -> Any:
 
 
 @app.route("/api/organizations", methods=["GET"])
+@etag_conditional
 def get_organizations() -> Any:
     """
     Get a list of all organizations.
@@ -870,20 +1335,33 @@ def get_organizations() -> Any:
         """
         data = run_dashboard_sparql(sparql)
         bindings = data["results"]["bindings"]
-        orgs = {}
+        org_names: Dict[str, str] = {}
+        repos_by_org: DefaultDict[str, List[Dict[str, str]]] = defaultdict(list)
         for b in bindings:
             org_id = b["org"]["value"]
-            org_name = b.get("name", {}).get("value", org_id.split("/")[-1])
+            org_repos = repos_by_org[org_id]
+            if not org_repos:
+                # First binding for this organization
+                org_names[org_id] = b.get("name", {}).get(
+                    "value", org_id.rpartition("/")[2]
+                )
             repo_id = b["repo"]["value"]
-            repo_name = b.get("repoName", {}).get("value", repo_id.split("/")[-1])
-            if org_id not in orgs:
-                orgs[org_id] = {"id": org_id, "name": org_name, "repositories": []}
-            orgs[org_id]["repositories"].append({"id": repo_id, "name": repo_name})
+            repo_name = b.get("repoName", {}).get("value", repo_id.rpartition("/")[2])
+            org_repos.append({"id": repo_id, "name": repo_name})
+        orgs = [
+            {"id": org_id, "name": org_names[org_id], "repositories": repositories}
+            for org_id, repositories in repos_by_org.items()
+        ]
         # Always return 200 with a list (empty if no orgs)
-        return jsonify(list(orgs.values())), 200
+        return jsonify(orgs), 200
     except Exception as e:
         logger.error(f"Error in get_organizations: {str(e)}")
-        return jsonify([]), 200
+        return fallback_json([])
+
+
+# Precompiled checks for is_valid_uri
+_URI_RE = re.compile(r"^https?://[^\s]+$")
+_URI_UNSAFE_CHARS = str.maketrans("", "", ">\"'{};")
 
 
 def is_valid_uri(uri: str) -> bool:
@@ -902,11 +1380,47 @@ def is_valid_uri(uri: str) -> bool:
     Returns:
         bool: True if the URI is a valid HTTP(S) URI and does not contain dangerous characters, False otherwise.
     """
-    # Reject if dangerous characters are present (SPARQL injection risk)
-    if any(c in uri for c in (">", '"', "'", "{", "}", ";")):
+    # Reject if dangerous characters are present (SPARQL injection risk):
+    # deleting them in one C-level pass changes the length only if any occur
+    if len(uri.translate(_URI_UNSAFE_CHARS)) != len(uri):
         return False
     # Simple regex for URI validation (can be improved for stricter checks)
-    return bool(re.match(r"^https?://[^\s]+$", uri))
+    return _URI_RE.match(uri) is not None
+
+
+# Organization, its repositories and the scoped file and relationship counts
+# in one round-trip; each aggregate sub-select yields a single row, so it is
+# repeated on every repository binding
+_T_ORG_DETAIL = Template(
+    """
+    PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
+    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+    SELECT ?name ?repo ?repoName ?totalFiles ?totalRelationships WHERE {
+        VALUES ?org { <$org_id> }
+        ?org a wdo:Organization .
+        OPTIONAL { ?org rdfs:label ?name . }
+        ?org wdo:hasRepository ?repo .
+        ?repo a wdo:Repository .
+        OPTIONAL { ?repo rdfs:label ?repoName . }
+        {
+            # Scoped file count (DigitalInformationCarrier)
+            SELECT (COUNT(DISTINCT ?file) AS ?totalFiles) WHERE {
+                <$org_id> wdo:hasRepository/wdo:hasFile ?file .
+                ?file a/rdfs:subClassOf* wdo:DigitalInformationCarrier .
+            }
+        }
+        {
+            # Scoped relationship count
+            SELECT (COUNT(*) AS ?totalRelationships) WHERE {
+                <$org_id> wdo:hasRepository/wdo:hasFile ?relFile .
+                ?relFile wdo:bearerOfInformation ?entity .
+                ?entity ?rel ?target .
+                FILTER(isIRI(?target))
+            }
+        }
+    }
+    """
+)
 
 
 @app.route("/api/organizations/<path:org_id>", methods=["GET"])
@@ -924,67 +1438,24 @@ def get_organization(org_id: str) -> Any:
         # Validate org_id as a URI to prevent injection
         if not is_valid_uri(org_id):
             return jsonify({"error": "Invalid organization ID"}), 400
-        # Get organization and its repositories
-        sparql = f"""
-        SELECT ?org ?name ?repo ?repoName WHERE {{
-            <{org_id}> a <http://web-development-ontology.netlify.app/wdo#Organization> .
-            OPTIONAL {{ <{org_id}> <http://www.w3.org/2000/01/rdf-schema#label> ?name . }}
-            <{org_id}> <http://web-development-ontology.netlify.app/wdo#hasRepository> ?repo .
-            ?repo a <http://web-development-ontology.netlify.app/wdo#Repository> .
-            OPTIONAL {{ ?repo <http://www.w3.org/2000/01/rdf-schema#label> ?repoName . }}
-        }}
-        """
+        sparql = _T_ORG_DETAIL.substitute(org_id=org_id)
         data = run_dashboard_sparql(sparql)
         bindings = data["results"]["bindings"]
 
         if not bindings:
             return jsonify({"error": "Organization not found"}), 404
 
-        org_name = bindings[0].get("name", {}).get("value", org_id.split("/")[-1])
+        first = bindings[0]
+        org_name = first.get("name", {}).get("value", org_id.rpartition("/")[2])
+        total_files = int(first.get("totalFiles", {}).get("value", 0))
+        total_relationships = int(first.get("totalRelationships", {}).get("value", 0))
         repositories = []
 
         for b in bindings:
             repo_id = b["repo"]["value"]
-            repo_name = b.get("repoName", {}).get("value", repo_id.split("/")[-1])
+            repo_name = b.get("repoName", {}).get("value", repo_id.rpartition("/")[2])
             repositories.append({"id": repo_id, "name": repo_name})
 
-        # Scoped file count query for this organization (count DigitalInformationCarrier)
-        stats_query = f"""
-        PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        SELECT (COUNT(DISTINCT ?file) AS ?totalFiles)
-        WHERE {{
-            ?org wdo:hasRepository ?repo .
-            ?repo wdo:hasFile ?file .
-            ?file a/rdfs:subClassOf* wdo:DigitalInformationCarrier .
-            VALUES ?org {{ <{org_id}> }}
-        }}
-        """
-        # Scoped relationship count query for this organization (VALUES inside WHERE)
-        relationships_query = f"""
-        PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
-        SELECT (COUNT(*) AS ?totalRelationships)
-        WHERE {{
-            ?org wdo:hasRepository ?repo .
-            ?repo wdo:hasFile ?file .
-            ?file wdo:bearerOfInformation ?entity .
-            ?entity ?rel ?target .
-            FILTER(isIRI(?target))
-            VALUES ?org {{ <{org_id}> }}
-        }}
-        """
-        stats_data = run_dashboard_sparql(stats_query)
-        stats_bindings = stats_data["results"]["bindings"]
-        rel_data = run_dashboard_sparql(relationships_query)
-        rel_bindings = rel_data["results"]["bindings"]
-
-        total_files = 0
-        total_relationships = 0
-        if stats_bindings:
-            total_files = int(stats_bindings[0]["totalFiles"]["value"])
-        if rel_bindings:
-            total_relationships = int(rel_bindings[0]["totalRelationships"]["value"])
-
         return jsonify(
             {
                 "id": org_id,
@@ -999,7 +1470,235 @@ def get_organization(org_id: str) -> Any:
         return jsonify({"error": f"Failed to get organization: {str(e)}"}), 500
 
 
+# Fallback metric queries run concurrently: at most _REPO_METRICS_WORKERS per
+# request, and at most _REPO_METRICS_MAX_INFLIGHT across all requests
+_REPO_METRICS_WORKERS = 16
+_REPO_METRICS_MAX_INFLIGHT = 32
+_REPO_METRICS_SEMAPHORE = threading.BoundedSemaphore(_REPO_METRICS_MAX_INFLIGHT)
+
+
+# Fallback query: sample language
+_T_REPO_LANGUAGE = Template(
+    """
+    PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
+    SELECT (SAMPLE(?lang) AS ?language)
+    WHERE {
+      <$repo_uri> wdo:hasFile ?file .
+      ?file wdo:bearerOfInformation|wdo:informationBorneBy ?codeContent .
+      ?codeContent wdo:hasProgrammingLanguage ?lang .
+    }
+    """
+)
+
+# Fallback query: average complexity
+_T_REPO_COMPLEXITY = Template(
+    """
+    PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
+    SELECT (AVG(?complexity) AS ?avgComplexity)
+    WHERE {
+        <$repo_uri> a wdo:Repository .
+        <$repo_uri> wdo:hasFile/wdo:bearerOfInformation/wdo:hasCodePart* ?function .
+        ?function a wdo:FunctionDefinition ;
+                  wdo:hasCyclomaticComplexity ?complexity .
+    }
+    """
+)
+
+# Fallback query: contributor count
+_T_REPO_CONTRIBUTORS = Template(
+    """
+    PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
+    SELECT (COUNT(DISTINCT ?contributor) AS ?contributors)
+    WHERE {
+      <$repo_uri> wdo:hasContributor ?contributor .
+    }
+    """
+)
+
+# Fallback query: file count (DigitalInformationCarrier)
+_T_REPO_FILES = Template(
+    """
+    PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
+    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+    SELECT (COUNT(DISTINCT ?file) AS ?files)
+    WHERE {
+        <$repo_uri> wdo:hasFile ?file .
+        ?file a/rdfs:subClassOf* wdo:DigitalInformationCarrier .
+    }
+    """
+)
+
+# Fallback query: editorial note (skos:editorialNote)
+_T_REPO_EDITORIAL_NOTE = Template(
+    """
+    PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
+    SELECT ?editorialNote WHERE {
+        <$repo_uri> skos:editorialNote ?editorialNote .
+    } LIMIT 1
+    """
+)
+
+# Fallback query: entity counts for all repositories at once, grouped by the
+# VALUES-bound repository
+_T_REPO_ENTITY_COUNTS = Template(
+    """
+    PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
+
+    SELECT ?repo (COUNT(DISTINCT ?entity) AS ?entityCount)
+    WHERE {
+      VALUES ?repo { $repos }
+
+      # The UNION block finds all entities through the different valid paths.
+      {
+        # -- Path 1: From File Contents (Direct and Nested) --
+        ?repo wdo:hasFile/wdo:bearerOfInformation ?fileContent .
+        ?fileContent (wdo:hasCodePart | wdo:hasMethod | wdo:hasDocumentComponent)* ?entity .
+      }
+      UNION
+      {
+        # -- Path 2: From the Commit History --
+        ?repo wdo:hasCommit ?commit .
+        {
+          ?commit wdo:hasCommitMessage ?entity .
+        }
+        UNION
+        {
+          ?commit (wdo:addressesIssue|wdo:fixesIssue) ?entity .
+        }
+      }
+
+      # -- We still need the filters to ensure we are counting the right things --
+      ?entity a ?entityTypeRaw .
+
+      # Ensure the entity is a WDO class and not a generic BFO class.
+      FILTER CONTAINS(STR(?entityTypeRaw), "web-development-ontology.netlify.app")
+      # Ensure the entity itself is a named individual, not a blank node.
+      FILTER(isIRI(?entity))
+    }
+    GROUP BY ?repo
+    """
+)  # nosec B608
+
+# (repo key, result variable, default value, query template) per metric
+_REPO_METRIC_TEMPLATES = [
+    ("language", "language", "Unknown", _T_REPO_LANGUAGE),
+    ("complexity", "avgComplexity", 0.0, _T_REPO_COMPLEXITY),
+    ("contributors", "contributors", 0, _T_REPO_CONTRIBUTORS),
+    ("files", "files", 0, _T_REPO_FILES),
+    ("editorialNote", "editorialNote", "", _T_REPO_EDITORIAL_NOTE),
+]
+
+
+def _repository_metric_queries(repo_uri: str) -> List[Tuple[str, str, Any, str]]:
+    """
+    Build the per-metric fallback queries for one repository.
+
+    Used when the aggregated repository query fails.
+
+    Args:
+        repo_uri: The repository URI.
+
+    Returns:
+        List of (repo key, result variable, default value, SPARQL query) tuples.
+    """
+    return [
+        (key, column, default, template.substitute(repo_uri=repo_uri))
+        for key, column, default, template in _REPO_METRIC_TEMPLATES
+    ]
+
+
+def _run_repository_metric(column: str, default: Any, query: str) -> Any:
+    """
+    Run one fallback metric query and convert its single value.
+
+    Args:
+        column: The result variable holding the metric.
+        default: Value returned when the query fails or has no result; its
+            type decides how the SPARQL literal is converted.
+        query: The SPARQL query to run.
+
+    Returns:
+        The metric value, or ``default``.
+    """
+    try:
+        with _REPO_METRICS_SEMAPHORE:
+            data = run_dashboard_sparql(query)
+        bindings = data["results"]["bindings"]
+        if bindings and column in bindings[0]:
+            return type(default)(bindings[0][column]["value"])
+    except Exception:
+        pass
+    return default
+
+
+def _run_repository_entity_counts(repo_uris: List[str]) -> Dict[str, int]:
+    """
+    Count the entities of several repositories with one batched query.
+
+    Args:
+        repo_uris: Validated repository URIs.
+
+    Returns:
+        Mapping of repository URI to entity count; repositories without
+        entities, or all of them if the query fails, are missing.
+    """
+    query = _T_REPO_ENTITY_COUNTS.substitute(
+        repos=" ".join(f"<{uri}>" for uri in repo_uris)
+    )
+    try:
+        with _REPO_METRICS_SEMAPHORE:
+            data = run_dashboard_sparql(query)
+        return {
+            b["repo"]["value"]: int(b["entityCount"]["value"])
+            for b in data["results"]["bindings"]
+            if "entityCount" in b
+        }
+    except Exception:
+        return {}
+
+
+def _fetch_repository_metrics(repos: List[Dict[str, Any]]) -> None:
+    """
+    Populate metrics for several repositories with concurrent SPARQL queries.
+
+    Every (repository, metric) query is independent, so they run on a thread
+    pool over the pooled AllegroGraph session, next to a single batched
+    entity-count query for all repositories. Metrics are added in place.
+
+    Args:
+        repos: Repository dicts with a validated "id" key.
+    """
+    if not repos:
+        return
+    tasks = [
+        (repo, key, column, default, query)
+        for repo in repos
+        for key, column, default, query in _repository_metric_queries(repo["id"])
+    ]
+    with ThreadPoolExecutor(
+        max_workers=min(_REPO_METRICS_WORKERS, len(tasks) + 1)
+    ) as executor:
+        entity_counts = executor.submit(
+            _run_repository_entity_counts, [repo["id"] for repo in repos]
+        )
+        futures = {
+            executor.submit(_run_repository_metric, column, default, query): (
+                repo,
+                key,
+            )
+            for repo, key, column, default, query in tasks
+        }
+        for future in as_completed(futures):
+            repo, key = futures[future]
+            value = future.result()
+            repo[key] = {"average": value} if key == "complexity" else value
+        counts = entity_counts.result()
+    for repo in repos:
+        repo["entities"] = counts.get(repo["id"], 0)
+
+
 @app.route("/api/repositories", methods=["GET"])
+@etag_conditional
 def list_repositories() -> Any:
     """
     List all repositories for an organization.
@@ -1013,164 +1712,81 @@ def list_repositories() -> Any:
     try:
         organization = request.args.get("organization")
 
-        # 1. Get all repositories with basic info
         org_filter = ""
         if organization and is_valid_uri(organization):
             org_filter = f"VALUES ?org {{ <{organization}> }} ?org wdo:hasRepository ?repo ."
-        
-        sparql_basic = f"""
+
+        # Fetch basic info and all per-repository metrics in one round trip;
+        # each metric is a grouped sub-select joined on ?repo. The organization
+        # filter is repeated inside every sub-select so none of them
+        # aggregates over repositories the outer join would discard
+        sparql_repos = f"""
         {PREFIXES}
-        SELECT ?repo ?name (MAX(?mod) AS ?lastUpdated)
+        SELECT ?repo ?name ?lastUpdated ?language ?avgComplexity ?contributors
+               ?files ?editorialNote ?entityCount
         WHERE {{
-          ?repo a wdo:Repository .
-          {org_filter}
-          OPTIONAL {{ ?repo rdfs:label ?name. }}
-          ?repo wdo:hasFile ?file .
-          ?file wdo:hasModificationTimestamp ?mod .
-        }}
-        GROUP BY ?repo ?name
-        """
-        data = run_dashboard_sparql(sparql_basic)
-        bindings = data["results"]["bindings"]
-        repos = []
-        for b in bindings:
-            repo_id = b["repo"]["value"]
-            name = b.get("name", {}).get("value", "")
-            last_updated = b.get("lastUpdated", {}).get("value", "")
-            repos.append(
-                {
-                    "id": repo_id,
-                    "name": name,
-                    "lastUpdated": last_updated,
-                }
-            )
-
-        # 2-5. For each repo, get language, avg complexity, contributors, and entity count
-        for repo in repos:
-            repo_uri = repo["id"]
-            if not is_valid_uri(repo_uri):
-                logger.warning(f"Skipping invalid repository URI: {repo_uri}")
-                continue
-
-            # 2. Sample language
-            sparql_lang = f"""
-            PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
-            SELECT (SAMPLE(?lang) AS ?language)
+          {{
+            SELECT ?repo ?name (MAX(?mod) AS ?lastUpdated)
+            WHERE {{
+              ?repo a wdo:Repository .
+              {org_filter}
+              OPTIONAL {{ ?repo rdfs:label ?name. }}
+              ?repo wdo:hasFile ?file .
+              ?file wdo:hasModificationTimestamp ?mod .
+            }}
+            GROUP BY ?repo ?name
+          }}
+          OPTIONAL {{
+            SELECT ?repo (SAMPLE(?lang) AS ?language)
             WHERE {{
-              <{repo_uri}> wdo:hasFile ?file .
+              {org_filter}
+              ?repo wdo:hasFile ?file .
               ?file wdo:bearerOfInformation|wdo:informationBorneBy ?codeContent .
               ?codeContent wdo:hasProgrammingLanguage ?lang .
             }}
-            """
-            try:
-                lang_data = run_dashboard_sparql(sparql_lang)
-                lang_bind = lang_data["results"]["bindings"]
-                language = (
-                    lang_bind[0]["language"]["value"]
-                    if lang_bind and "language" in lang_bind[0]
-                    else "Unknown"
-                )
-            except Exception:
-                language = "Unknown"
-            repo["language"] = language
-
-            # 3. Average complexity
-            sparql_complex = f"""
-            PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
-            SELECT (AVG(?complexity) AS ?avgComplexity)
+            GROUP BY ?repo
+          }}
+          OPTIONAL {{
+            SELECT ?repo (AVG(?complexity) AS ?avgComplexity)
             WHERE {{
-                <{repo_uri}> a wdo:Repository .
-                <{repo_uri}> wdo:hasFile/wdo:bearerOfInformation/wdo:hasCodePart* ?function .
-                ?function a wdo:FunctionDefinition ;
-                          wdo:hasCyclomaticComplexity ?complexity .
+              ?repo a wdo:Repository .
+              {org_filter}
+              ?repo wdo:hasFile/wdo:bearerOfInformation/wdo:hasCodePart* ?function .
+              ?function a wdo:FunctionDefinition ;
+                        wdo:hasCyclomaticComplexity ?complexity .
             }}
-            """
-            try:
-                complex_data = run_dashboard_sparql(sparql_complex)
-                complex_bind = complex_data["results"]["bindings"]
-                avg_complexity = (
-                    float(complex_bind[0]["avgComplexity"]["value"])
-                    if complex_bind and "avgComplexity" in complex_bind[0]
-                    else 0.0
-                )
-            except Exception:
-                avg_complexity = 0.0
-            repo["complexity"] = {"average": avg_complexity}
-
-            # 4. Contributor count
-            sparql_contrib = f"""
-            PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
-            SELECT (COUNT(DISTINCT ?contributor) AS ?contributors)
+            GROUP BY ?repo
+          }}
+          OPTIONAL {{
+            SELECT ?repo (COUNT(DISTINCT ?contributor) AS ?contributors)
             WHERE {{
-              <{repo_uri}> wdo:hasContributor ?contributor .
+              {org_filter}
+              ?repo wdo:hasContributor ?contributor .
             }}
-            """
-            try:
-                contrib_data = run_dashboard_sparql(sparql_contrib)
-                contrib_bind = contrib_data["results"]["bindings"]
-                contributors = (
-                    int(contrib_bind[0]["contributors"]["value"])
-                    if contrib_bind and "contributors" in contrib_bind[0]
-                    else 0
-                )
-            except Exception:
-                contributors = 0
-            repo["contributors"] = contributors
-
-            # 5. File count (DigitalInformationCarrier)
-            sparql_files = f"""
-            PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
-            PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-            SELECT (COUNT(DISTINCT ?file) AS ?files)
+            GROUP BY ?repo
+          }}
+          OPTIONAL {{
+            SELECT ?repo (COUNT(DISTINCT ?file) AS ?files)
             WHERE {{
-                <{repo_uri}> wdo:hasFile ?file .
-                ?file a/rdfs:subClassOf* wdo:DigitalInformationCarrier .
+              {org_filter}
+              ?repo wdo:hasFile ?file .
+              ?file a/rdfs:subClassOf* wdo:DigitalInformationCarrier .
             }}
-            """
-            try:
-                files_data = run_dashboard_sparql(sparql_files)
-                files_bind = files_data["results"]["bindings"]
-                files = (
-                    int(files_bind[0]["files"]["value"])
-                    if files_bind and "files" in files_bind[0]
-                    else 0
-                )
-            except Exception:
-                files = 0
-            repo["files"] = files
-
-            # 6. Editorial note (skos:editorialNote)
-            sparql_editorial = f"""
-            PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
-            SELECT ?editorialNote WHERE {{
-                <{repo_uri}> skos:editorialNote ?editorialNote .
-            }} LIMIT 1
-            """
-            try:
-                editorial_data = run_dashboard_sparql(sparql_editorial)
-                editorial_bind = editorial_data["results"]["bindings"]
-                editorial_note = (
-                    editorial_bind[0]["editorialNote"]["value"]
-                    if editorial_bind and "editorialNote" in editorial_bind[0]
-                    else ""
-                )
-            except Exception:
-                editorial_note = ""
-            repo["editorialNote"] = editorial_note
-
-            # 7. Entity count using BIND instead of VALUES
-            sparql_entities = f"""
-            PREFIX wdo: <http://web-development-ontology.netlify.app/wdo#>
-            PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-            SELECT (COUNT(DISTINCT ?entity) AS ?entityCount)
+            GROUP BY ?repo
+          }}
+          OPTIONAL {{
+            SELECT ?repo (SAMPLE(?note) AS ?editorialNote)
             WHERE {{
-              # -- Define the Repository you are querying --
-              # Replace the URI with the specific repository you want to analyze.
-              BIND(<{repo_uri}> AS ?repo)
-
-              # The UNION block finds all entities through the different valid paths.
-              # This logic is identical to your original query.
+              {org_filter}
+              ?repo skos:editorialNote ?note .
+            }}
+            GROUP BY ?repo
+          }}
+          OPTIONAL {{
+            SELECT ?repo (COUNT(DISTINCT ?entity) AS ?entityCount)
+            WHERE {{
+              ?repo a wdo:Repository .
+              {org_filter}
               {{
                 # -- Path 1: From File Contents (Direct and Nested) --
                 ?repo wdo:hasFile/wdo:bearerOfInformation ?fileContent .
@@ -1188,32 +1804,84 @@ def list_repositories() -> Any:
                   ?commit (wdo:addressesIssue|wdo:fixesIssue) ?entity .
                 }}
               }}
-
-              # -- We still need the filters to ensure we are counting the right things --
               ?entity a ?entityTypeRaw .
-
               # Ensure the entity is a WDO class and not a generic BFO class.
               FILTER CONTAINS(STR(?entityTypeRaw), "web-development-ontology.netlify.app")
               # Ensure the entity itself is a named individual, not a blank node.
               FILTER(isIRI(?entity))
             }}
-            """  # nosec B608
-            try:
-                entities_data = run_dashboard_sparql(sparql_entities)
-                entities_bind = entities_data["results"]["bindings"]
-                entity_count = (
-                    int(entities_bind[0]["entityCount"]["value"])
-                    if entities_bind and "entityCount" in entities_bind[0]
-                    else 0
+            GROUP BY ?repo
+          }}
+        }}
+        """  # nosec B608
+        try:
+            data = run_dashboard_sparql(sparql_repos)
+        except requests.RequestException as e:
+            logger.warning(
+                f"Aggregated repository query failed, querying per repository: {e}"
+            )
+        else:
+            repos = []
+            for b in data["results"]["bindings"]:
+                repos.append(
+                    {
+                        "id": b["repo"]["value"],
+                        "name": b.get("name", {}).get("value", ""),
+                        "lastUpdated": b.get("lastUpdated", {}).get("value", ""),
+                        "language": b.get("language", {}).get("value", "Unknown"),
+                        "complexity": {
+                            "average": float(
+                                b.get("avgComplexity", {}).get("value", 0.0)
+                            )
+                        },
+                        "contributors": int(b.get("contributors", {}).get("value", 0)),
+                        "files": int(b.get("files", {}).get("value", 0)),
+                        "editorialNote": b.get("editorialNote", {}).get("value", ""),
+                        "entities": int(b.get("entityCount", {}).get("value", 0)),
+                    }
                 )
-            except Exception:
-                entity_count = 0
-            repo["entities"] = entity_count
+            return jsonify_fast(repos)
+
+        # Fallback: basic info first, then one query per metric per repository
+        sparql_basic = f"""
+        {PREFIXES}
+        SELECT ?repo ?name (MAX(?mod) AS ?lastUpdated)
+        WHERE {{
+          ?repo a wdo:Repository .
+          {org_filter}
+          OPTIONAL {{ ?repo rdfs:label ?name. }}
+          ?repo wdo:hasFile ?file .
+          ?file wdo:hasModificationTimestamp ?mod .
+        }}
+        GROUP BY ?repo ?name
+        """
+        data = run_dashboard_sparql(sparql_basic)
+        bindings = data["results"]["bindings"]
+        repos = []
+        for b in bindings:
+            repo_id = b["repo"]["value"]
+            name = b.get("name", {}).get("value", "")
+            last_updated = b.get("lastUpdated", {}).get("value", "")
+            repos.append(
+                {
+                    "id": repo_id,
+                    "name": name,
+                    "lastUpdated": last_updated,
+                }
+            )
+
+        valid_repos = []
+        for repo in repos:
+            if not is_valid_uri(repo["id"]):
+                logger.warning(f"Skipping invalid repository URI: {repo['id']}")
+                continue
+            valid_repos.append(repo)
+        _fetch_repository_metrics(valid_repos)
 
-        return jsonify(repos)
+        return jsonify_fast(repos)
     except Exception as e:
         logger.error(f"Error in list_repositories: {str(e)}")
-        return jsonify([])
+        return fallback_json([])
 
 
 @app.route("/api/search", methods=["GET"])
@@ -1274,11 +1942,13 @@ def search_entities() -> Any:
                 return jsonify({"error": "Invalid repository URI"}), 400
             sparql_query += f"    FILTER(?repo = <{repository}>) .\n"
 
-        # Add search filter with escaped pattern and BOUND() guards
+        # Add search filter with BOUND() guards; the escaped pattern is bound
+        # once as ?q so the query text around it stays the same for every search
         sparql_query += f"""
+            VALUES ?q {{ "{pat}" }}
             FILTER(
-                (BOUND(?name) && REGEX(?name, "{pat}", "i")) ||
-                (BOUND(?editorialNote) && REGEX(?editorialNote, "{pat}", "i"))
+                (BOUND(?name) && REGEX(?name, ?q, "i")) ||
+                (BOUND(?editorialNote) && REGEX(?editorialNote, ?q, "i"))
             ) .
         }}
         LIMIT {limit}
@@ -1296,9 +1966,7 @@ def search_entities() -> Any:
             entity_id = binding["entity"]["value"]
             name = binding.get("name", {}).get("value", "Unknown")
             entity_type = binding.get("entityType", {}).get("value", "Unknown")
-            entity_type_short = (
-                entity_type.split("#")[-1] if entity_type != "Unknown" else "Unknown"
-            )
+            _, _, entity_type_short = entity_type.rpartition("#")
             editorial_note = binding.get("editorialNote", {}).get("value", "")
             file = binding.get("file", {}).get("value", "")
             line = int(binding.get("line", {}).get("value", "0"))
@@ -1306,7 +1974,7 @@ def search_entities() -> Any:
             confidence = float(binding.get("confidence", {}).get("value", "0.5"))
 
             # Extract file name from full path
-            file_name = file.split("/")[-1] if file else ""
+            file_name = file.rpartition("/")[2] if file else ""
 
             # Use editorial note as the description
             display_description = editorial_note
@@ -1316,7 +1984,7 @@ def search_entities() -> Any:
                     "id": entity_id,
                     "name": name,
                     "type": entity_type_short.lower(),
-                    "repository": repo.split("/")[-1] if repo else "Unknown",
+                    "repository": repo.rpartition("/")[2] if repo else "Unknown",
                     "description": display_description,
                     "editorialNote": editorial_note,
                     "enrichedDescription": editorial_note,  # Use editorial note for both
@@ -1338,7 +2006,7 @@ def search_entities() -> Any:
             "confidence": 0.8,
         }
 
-        return jsonify(
+        return jsonify_fast(
             {
                 "entities": entities,
                 "totalCount": len(entities),
@@ -1377,25 +2045,12 @@ def sparql_query():
         if not query:
             return jsonify({"error": "Missing query"}), 400
 
-        # Handle both cloud and server URL formats
-        if AGRAPH_URL and "/repositories/" in AGRAPH_URL:
-            # Cloud URL already includes repository path
-            agraph_endpoint = AGRAPH_URL
-        else:
-            # Server URL needs repository appended
-            agraph_endpoint = f"{AGRAPH_URL}/repositories/{AGRAPH_REPO}"
-
         # Use pooled session for better performance
-        session = get_agraph_session()
-        resp = session.post(
-            agraph_endpoint, 
-            data={"query": query}, 
-            headers={"Accept": "application/sparql-results+json"}, 
-            timeout=(5, 75)
-        )
+        resp = post_sparql_form({"query": query}, "application/sparql-results+json")
         
         if resp.status_code == 200:
-            return jsonify(resp.json())
+            # Relay the store's JSON as is rather than decoding and re-encoding it
+            return Response(resp.content, mimetype="application/json")
         else:
             return jsonify({"error": resp.text}), resp.status_code
             
@@ -1439,6 +2094,34 @@ def get_input_directory() -> Any:
         return jsonify({"error": f"Failed to get input directory: {str(e)}"}), 500
 
 
+# Graph node styling by lower-cased WDO class name: (node type, size, color)
+_NODE_STYLE = {
+    "repository": ("repository", 20, "#10b981"),
+    "file": ("file", 12, "#f59e0b"),
+    "sourcefile": ("file", 12, "#f59e0b"),
+    "function": ("function", 8, "#8b5cf6"),
+    "functiondefinition": ("function", 8, "#8b5cf6"),
+    "class": ("class", 10, "#ef4444"),
+    "classdefinition": ("class", 10, "#ef4444"),
+}
+_DEFAULT_NODE_STYLE = ("concept", 10, "#3b82f6")
+
+# Graph edge styling by WDO property name: (edge type, weight)
+_EDGE_STYLE = {
+    "invokes": ("calls", 0.8),
+    "callsFunction": ("calls", 0.8),
+    "extendsType": ("extends", 0.9),
+    "implementsInterface": ("implements", 0.9),
+    "hasFile": ("contains", 1.0),
+    "belongsToRepository": ("contains", 1.0),
+}
+_DEFAULT_EDGE_STYLE = ("depends_on", 0.5)
+
+# Upper bound for the maxNodes parameter of /api/graph; the edge query grows
+# with the square of the node count
+GRAPH_MAX_NODES = 2000
+
+
 @app.route("/api/graph", methods=["GET"])
 def get_graph_data() -> Any:
     """
@@ -1447,7 +2130,8 @@ def get_graph_data() -> Any:
     Query parameters:
     - layout: Graph layout type (optional)
     - filter: Entity type filter (optional)
-    - maxNodes: Maximum number of nodes (optional, default 100)
+    - maxNodes: Maximum number of nodes (optional, default 100, at most
+      GRAPH_MAX_NODES)
 
     Returns:
         JSON response with nodes, edges, and clusters for graph visualization.
@@ -1455,7 +2139,10 @@ def get_graph_data() -> Any:
     try:
         layout = request.args.get("layout", "force-directed")
         filter_type = request.args.get("filter", "all")
+        # Clamp so the node query and the VALUES-bound edge query below can
+        # never pull an unbounded slice of the graph into memory
         max_nodes = int(request.args.get("maxNodes", 100))
+        max_nodes = min(max(max_nodes, 1), GRAPH_MAX_NODES)
 
         # Build SPARQL query to get graph data
         sparql_query = """
@@ -1478,54 +2165,41 @@ def get_graph_data() -> Any:
         bindings = data["results"]["bindings"]
 
         # Transform to nodes
-        nodes = []
+        nodes: List[Dict[str, Any]] = []
         node_ids = set()
+        # Hoist bound methods out of the per-binding loop
+        add_node = nodes.append
+        add_node_id = node_ids.add
+        node_style = _NODE_STYLE.get
 
         for binding in bindings:
             if "entityType" not in binding:
                 continue  # Skip nodes without a type
             entity_id = binding["entity"]["value"]
-            name = binding.get("name", {}).get("value", "Unknown")
-            entity_type = binding["entityType"]["value"].split("#")[-1]
-            repo = binding.get("repo", {}).get("value", "")
-            language = binding.get("language", {}).get("value", "")
-
-            if entity_id not in node_ids:
-                node_ids.add(entity_id)
-
-                # Determine node properties based on type
-                node_type = "concept"
-                size = 10
-                color = "#3b82f6"
-
-                if entity_type.lower() in ["repository"]:
-                    node_type = "repository"
-                    size = 20
-                    color = "#10b981"
-                elif entity_type.lower() in ["file", "sourcefile"]:
-                    node_type = "file"
-                    size = 12
-                    color = "#f59e0b"
-                elif entity_type.lower() in ["function", "functiondefinition"]:
-                    node_type = "function"
-                    size = 8
-                    color = "#8b5cf6"
-                elif entity_type.lower() in ["class", "classdefinition"]:
-                    node_type = "class"
-                    size = 10
-                    color = "#ef4444"
-
-                nodes.append(
-                    {
-                        "id": entity_id,
-                        "name": name,
-                        "type": node_type,
-                        "size": size,
-                        "color": color,
-                        "repository": repo.split("/")[-1] if repo else "",
-                        "language": language,
-                    }
-                )
+            if entity_id in node_ids:
+                continue
+            add_node_id(entity_id)
+            name = binding["name"]["value"] if "name" in binding else "Unknown"
+            _, _, entity_type = binding["entityType"]["value"].rpartition("#")
+            repo = binding["repo"]["value"] if "repo" in binding else ""
+            language = binding["language"]["value"] if "language" in binding else ""
+
+            # Determine node properties based on type
+            node_type, size, color = node_style(
+                entity_type.lower(), _DEFAULT_NODE_STYLE
+            )
+
+            add_node(
+                {
+                    "id": entity_id,
+                    "name": name,
+                    "type": node_type,
+                    "size": size,
+                    "color": color,
+                    "repository": repo.rpartition("/")[2] if repo else "",
+                    "language": language,
+                }
+            )
 
         # Handle empty node set - early return
         if not node_ids:
@@ -1535,8 +2209,12 @@ def get_graph_data() -> Any:
                 "clusters": []
             })
 
-        # Get relationships for edges - optimized with VALUES for known nodes
-        values = " ".join(f"<{nid}>" for nid in node_ids)
+        # Get relationships for edges - optimized with VALUES for known nodes.
+        # Only well-formed IRIs are interpolated; blank nodes cannot appear in
+        # VALUES and are left without edges
+        values = " ".join(f"<{nid}>" for nid in node_ids if is_valid_uri(nid))
+        if not values:
+            return jsonify_fast({"nodes": nodes, "edges": [], "clusters": []})
         edges_query = f"""
         {PREFIXES}
         SELECT DISTINCT ?source ?target ?relationship WHERE {{
@@ -1549,32 +2227,20 @@ def get_graph_data() -> Any:
         edges_data = run_dashboard_sparql(edges_query)
         edges_bindings = edges_data["results"]["bindings"]
 
-        edges = []
+        edges: List[Dict[str, Any]] = []
+        add_edge = edges.append
+        edge_style = _EDGE_STYLE.get
         for binding in edges_bindings:
             if "relationship" not in binding:
                 continue  # Skip edges without a relationship type
             source = binding["source"]["value"]
             target = binding["target"]["value"]
-            relationship = binding["relationship"]["value"].split("#")[-1]
+            relationship = binding["relationship"]["value"].rpartition("#")[2]
 
             # All edges are already between known nodes due to VALUES constraint
-            edge_type = "depends_on"
-            weight = 0.5
-
-            if relationship in ["invokes", "callsFunction"]:
-                edge_type = "calls"
-                weight = 0.8
-            elif relationship in ["extendsType"]:
-                edge_type = "extends"
-                weight = 0.9
-            elif relationship in ["implementsInterface"]:
-                edge_type = "implements"
-                weight = 0.9
-            elif relationship in ["hasFile", "belongsToRepository"]:
-                edge_type = "contains"
-                weight = 1.0
-
-            edges.append(
+            edge_type, weight = edge_style(relationship, _DEFAULT_EDGE_STYLE)
+
+            add_edge(
                 {
                     "source": source,
                     "target": target,
@@ -1600,7 +2266,7 @@ def get_graph_data() -> Any:
 
         clusters = list(repo_clusters.values())
 
-        return jsonify(
+        return jsonify_fast(
             {
                 "nodes": nodes,
                 "edges": edges,
@@ -1613,520 +2279,465 @@ def get_graph_data() -> Any:
         return jsonify({"error": f"Failed to load graph data: {str(e)}"}), 500
 
 
-@app.route("/api/analytics", methods=["GET"])
-def get_analytics() -> Any:
+# Class counts for /api/analytics as (section, key, root class) buckets; each
+# counts distinct instances of the root class or any of its subclasses
+_WDO_IRI = "http://web-development-ontology.netlify.app/wdo#"
+ANALYTICS_COUNT_BUCKETS = [
+    ("codebaseMetrics", "totalRepositories", f"{_WDO_IRI}Repository"),
+    ("codebaseMetrics", "totalFiles", f"{_WDO_IRI}DigitalInformationCarrier"),
+    ("codebaseMetrics", "sourceCodeFiles", f"{_WDO_IRI}SourceCodeFile"),
+    ("codebaseMetrics", "documentationFiles", f"{_WDO_IRI}DocumentationFile"),
+    ("codebaseMetrics", "assetFiles", f"{_WDO_IRI}AssetFile"),
+    ("entityDistribution", "functions", f"{_WDO_IRI}FunctionDefinition"),
+    ("entityDistribution", "classes", f"{_WDO_IRI}ClassDefinition"),
+    ("entityDistribution", "interfaces", f"{_WDO_IRI}InterfaceDefinition"),
+    ("entityDistribution", "attributes", f"{_WDO_IRI}AttributeDeclaration"),
+    ("entityDistribution", "variables", f"{_WDO_IRI}VariableDeclaration"),
+    ("entityDistribution", "parameters", f"{_WDO_IRI}Parameter"),
+    (
+        "documentationMetrics",
+        "totalDocumentationEntities",
+        f"{_WDO_IRI}Documentation",
+    ),
+    ("documentationMetrics", "readmeFiles", f"{_WDO_IRI}Readme"),
+    ("documentationMetrics", "codeComments", f"{_WDO_IRI}CodeComment"),
+    ("documentationMetrics", "apiDocumentation", f"{_WDO_IRI}APIDocumentation"),
+    ("developmentMetrics", "totalCommits", f"{_WDO_IRI}Commit"),
+    ("developmentMetrics", "totalIssues", f"{_WDO_IRI}Issue"),
+    ("developmentMetrics", "totalContributors", "http://xmlns.com/foaf/0.1/Person"),
+    ("assetMetrics", "imageFiles", f"{_WDO_IRI}ImageFile"),
+    ("assetMetrics", "audioFiles", f"{_WDO_IRI}AudioFile"),
+    ("assetMetrics", "videoFiles", f"{_WDO_IRI}VideoFile"),
+    ("assetMetrics", "fontFiles", f"{_WDO_IRI}FontFile"),
+]
+# Further roots whose subclasses the language and complexity queries match
+_PROGRAMMING_LANGUAGE_CODE = f"{_WDO_IRI}ProgrammingLanguageCode"
+_FUNCTION_DEFINITION = f"{_WDO_IRI}FunctionDefinition"
+_SOFTWARE_CODE = f"{_WDO_IRI}SoftwareCode"
+ANALYTICS_CLASS_ROOTS = sorted(
+    {root for _section, _key, root in ANALYTICS_COUNT_BUCKETS}
+    | {_PROGRAMMING_LANGUAGE_CODE, _FUNCTION_DEFINITION, _SOFTWARE_CODE}
+)
+_ANALYTICS_ROOT_VALUES = " ".join(f"<{root}>" for root in ANALYTICS_CLASS_ROOTS)
+SUBCLASS_CLOSURE_QUERY = f"""
+SELECT ?root ?class
+WHERE {{
+    VALUES ?root {{ {_ANALYTICS_ROOT_VALUES} }}
+    ?class rdfs:subClassOf* ?root .
+}}
+"""
+
+# Subclass closure of ANALYTICS_CLASS_ROOTS as (graph version, closure). The
+# ontology only changes when the graph does, so the closure is fetched once
+# per graph version and inlined as VALUES instead of evaluating
+# ``rdfs:subClassOf*`` on every analytics request.
+_subclass_closure: Optional[Tuple[int, Dict[str, List[str]]]] = None
+_SUBCLASS_CLOSURE_LOCK = threading.Lock()
+
+
+def get_subclass_closure() -> Dict[str, List[str]]:
     """
-    Get analytics data for the dashboard.
+    Get the subclasses of each analytics root class, including the root itself.
 
     Returns:
-        JSON response with analytics data including metrics, trends, and insights.
+        Mapping of root class IRI to the IRIs of the root and all its subclasses.
     """
-    try:
-        analytics_data: Dict[str, Any] = {
-            "codebaseMetrics": {},
-            "entityDistribution": {},
-            "languageDistribution": [],
-            "complexityMetrics": {},
-            "documentationMetrics": {},
-            "developmentMetrics": {},
-            "assetMetrics": {},
-            "trends": {},
-        }
+    global _subclass_closure
+    with _SUBCLASS_CLOSURE_LOCK:
+        version = _graph_version
+        if _subclass_closure is not None and _subclass_closure[0] == version:
+            return _subclass_closure[1]
+
+        closure: Dict[str, List[str]] = {root: [root] for root in ANALYTICS_CLASS_ROOTS}
+        data = run_dashboard_sparql(SUBCLASS_CLOSURE_QUERY)
+        for binding in data["results"]["bindings"]:
+            cls = binding["class"]["value"]
+            classes = closure.get(binding["root"]["value"])
+            if classes is not None and cls not in classes and is_valid_uri(cls):
+                classes.append(cls)
+        _subclass_closure = (version, closure)
+        return closure
+
+
+def _class_values(closure: Dict[str, List[str]], root: str) -> str:
+    """
+    Format the closure of a root class as the body of a SPARQL VALUES block.
 
-        # 1. Codebase Metrics - Core Software Development Entities
-        try:
-            # Total repositories
-            repos_query = """
-            SELECT (COUNT(DISTINCT ?repo) AS ?count)
-            WHERE {
-                ?repo a <http://web-development-ontology.netlify.app/wdo#Repository> .
-            }
-            """
-            repos_data = run_dashboard_sparql(repos_query)
-            total_repos = (
-                int(repos_data["results"]["bindings"][0]["count"]["value"])
-                if repos_data["results"]["bindings"]
-                else 0
-            )
+    Args:
+        closure: Subclass closure as returned by get_subclass_closure.
+        root: Root class IRI.
 
-            # Total files (DigitalInformationCarrier)
-            files_query = """
-            SELECT (COUNT(DISTINCT ?file) AS ?count)
-            WHERE {
-                ?file a ?fileType .
-                ?fileType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#DigitalInformationCarrier> .
-            }
-            """
-            files_data = run_dashboard_sparql(files_query)
-            total_files = (
-                int(files_data["results"]["bindings"][0]["count"]["value"])
-                if files_data["results"]["bindings"]
-                else 0
-            )
+    Returns:
+        Space-separated IRI references for the root and its subclasses.
+    """
+    return " ".join(f"<{cls}>" for cls in closure.get(root, [root]))
 
-            # Source code files
-            source_files_query = """
-            SELECT (COUNT(DISTINCT ?file) AS ?count)
-            WHERE {
-                ?file a ?fileType .
-                ?fileType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#SourceCodeFile> .
-            }
-            """
-            source_files_data = run_dashboard_sparql(source_files_query)
-            total_source_files = (
-                int(source_files_data["results"]["bindings"][0]["count"]["value"])
-                if source_files_data["results"]["bindings"]
-                else 0
-            )
 
-            # Documentation files
-            doc_files_query = """
-            SELECT (COUNT(DISTINCT ?file) AS ?count)
-            WHERE {
-                ?file a ?fileType .
-                ?fileType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#DocumentationFile> .
-            }
-            """
-            doc_files_data = run_dashboard_sparql(doc_files_query)
-            total_doc_files = (
-                int(doc_files_data["results"]["bindings"][0]["count"]["value"])
-                if doc_files_data["results"]["bindings"]
-                else 0
-            )
+def build_analytics_counts_query(closure: Dict[str, List[str]]) -> str:
+    """
+    Build the bucketed class count query for the analytics sections.
 
-            # Asset files
-            asset_files_query = """
-            SELECT (COUNT(DISTINCT ?file) AS ?count)
-            WHERE {
-                ?file a ?fileType .
-                ?fileType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#AssetFile> .
-            }
-            """
-            asset_files_data = run_dashboard_sparql(asset_files_query)
-            total_asset_files = (
-                int(asset_files_data["results"]["bindings"][0]["count"]["value"])
-                if asset_files_data["results"]["bindings"]
-                else 0
-            )
+    Args:
+        closure: Subclass closure as returned by get_subclass_closure.
 
-            analytics_data["codebaseMetrics"] = {
-                "totalRepositories": total_repos,
-                "totalFiles": total_files,
-                "sourceCodeFiles": total_source_files,
-                "documentationFiles": total_doc_files,
-                "assetFiles": total_asset_files,
-            }
+    Returns:
+        SPARQL query counting distinct instances per ``section.key`` bucket.
+    """
+    rows = "\n".join(
+        f'        ("{section}.{key}" <{cls}>)'
+        for section, key, root in ANALYTICS_COUNT_BUCKETS
+        for cls in closure.get(root, [root])
+    )
+    return f"""
+SELECT ?bucket (COUNT(DISTINCT ?entity) AS ?count)
+WHERE {{
+    VALUES (?bucket ?type) {{
+{rows}
+    }}
+    ?entity a ?type .
+}}
+GROUP BY ?bucket
+"""
 
-        except Exception as e:
-            logger.warning(f"Codebase metrics query failed: {e}")
 
-        # 2. Entity Distribution - WDO Class Analysis
-        try:
-            # Function definitions
-            functions_query = """
-            SELECT (COUNT(DISTINCT ?func) AS ?count)
-            WHERE {
-                ?func a ?funcType .
-                ?funcType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> .
-            }
-            """
-            functions_data = run_dashboard_sparql(functions_query)
-            total_functions = (
-                int(functions_data["results"]["bindings"][0]["count"]["value"])
-                if functions_data["results"]["bindings"]
-                else 0
-            )
+# Analytics queries over the subclass closure; $code_types and $func_types
+# take the VALUES bodies produced by _class_values
+_T_LANGUAGE_DISTRIBUTION = Template(
+    """
+    SELECT ?language (COUNT(DISTINCT ?code) AS ?count)
+    WHERE {
+        VALUES ?codeType { $code_types }
+        ?code a ?codeType .
+        ?code <http://web-development-ontology.netlify.app/wdo#hasProgrammingLanguage> ?language .
+    }
+    GROUP BY ?language
+    ORDER BY DESC(?count)
+    """
+)
+_T_AVG_COMPLEXITY = Template(
+    """
+    SELECT (AVG(?complexity) AS ?avg)
+    WHERE {
+        VALUES ?funcType { $func_types }
+        ?func a ?funcType .
+        ?func <http://web-development-ontology.netlify.app/wdo#hasCyclomaticComplexity> ?complexity .
+    }
+    """
+)
+_T_HIGH_COMPLEXITY = Template(
+    """
+    SELECT (COUNT(DISTINCT ?func) AS ?count)
+    WHERE {
+        VALUES ?funcType { $func_types }
+        ?func a ?funcType .
+        ?func <http://web-development-ontology.netlify.app/wdo#hasCyclomaticComplexity> ?complexity .
+        FILTER(?complexity > 10)
+    }
+    """
+)
+_T_TOTAL_LINES = Template(
+    """
+    SELECT (SUM(?lines) AS ?total)
+    WHERE {
+        VALUES ?codeType { $code_types }
+        ?code a ?codeType .
+        ?code <http://web-development-ontology.netlify.app/wdo#hasLineCount> ?lines .
+    }
+    """
+)
 
-            # Class definitions
-            classes_query = """
-            SELECT (COUNT(DISTINCT ?class) AS ?count)
-            WHERE {
-                ?class a ?classType .
-                ?classType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#ClassDefinition> .
-            }
-            """
-            classes_data = run_dashboard_sparql(classes_query)
-            total_classes = (
-                int(classes_data["results"]["bindings"][0]["count"]["value"])
-                if classes_data["results"]["bindings"]
-                else 0
-            )
+# Rendered analytics queries together with the closure they were rendered
+# from, so they are only rebuilt when the closure is refetched
+_analytics_queries: Optional[Tuple[Dict[str, List[str]], Dict[str, str]]] = None
 
-            # Interface definitions
-            interfaces_query = """
-            SELECT (COUNT(DISTINCT ?interface) AS ?count)
-            WHERE {
-                ?interface a ?interfaceType .
-                ?interfaceType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#InterfaceDefinition> .
-            }
-            """
-            interfaces_data = run_dashboard_sparql(interfaces_query)
-            total_interfaces = (
-                int(interfaces_data["results"]["bindings"][0]["count"]["value"])
-                if interfaces_data["results"]["bindings"]
-                else 0
-            )
 
-            # Attribute declarations
-            attributes_query = """
-            SELECT (COUNT(DISTINCT ?attr) AS ?count)
-            WHERE {
-                ?attr a ?attrType .
-                ?attrType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#AttributeDeclaration> .
-            }
-            """
-            attributes_data = run_dashboard_sparql(attributes_query)
-            total_attributes = (
-                int(attributes_data["results"]["bindings"][0]["count"]["value"])
-                if attributes_data["results"]["bindings"]
-                else 0
-            )
+def get_analytics_queries() -> Dict[str, str]:
+    """
+    Get the analytics SPARQL queries rendered for the current subclass closure.
 
-            # Variable declarations
-            variables_query = """
-            SELECT (COUNT(DISTINCT ?var) AS ?count)
-            WHERE {
-                ?var a ?varType .
-                ?varType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#VariableDeclaration> .
-            }
-            """
-            variables_data = run_dashboard_sparql(variables_query)
-            total_variables = (
-                int(variables_data["results"]["bindings"][0]["count"]["value"])
-                if variables_data["results"]["bindings"]
-                else 0
-            )
+    Returns:
+        Mapping of query name (``counts``, ``language``, ``avgComplexity``,
+        ``highComplexity``, ``totalLines``) to query text.
+    """
+    global _analytics_queries
+    closure = get_subclass_closure()
+    cached = _analytics_queries
+    if cached is not None and cached[0] is closure:
+        return cached[1]
+
+    func_types = _class_values(closure, _FUNCTION_DEFINITION)
+    queries = {
+        "counts": build_analytics_counts_query(closure),
+        "language": _T_LANGUAGE_DISTRIBUTION.substitute(
+            code_types=_class_values(closure, _PROGRAMMING_LANGUAGE_CODE)
+        ),
+        "avgComplexity": _T_AVG_COMPLEXITY.substitute(func_types=func_types),
+        "highComplexity": _T_HIGH_COMPLEXITY.substitute(func_types=func_types),
+        "totalLines": _T_TOTAL_LINES.substitute(
+            code_types=_class_values(closure, _SOFTWARE_CODE)
+        ),
+    }
+    _analytics_queries = (closure, queries)
+    return queries
+
+
+def _fetch_analytics_counts() -> Dict[str, Dict[str, int]]:
+    """
+    Fetch the class counts for the analytics sections in a single round-trip.
 
-            # Parameters
-            parameters_query = """
-            SELECT (COUNT(DISTINCT ?param) AS ?count)
-            WHERE {
-                ?param a ?paramType .
-                ?paramType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#Parameter> .
-            }
-            """
-            parameters_data = run_dashboard_sparql(parameters_query)
-            total_parameters = (
-                int(parameters_data["results"]["bindings"][0]["count"]["value"])
-                if parameters_data["results"]["bindings"]
-                else 0
-            )
+    Covers the codebase, entity, documentation, development and asset sections.
 
-            analytics_data["entityDistribution"] = {
-                "functions": total_functions,
-                "classes": total_classes,
-                "interfaces": total_interfaces,
-                "attributes": total_attributes,
-                "variables": total_variables,
-                "parameters": total_parameters,
-            }
+    Returns:
+        Mapping of analytics section to its counts; empty if the query fails.
+    """
+    try:
+        counts_data = run_dashboard_sparql(get_analytics_queries()["counts"])
+        counts = {
+            b["bucket"]["value"]: int(b["count"]["value"])
+            for b in counts_data["results"]["bindings"]
+        }
+        sections: Dict[str, Dict[str, int]] = {}
+        for section, key, _root in ANALYTICS_COUNT_BUCKETS:
+            sections.setdefault(section, {})[key] = counts.get(f"{section}.{key}", 0)
+        return sections
+    except Exception as e:
+        logger.warning(f"Analytics count query failed: {e}")
+        return {}
 
-        except Exception as e:
-            logger.warning(f"Entity distribution query failed: {e}")
 
-        # 3. Language Distribution - Programming Languages
-        try:
-            language_query = """
-            SELECT ?language (COUNT(DISTINCT ?code) AS ?count)
-            WHERE {
-                ?code a ?codeType .
-                ?codeType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#ProgrammingLanguageCode> .
-                ?code <http://web-development-ontology.netlify.app/wdo#hasProgrammingLanguage> ?language .
+def _fetch_language_distribution() -> Dict[str, Any]:
+    """
+    Fetch the programming language distribution for analytics.
+
+    Returns:
+        ``{"languageDistribution": [...]}``, or empty if the query fails.
+    """
+    try:
+        language_data = run_dashboard_sparql(get_analytics_queries()["language"])
+        language_counts = [
+            (binding["language"]["value"], int(binding["count"]["value"]))
+            for binding in language_data["results"]["bindings"]
+        ]
+        total_language_entities = sum(count for _, count in language_counts)
+
+        # Percentages in the same pass that builds the rows, scaling by a
+        # single precomputed factor
+        scale = 100 / total_language_entities if total_language_entities else 0
+        language_distribution = [
+            {
+                "language": language,
+                "entities": count,
+                "percentage": round(count * scale, 1),
             }
-            GROUP BY ?language
-            ORDER BY DESC(?count)
-            """
-            language_data = run_dashboard_sparql(language_query)
-            language_distribution = []
-            total_language_entities = 0
+            for language, count in language_counts
+        ]
 
-            for binding in language_data["results"]["bindings"]:
-                language = binding["language"]["value"]
-                count = int(binding["count"]["value"])
-                total_language_entities += count
-                language_distribution.append(
-                    {
-                        "language": language,
-                        "entities": count,
-                        "percentage": 0,  # Will calculate below
-                    }
-                )
+        return {"languageDistribution": language_distribution}
 
-            # Calculate percentages
-            if total_language_entities > 0:
-                for lang in language_distribution:
-                    lang["percentage"] = round(
-                        (lang["entities"] / total_language_entities) * 100, 1
-                    )
+    except Exception as e:
+        logger.warning(f"Language distribution query failed: {e}")
+        return {}
 
-            analytics_data["languageDistribution"] = language_distribution
 
-        except Exception as e:
-            logger.warning(f"Language distribution query failed: {e}")
+def _fetch_complexity_metrics() -> Dict[str, Any]:
+    """
+    Fetch the complexity metrics for analytics.
 
-        # 4. Complexity Metrics
-        try:
-            # Average cyclomatic complexity
-            avg_complexity_query = """
-            SELECT (AVG(?complexity) AS ?avg)
-            WHERE {
-                ?func a ?funcType .
-                ?funcType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> .
-                ?func <http://web-development-ontology.netlify.app/wdo#hasCyclomaticComplexity> ?complexity .
-            }
-            """
-            avg_complexity_data = run_dashboard_sparql(avg_complexity_query)
-            avg_complexity = 0.0
-            if avg_complexity_data["results"]["bindings"]:
-                avg_val = avg_complexity_data["results"]["bindings"][0]["avg"]["value"]
-                if avg_val != "NaN":
-                    avg_complexity = round(float(avg_val), 2)
-
-            # High complexity functions (>10)
-            high_complexity_query = """
-            SELECT (COUNT(DISTINCT ?func) AS ?count)
-            WHERE {
-                ?func a ?funcType .
-                ?funcType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> .
-                ?func <http://web-development-ontology.netlify.app/wdo#hasCyclomaticComplexity> ?complexity .
-                FILTER(?complexity > 10)
-            }
-            """
-            high_complexity_data = run_dashboard_sparql(high_complexity_query)
-            high_complexity_count = (
-                int(high_complexity_data["results"]["bindings"][0]["count"]["value"])
-                if high_complexity_data["results"]["bindings"]
-                else 0
-            )
+    Returns:
+        ``{"complexityMetrics": {...}}``, or empty if a query fails.
+    """
+    try:
+        queries = get_analytics_queries()
 
-            # Total line count
-            line_count_query = """
-            SELECT (SUM(?lines) AS ?total)
-            WHERE {
-                ?code a ?codeType .
-                ?codeType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#SoftwareCode> .
-                ?code <http://web-development-ontology.netlify.app/wdo#hasLineCount> ?lines .
-            }
-            """
-            line_count_data = run_dashboard_sparql(line_count_query)
-            total_lines = (
-                int(line_count_data["results"]["bindings"][0]["total"]["value"])
-                if line_count_data["results"]["bindings"]
-                else 0
-            )
+        # Average cyclomatic complexity
+        avg_val = run_dashboard_sparql_scalar(queries["avgComplexity"])
+        avg_complexity = 0.0
+        if avg_val is not None and avg_val != "NaN":
+            avg_complexity = round(float(avg_val), 2)
+
+        # High complexity functions (>10)
+        high_complexity_count = int(
+            run_dashboard_sparql_scalar(queries["highComplexity"]) or 0
+        )
+
+        # Total line count
+        total_lines = int(run_dashboard_sparql_scalar(queries["totalLines"]) or 0)
 
-            analytics_data["complexityMetrics"] = {
+        return {
+            "complexityMetrics": {
                 "averageCyclomaticComplexity": avg_complexity,
                 "highComplexityFunctions": high_complexity_count,
                 "totalLinesOfCode": total_lines,
             }
+        }
 
-        except Exception as e:
-            logger.warning(f"Complexity metrics query failed: {e}")
+    except Exception as e:
+        logger.warning(f"Complexity metrics query failed: {e}")
+        return {}
 
-        # 5. Documentation Metrics
-        try:
-            # Total documentation entities
-            doc_entities_query = """
-            SELECT (COUNT(DISTINCT ?doc) AS ?count)
-            WHERE {
-                ?doc a ?docType .
-                ?docType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#Documentation> .
-            }
-            """
-            doc_entities_data = run_dashboard_sparql(doc_entities_query)
-            total_doc_entities = (
-                int(doc_entities_data["results"]["bindings"][0]["count"]["value"])
-                if doc_entities_data["results"]["bindings"]
-                else 0
-            )
 
-            # README files
-            readme_query = """
-            SELECT (COUNT(DISTINCT ?readme) AS ?count)
-            WHERE {
-                ?readme a ?readmeType .
-                ?readmeType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#Readme> .
-            }
-            """
-            readme_data = run_dashboard_sparql(readme_query)
-            total_readmes = (
-                int(readme_data["results"]["bindings"][0]["count"]["value"])
-                if readme_data["results"]["bindings"]
-                else 0
-            )
+# Independent analytics sections, fetched concurrently by get_analytics
+_ANALYTICS_SECTION_FETCHERS = (
+    _fetch_analytics_counts,
+    _fetch_language_distribution,
+    _fetch_complexity_metrics,
+)
+# Sections those fetchers fill in, all of which a materialized copy must have
+ANALYTICS_SECTIONS = (
+    "codebaseMetrics",
+    "entityDistribution",
+    "languageDistribution",
+    "complexityMetrics",
+    "documentationMetrics",
+    "developmentMetrics",
+    "assetMetrics",
+)
 
-            # Code comments
-            comments_query = """
-            SELECT (COUNT(DISTINCT ?comment) AS ?count)
-            WHERE {
-                ?comment a ?commentType .
-                ?commentType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#CodeComment> .
-            }
-            """
-            comments_data = run_dashboard_sparql(comments_query)
-            total_comments = (
-                int(comments_data["results"]["bindings"][0]["count"]["value"])
-                if comments_data["results"]["bindings"]
-                else 0
-            )
+# DASHBOARD_AGGREGATES_GRAPH holds the analytics sections computed after the
+# last ingestion, one JSON literal per section on a single subject
+_DASHBOARD_AGGREGATES_SUBJECT = "urn:dashboard:analytics"
+_DASHBOARD_SECTION_IRI = "urn:dashboard:section:"
+MATERIALIZED_ANALYTICS_QUERY = f"""
+SELECT ?section ?value
+WHERE {{
+    GRAPH <{DASHBOARD_AGGREGATES_GRAPH}> {{
+        <{_DASHBOARD_AGGREGATES_SUBJECT}> ?section ?value .
+    }}
+}}
+"""
 
-            # API documentation
-            api_doc_query = """
-            SELECT (COUNT(DISTINCT ?api_doc) AS ?count)
-            WHERE {
-                ?api_doc a ?apiDocType .
-                ?apiDocType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#APIDocumentation> .
-            }
-            """
-            api_doc_data = run_dashboard_sparql(api_doc_query)
-            total_api_docs = (
-                int(api_doc_data["results"]["bindings"][0]["count"]["value"])
-                if api_doc_data["results"]["bindings"]
-                else 0
-            )
 
-            analytics_data["documentationMetrics"] = {
-                "totalDocumentationEntities": total_doc_entities,
-                "readmeFiles": total_readmes,
-                "codeComments": total_comments,
-                "apiDocumentation": total_api_docs,
-            }
+def _run_analytics_fetchers(fetchers: List[Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    Run analytics section fetchers concurrently and merge their sections.
 
-        except Exception as e:
-            logger.warning(f"Documentation metrics query failed: {e}")
+    Args:
+        fetchers: Zero-argument callables, each returning the sections it filled.
 
-        # 6. Development Metrics
-        try:
-            # Total commits
-            commits_query = """
-            SELECT (COUNT(DISTINCT ?commit) AS ?count)
-            WHERE {
-                ?commit a ?commitType .
-                ?commitType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#Commit> .
-            }
-            """
-            commits_data = run_dashboard_sparql(commits_query)
-            total_commits = (
-                int(commits_data["results"]["bindings"][0]["count"]["value"])
-                if commits_data["results"]["bindings"]
-                else 0
-            )
+    Returns:
+        The merged sections, in fetcher order.
+    """
+    sections: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = [executor.submit(fetch) for fetch in fetchers]
+        for future in futures:
+            sections.update(future.result())
+    return sections
 
-            # Total issues
-            issues_query = """
-            SELECT (COUNT(DISTINCT ?issue) AS ?count)
-            WHERE {
-                ?issue a ?issueType .
-                ?issueType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#Issue> .
-            }
-            """
-            issues_data = run_dashboard_sparql(issues_query)
-            total_issues = (
-                int(issues_data["results"]["bindings"][0]["count"]["value"])
-                if issues_data["results"]["bindings"]
-                else 0
-            )
 
-            # Contributors
-            contributors_query = """
-            SELECT (COUNT(DISTINCT ?person) AS ?count)
-            WHERE {
-                ?person a ?personType .
-                ?personType rdfs:subClassOf* <http://xmlns.com/foaf/0.1/Person> .
-            }
-            """
-            contributors_data = run_dashboard_sparql(contributors_query)
-            total_contributors = (
-                int(contributors_data["results"]["bindings"][0]["count"]["value"])
-                if contributors_data["results"]["bindings"]
-                else 0
-            )
+def compute_and_store_dashboard_aggregates() -> bool:
+    """
+    Compute the analytics sections and store them in the aggregates graph.
 
-            analytics_data["developmentMetrics"] = {
-                "totalCommits": total_commits,
-                "totalIssues": total_issues,
-                "totalContributors": total_contributors,
-            }
+    Meant to run once after each ingestion, so /api/analytics can read the
+    precomputed sections instead of aggregating over the whole graph.
 
-        except Exception as e:
-            logger.warning(f"Development metrics query failed: {e}")
+    Returns:
+        bool: True if the store accepted the update, False otherwise.
 
-        # 7. Asset Metrics
-        try:
-            # Image files
-            images_query = """
-            SELECT (COUNT(DISTINCT ?image) AS ?count)
-            WHERE {
-                ?image a ?imageType .
-                ?imageType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#ImageFile> .
-            }
-            """
-            images_data = run_dashboard_sparql(images_query)
-            total_images = (
-                int(images_data["results"]["bindings"][0]["count"]["value"])
-                if images_data["results"]["bindings"]
-                else 0
-            )
+    Side Effects:
+        Replaces the contents of ``DASHBOARD_AGGREGATES_GRAPH``.
+    """
+    try:
+        sections = _run_analytics_fetchers(list(_ANALYTICS_SECTION_FETCHERS))
+        values = " ;\n            ".join(
+            f"<{_DASHBOARD_SECTION_IRI}{name}> "
+            f'"{_sparql_escape_string(app.json.dumps(sections[name]))}"'
+            for name in ANALYTICS_SECTIONS
+            if name in sections
+        )
+        update = f"""
+        DROP SILENT GRAPH <{DASHBOARD_AGGREGATES_GRAPH}> ;
+        INSERT DATA {{
+            GRAPH <{DASHBOARD_AGGREGATES_GRAPH}> {{
+                <{_DASHBOARD_AGGREGATES_SUBJECT}> {values} .
+            }}
+        }}
+        """
+        resp = post_sparql_form(
+            {"update": update}, "application/sparql-results+json", timeout=60
+        )
+    except Exception as e:
+        logger.warning(f"Failed to compute dashboard aggregates: {e}")
+        return False
+    if resp.status_code != 200:
+        logger.warning(f"Failed to store dashboard aggregates: {resp.text}")
+        return False
+    logger.info("Stored dashboard aggregates.")
+    return True
 
-            # Audio files
-            audio_query = """
-            SELECT (COUNT(DISTINCT ?audio) AS ?count)
-            WHERE {
-                ?audio a ?audioType .
-                ?audioType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#AudioFile> .
-            }
-            """
-            audio_data = run_dashboard_sparql(audio_query)
-            total_audio = (
-                int(audio_data["results"]["bindings"][0]["count"]["value"])
-                if audio_data["results"]["bindings"]
-                else 0
-            )
 
-            # Video files
-            video_query = """
-            SELECT (COUNT(DISTINCT ?video) AS ?count)
-            WHERE {
-                ?video a ?videoType .
-                ?videoType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#VideoFile> .
-            }
-            """
-            video_data = run_dashboard_sparql(video_query)
-            total_video = (
-                int(video_data["results"]["bindings"][0]["count"]["value"])
-                if video_data["results"]["bindings"]
-                else 0
-            )
+def _read_materialized_analytics() -> Optional[Dict[str, Any]]:
+    """
+    Read the analytics sections stored by compute_and_store_dashboard_aggregates.
 
-            # Font files
-            font_query = """
-            SELECT (COUNT(DISTINCT ?font) AS ?count)
-            WHERE {
-                ?font a ?fontType .
-                ?fontType rdfs:subClassOf* <http://web-development-ontology.netlify.app/wdo#FontFile> .
-            }
-            """
-            font_data = run_dashboard_sparql(font_query)
-            total_fonts = (
-                int(font_data["results"]["bindings"][0]["count"]["value"])
-                if font_data["results"]["bindings"]
-                else 0
-            )
+    Returns:
+        The sections, or None if the graph is missing any of them or the
+        read fails.
+    """
+    try:
+        data = run_dashboard_sparql(MATERIALIZED_ANALYTICS_QUERY)
+        sections = {}
+        for binding in data["results"]["bindings"]:
+            head, _, name = binding["section"]["value"].rpartition(":")
+            if f"{head}:" == _DASHBOARD_SECTION_IRI:
+                sections[name] = app.json.loads(binding["value"]["value"])
+    except Exception as e:
+        logger.warning(f"Materialized analytics read failed: {e}")
+        return None
+    if not all(name in sections for name in ANALYTICS_SECTIONS):
+        return None
+    return sections
 
-            analytics_data["assetMetrics"] = {
-                "imageFiles": total_images,
-                "audioFiles": total_audio,
-                "videoFiles": total_video,
-                "fontFiles": total_fonts,
-            }
 
-        except Exception as e:
-            logger.warning(f"Asset metrics query failed: {e}")
+@app.route("/api/analytics", methods=["GET"])
+@graph_version_etag
+def get_analytics() -> Any:
+    """
+    Get analytics data for the dashboard.
 
-        # 8. Trends (placeholder for future implementation)
-        from datetime import datetime
+    Returns:
+        JSON response with analytics data including metrics, trends, and insights.
+    """
+    try:
+        analytics_data: Dict[str, Any] = {
+            "codebaseMetrics": {},
+            "entityDistribution": {},
+            "languageDistribution": [],
+            "complexityMetrics": {},
+            "documentationMetrics": {},
+            "developmentMetrics": {},
+            "assetMetrics": {},
+            "trends": {},
+        }
 
+        # 1. Sections precomputed after the last ingestion, unless the caller
+        # asked for fresh results or the aggregates graph is incomplete
+        materialized = (
+            None if _sparql_cache_bypassed() else _read_materialized_analytics()
+        )
+        degraded = False
+        if materialized is not None:
+            analytics_data.update(materialized)
+        else:
+            # Class counts, language distribution and complexity metrics are
+            # independent round-trips, so fetch them concurrently. Each
+            # fetcher handles its own errors and returns the sections it
+            # filled in; it runs in a copy of the request context so
+            # ?no_cache=1 still applies
+            fetched = _run_analytics_fetchers(
+                [
+                    copy_current_request_context(fetch)
+                    for fetch in _ANALYTICS_SECTION_FETCHERS
+                ]
+            )
+            analytics_data.update(fetched)
+            # A fetcher that failed left its sections out; the placeholders
+            # above are then served as a degraded, uncacheable response
+            degraded = not all(name in fetched for name in ANALYTICS_SECTIONS)
+
+        # 2. Trends (placeholder for future implementation): one point, stamped
+        # once for both series
         current_time = datetime.now().isoformat()
 
         analytics_data["trends"] = {
@@ -2148,6 +2759,8 @@ def get_analytics() -> Any:
             },
         }
 
+        if degraded:
+            return fallback_json(analytics_data)
         return jsonify(analytics_data)
 
     except Exception as e:
@@ -2155,6 +2768,50 @@ def get_analytics() -> Any:
         return jsonify({"error": f"Failed to load analytics: {str(e)}"}), 500
 
 
+# Characters allowed in an IRI reference interpolated into a query template:
+# anything but whitespace, the SPARQL IRIREF delimiters and quote characters
+_IRI_REF_RE = re.compile(r"^[^\s<>\"{}|^`\\';]+$")
+
+# Entity query templates for get_entity_details. The entity IRI, checked
+# against _IRI_REF_RE, is the only varying part. The details query writes it
+# inline as the subject of every pattern, so the store looks the entity up by
+# subject instead of scanning ``?entity a ?type`` and filtering; the
+# relationship queries bind it through a single-row VALUES block
+_T_ENTITY_DETAILS = Template(
+    """
+    SELECT ?type ?label ?editorialNote
+    WHERE {
+        <$entity_id> a ?type .
+        OPTIONAL { <$entity_id> <http://www.w3.org/2000/01/rdf-schema#label> ?label }
+        OPTIONAL { <$entity_id> <http://www.w3.org/2004/02/skos/core#editorialNote> ?editorialNote }
+    }
+    LIMIT 1
+    """
+)
+# Relationships in each direction, as two subject- or object-bound lookups
+# instead of one UNION with the entity pinned on both sides
+_T_ENTITY_OUTGOING = Template(
+    """
+    SELECT ?relatedEntity ?relationshipType ?relatedLabel
+    WHERE {
+        VALUES ?entity { <$entity_id> }
+        ?entity ?relationshipType ?relatedEntity .
+        OPTIONAL { ?relatedEntity <http://www.w3.org/2000/01/rdf-schema#label> ?relatedLabel }
+    }
+    """
+)
+_T_ENTITY_INCOMING = Template(
+    """
+    SELECT ?relatedEntity ?relationshipType ?relatedLabel
+    WHERE {
+        VALUES ?entity { <$entity_id> }
+        ?relatedEntity ?relationshipType ?entity .
+        OPTIONAL { ?relatedEntity <http://www.w3.org/2000/01/rdf-schema#label> ?relatedLabel }
+    }
+    """
+)
+
+
 @app.route("/api/entities/<entity_id>", methods=["GET"])
 def get_entity_details(entity_id: str) -> Any:
     """
@@ -2167,62 +2824,54 @@ def get_entity_details(entity_id: str) -> Any:
         JSON response with entity details and relationships.
     """
     try:
-        # Query for entity details
-        entity_query = f"""
-        SELECT ?entity ?type ?label ?editorialNote
-        WHERE {{
-            ?entity a ?type .
-            OPTIONAL {{ ?entity <http://www.w3.org/2000/01/rdf-schema#label> ?label }}
-            OPTIONAL {{ ?entity <http://www.w3.org/2004/02/skos/core#editorialNote> ?editorialNote }}
-            FILTER(?entity = <{entity_id}>)
-        }}
-        """
-
-        entity_data = run_dashboard_sparql(entity_query)
+        # Reject IDs that could break out of the IRI in the query templates
+        if not _IRI_REF_RE.match(entity_id):
+            return jsonify({"error": "Invalid entity ID"}), 400
+
+        entity_query = _T_ENTITY_DETAILS.substitute(entity_id=entity_id)
+        outgoing_query = _T_ENTITY_OUTGOING.substitute(entity_id=entity_id)
+        incoming_query = _T_ENTITY_INCOMING.substitute(entity_id=entity_id)
+
+        # The three lookups are independent, so run them concurrently
+        run_query = copy_current_request_context(run_dashboard_sparql)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            entity_future = executor.submit(run_query, entity_query)
+            relationship_futures = [
+                ("outgoing", executor.submit(run_query, outgoing_query)),
+                ("incoming", executor.submit(run_query, incoming_query)),
+            ]
+            entity_data = entity_future.result()
+            relationships_data = [
+                (direction, future.result())
+                for direction, future in relationship_futures
+            ]
 
         if not entity_data["results"]["bindings"]:
             return jsonify({"error": "Entity not found"}), 404
 
         binding = entity_data["results"]["bindings"][0]
 
-        # Query for relationships
-        relationships_query = f"""
-        SELECT ?relatedEntity ?relationshipType ?relatedLabel
-        WHERE {{
-            {{
-                <{entity_id}> ?relationshipType ?relatedEntity .
-            }}
-            UNION
-            {{
-                ?relatedEntity ?relationshipType <{entity_id}> .
-            }}
-            OPTIONAL {{ ?relatedEntity <http://www.w3.org/2000/01/rdf-schema#label> ?relatedLabel }}
-        }}
-        """
-
-        relationships_data = run_dashboard_sparql(relationships_query)
-
+        editorial_note = _binding_value(binding, "editorialNote")
         entity_details = {
             "id": entity_id,
-            "type": binding.get("type", {}).get("value", ""),
-            "name": binding.get("label", {}).get("value", ""),
-            "editorialNote": binding.get("editorialNote", {}).get("value", ""),
-            "description": binding.get("editorialNote", {}).get(
-                "value", ""
-            ),  # Use editorial note as description
-            "file": binding.get("file", {}).get("value", ""),
-            "line": binding.get("line", {}).get("value", ""),
-            "repository": binding.get("repository", {}).get("value", ""),
+            "type": _binding_value(binding, "type"),
+            "name": _binding_value(binding, "label"),
+            "editorialNote": editorial_note,
+            "description": editorial_note,  # Use editorial note as description
             "relationships": [],
         }
 
-        for rel_binding in relationships_data["results"]["bindings"]:
-            relationship = {
-                "entity": rel_binding["relatedEntity"]["value"],
-                "type": rel_binding["relationshipType"]["value"],
-                "name": rel_binding.get("relatedLabel", {}).get("value", ""),
-            }
-            entity_details["relationships"].append(relationship)
+        append_relationship = entity_details["relationships"].append
+        for direction, data in relationships_data:
+            for rel_binding in data["results"]["bindings"]:
+                append_relationship(
+                    {
+                        "entity": rel_binding["relatedEntity"]["value"],
+                        "type": rel_binding["relationshipType"]["value"],
+                        "name": _binding_value(rel_binding, "relatedLabel"),
+                        "direction": direction,
+                    }
+                )
 
         return jsonify(entity_details)
 
@@ -2231,6 +2880,50 @@ def get_entity_details(entity_id: str) -> Any:
         return jsonify({"error": f"Failed to get entity details: {str(e)}"}), 500
 
 
+# Predicates counted by /api/relationships. Each gets its own single-pattern
+# COUNT, which the store can answer from its predicate index, instead of one
+# scan of every triple against a FILTER ... IN list
+RELATIONSHIP_PREDICATES = tuple(
+    f"{_WDO_IRI}{name}"
+    for name in (
+        "invokes",
+        "callsFunction",
+        "extendsType",
+        "implementsInterface",
+        "declaresCode",
+        "hasField",
+        "hasMethod",
+        "isRelatedTo",
+        "usesFramework",
+        "tests",
+        "documentsEntity",
+        "modifies",
+        "imports",
+        "isImportedBy",
+    )
+)
+_T_PREDICATE_COUNT = Template(
+    "SELECT (COUNT(*) AS ?count) WHERE { ?s <$predicate> ?o . }"
+)
+RELATIONSHIP_COUNT_QUERIES = {
+    predicate: _T_PREDICATE_COUNT.substitute(predicate=predicate)
+    for predicate in RELATIONSHIP_PREDICATES
+}
+
+
+def _count_predicate(predicate: str) -> int:
+    """
+    Count the triples using one of the RELATIONSHIP_PREDICATES.
+
+    Args:
+        predicate: The predicate IRI.
+
+    Returns:
+        The number of triples with that predicate.
+    """
+    return int(run_dashboard_sparql_scalar(RELATIONSHIP_COUNT_QUERIES[predicate]) or 0)
+
+
 @app.route("/api/relationships", methods=["GET"])
 def get_relationships() -> Any:
     """
@@ -2240,50 +2933,40 @@ def get_relationships() -> Any:
         JSON response with relationship information.
     """
     try:
-        # Query for relationship types and counts
-        relationships_query = """
-        SELECT ?relationshipType (COUNT(*) AS ?count)
-        WHERE {
-            ?s ?relationshipType ?o .
-            FILTER(?relationshipType IN (
-                <http://web-development-ontology.netlify.app/wdo#invokes>,
-                <http://web-development-ontology.netlify.app/wdo#callsFunction>,
-                <http://web-development-ontology.netlify.app/wdo#extendsType>,
-                <http://web-development-ontology.netlify.app/wdo#implementsInterface>,
-                <http://web-development-ontology.netlify.app/wdo#declaresCode>,
-                <http://web-development-ontology.netlify.app/wdo#hasField>,
-                <http://web-development-ontology.netlify.app/wdo#hasMethod>,
-                <http://web-development-ontology.netlify.app/wdo#isRelatedTo>,
-                <http://web-development-ontology.netlify.app/wdo#usesFramework>,
-                <http://web-development-ontology.netlify.app/wdo#tests>,
-                <http://web-development-ontology.netlify.app/wdo#documentsEntity>,
-                <http://web-development-ontology.netlify.app/wdo#modifies>,
-                <http://web-development-ontology.netlify.app/wdo#imports>,
-                <http://web-development-ontology.netlify.app/wdo#isImportedBy>
-            ))
-        }
-        GROUP BY ?relationshipType
-        ORDER BY DESC(?count)
-        """
-
-        relationships_data = run_dashboard_sparql(relationships_query)
+        # One single-pattern count per predicate, issued concurrently on the
+        # shared pool; each runs in its own copy of the request context so
+        # ?no_cache=1 applies
+        futures = [
+            (
+                predicate,
+                _SPARQL_FANOUT_EXECUTOR.submit(
+                    copy_current_request_context(_count_predicate), predicate
+                ),
+            )
+            for predicate in RELATIONSHIP_PREDICATES
+        ]
+        counts = [(predicate, future.result()) for predicate, future in futures]
+        # Present predicates only, most frequent first, as the grouped query did
+        counts = sorted(
+            (item for item in counts if item[1] > 0), key=itemgetter(1), reverse=True
+        )
 
         relationships = []
-        for binding in relationships_data["results"]["bindings"]:
-            rel_type = binding["relationshipType"]["value"]
-            count = int(binding["count"]["value"])
+        total_relationships = 0
+        for rel_type, count in counts:
+            total_relationships += count
 
             # Extract readable name from URI
-            rel_name = (
-                rel_type.split("#")[-1] if "#" in rel_type else rel_type.split("/")[-1]
-            )
+            _, hash_sep, rel_name = rel_type.rpartition("#")
+            if not hash_sep:
+                rel_name = rel_type.rpartition("/")[2]
 
             relationships.append({"type": rel_type, "name": rel_name, "count": count})
 
         return jsonify(
             {
                 "relationships": relationships,
-                "totalRelationships": sum(r["count"] for r in relationships),
+                "totalRelationships": total_relationships,
             }
         )
 
@@ -2292,6 +2975,19 @@ def get_relationships() -> Any:
         return jsonify({"error": f"Failed to get relationships: {str(e)}"}), 500
 
 
+# Upper bounds (inclusive) of the cyclomatic complexity buckets reported by
+# /api/metrics/code-complexity; anything above the last bound is "Very High"
+COMPLEXITY_BUCKET_BOUNDS = (5, 10, 20)
+COMPLEXITY_BUCKET_LABELS = (
+    "Low (1-5)",
+    "Medium (6-10)",
+    "High (11-20)",
+    "Very High (>20)",
+)
+# Most complex files listed by /api/metrics/code-complexity
+COMPLEXITY_TOP_FILES = 20
+
+
 @app.route("/api/metrics/code-complexity", methods=["GET"])
 def get_code_complexity() -> Any:
     """
@@ -2301,135 +2997,99 @@ def get_code_complexity() -> Any:
         JSON response with complexity analysis.
     """
     try:
-        # Query for complexity-related metrics using WDO classes
+        # Query for complexity-related metrics using WDO classes: one pass
+        # over the function/file patterns, grouped once per file name. The
+        # name is the content's hasSimpleName written at extraction time,
+        # rather than a regex REPLACE over every file IRI
         complexity_query = """
-        SELECT ?fileName ?totalComplexity ?avgComplexity ?functionCount ?lineCount ?tokenCount
+        SELECT ?fileName
+               (SUM(?complexity) AS ?totalComplexity)
+               (AVG(?complexity) AS ?avgComplexity)
+               (COUNT(DISTINCT ?func) AS ?functionCount)
+               (SUM(?lines) AS ?lineCount)
+               (SUM(?tokens) AS ?tokenCount)
         WHERE {
-            {
-                SELECT ?fileName (SUM(?complexity) AS ?totalComplexity) (AVG(?complexity) AS ?avgComplexity) (COUNT(?func) AS ?functionCount)
-                WHERE {
-                    ?func a <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> .
-                    ?func <http://web-development-ontology.netlify.app/wdo#hasCyclomaticComplexity> ?complexity .
-                    ?func <http://web-development-ontology.netlify.app/wdo#isCodePartOf> ?codeContent .
-                    ?file <http://web-development-ontology.netlify.app/wdo#bearerOfInformation> ?codeContent .
-                    ?file a <http://web-development-ontology.netlify.app/wdo#SourceCodeFile> .
-                    BIND(REPLACE(STR(?file), ".*/([^/]+)$", "$1") AS ?fileName)
-                }
-                GROUP BY ?fileName
-            }
-
-            # Get line count for functions in this file
-            {
-                SELECT ?fileName (SUM(?lines) AS ?lineCount)
-                WHERE {
-                    ?func a <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> .
-                    ?func <http://web-development-ontology.netlify.app/wdo#hasLineCount> ?lines .
-                    ?func <http://web-development-ontology.netlify.app/wdo#isCodePartOf> ?codeContent .
-                    ?file <http://web-development-ontology.netlify.app/wdo#bearerOfInformation> ?codeContent .
-                    ?file a <http://web-development-ontology.netlify.app/wdo#SourceCodeFile> .
-                    BIND(REPLACE(STR(?file), ".*/([^/]+)$", "$1") AS ?fileName)
-                }
-                GROUP BY ?fileName
-            }
-
-            # Get token count for functions in this file
-            {
-                SELECT ?fileName (SUM(?tokens) AS ?tokenCount)
-                WHERE {
-                    ?func a <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> .
-                    ?func <http://web-development-ontology.netlify.app/wdo#hasTokenCount> ?tokens .
-                    ?func <http://web-development-ontology.netlify.app/wdo#isCodePartOf> ?codeContent .
-                    ?file <http://web-development-ontology.netlify.app/wdo#bearerOfInformation> ?codeContent .
-                    ?file a <http://web-development-ontology.netlify.app/wdo#SourceCodeFile> .
-                    BIND(REPLACE(STR(?file), ".*/([^/]+)$", "$1") AS ?fileName)
-                }
-                GROUP BY ?fileName
-            }
+            ?func a <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> ;
+                  <http://web-development-ontology.netlify.app/wdo#hasCyclomaticComplexity> ?complexity ;
+                  <http://web-development-ontology.netlify.app/wdo#isCodePartOf> ?codeContent .
+            ?file <http://web-development-ontology.netlify.app/wdo#bearerOfInformation> ?codeContent ;
+                  a <http://web-development-ontology.netlify.app/wdo#SourceCodeFile> .
+            ?codeContent <http://web-development-ontology.netlify.app/wdo#hasSimpleName> ?fileName .
+            OPTIONAL { ?func <http://web-development-ontology.netlify.app/wdo#hasLineCount> ?lines . }
+            OPTIONAL { ?func <http://web-development-ontology.netlify.app/wdo#hasTokenCount> ?tokens . }
         }
+        GROUP BY ?fileName
         ORDER BY DESC(?totalComplexity)
         LIMIT 50
         """
 
         complexity_data = run_dashboard_sparql(complexity_query)
 
+        # Aggregate the per-file totals in one pass over the rows. The store
+        # already orders them by total complexity, so only the first
+        # COMPLEXITY_TOP_FILES rows are converted into file entries
         files = []
         total_complexity: float = 0.0
         file_count = 0
+        high_complexity_files = 0
 
-        for binding in complexity_data["results"]["bindings"]:
-            file_name = binding.get("fileName", {}).get("value", "Unknown")
-            total_complexity_val = float(
-                binding.get("totalComplexity", {}).get("value", 0)
-            )
-            avg_complexity_val = float(binding.get("avgComplexity", {}).get("value", 0))
-            function_count = int(binding.get("functionCount", {}).get("value", 0))
-            line_count = int(binding.get("lineCount", {}).get("value", 0))
-            token_count = int(binding.get("tokenCount", {}).get("value", 0))
-
-            files.append(
-                {
-                    "file": file_name,
-                    "complexity": total_complexity_val,
-                    "avgComplexity": avg_complexity_val,
-                    "lines": line_count,
-                    "functions": function_count,
-                    "tokens": token_count,
-                }
-            )
+        bindings = complexity_data["results"]["bindings"]
+        for binding in bindings:
+            total_complexity_val = float(_binding_value(binding, "totalComplexity", 0))
+            if file_count < COMPLEXITY_TOP_FILES:
+                files.append(
+                    {
+                        "file": _binding_value(binding, "fileName", "Unknown"),
+                        "complexity": total_complexity_val,
+                        "avgComplexity": float(
+                            _binding_value(binding, "avgComplexity", 0)
+                        ),
+                        "lines": int(_binding_value(binding, "lineCount", 0)),
+                        "functions": int(_binding_value(binding, "functionCount", 0)),
+                        "tokens": int(_binding_value(binding, "tokenCount", 0)),
+                    }
+                )
 
             total_complexity += total_complexity_val
             file_count += 1
+            if total_complexity_val > 10:
+                high_complexity_files += 1
 
         # Get additional complexity metrics
         try:
-            # Average complexity across all functions
-            overall_avg_query = """
-            SELECT (AVG(?complexity) AS ?avgComplexity) (COUNT(?func) AS ?totalFunctions)
+            # Functions per distinct complexity value; the overall average,
+            # function total and bucketed distribution all derive from it
+            complexity_counts_query = """
+            SELECT ?complexity (COUNT(?func) AS ?count)
             WHERE {
                 ?func a <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> .
                 ?func <http://web-development-ontology.netlify.app/wdo#hasCyclomaticComplexity> ?complexity .
             }
+            GROUP BY ?complexity
             """
-            overall_data = run_dashboard_sparql(overall_avg_query)
-            overall_avg = 0.0
+            counts_data = run_dashboard_sparql(complexity_counts_query)
+            bucket_counts = [0] * len(COMPLEXITY_BUCKET_LABELS)
+            complexity_sum = 0.0
             total_functions = 0
-            if overall_data["results"]["bindings"]:
-                avg_val = overall_data["results"]["bindings"][0]["avgComplexity"][
-                    "value"
-                ]
-                if avg_val != "NaN":
-                    overall_avg = round(float(avg_val), 2)
-                total_functions = int(
-                    overall_data["results"]["bindings"][0]["totalFunctions"]["value"]
-                )
+            for binding in counts_data["results"]["bindings"]:
+                complexity = float(binding["complexity"]["value"])
+                count = int(binding["count"]["value"])
+                bucket = bisect_left(COMPLEXITY_BUCKET_BOUNDS, complexity)
+                bucket_counts[bucket] += count
+                complexity_sum += complexity * count
+                total_functions += count
 
-            # Complexity distribution
-            complexity_distribution_query = """
-            SELECT ?complexityRange (COUNT(?func) AS ?count)
-            WHERE {
-                ?func a <http://web-development-ontology.netlify.app/wdo#FunctionDefinition> .
-                ?func <http://web-development-ontology.netlify.app/wdo#hasCyclomaticComplexity> ?complexity .
-                BIND(
-                    CASE
-                        WHEN ?complexity <= 5 THEN "Low (1-5)"
-                        WHEN ?complexity <= 10 THEN "Medium (6-10)"
-                        WHEN ?complexity <= 20 THEN "High (11-20)"
-                        ELSE "Very High (>20)"
-                    END AS ?complexityRange
-                )
-            }
-            GROUP BY ?complexityRange
-            ORDER BY ?complexityRange
-            """
-            distribution_data = run_dashboard_sparql(complexity_distribution_query)
-            complexity_distribution = []
-            for binding in distribution_data["results"]["bindings"]:
-                complexity_distribution.append(
-                    {
-                        "range": binding["complexityRange"]["value"],
-                        "count": int(binding["count"]["value"]),
-                    }
-                )
+            overall_avg = (
+                round(complexity_sum / total_functions, 2) if total_functions else 0.0
+            )
+            complexity_distribution = sorted(
+                (
+                    {"range": label, "count": count}
+                    for label, count in zip(COMPLEXITY_BUCKET_LABELS, bucket_counts)
+                    if count
+                ),
+                key=itemgetter("range"),
+            )
 
         except Exception as e:
             logger.warning(f"Additional complexity metrics failed: {e}")
@@ -2438,7 +3098,6 @@ def get_code_complexity() -> Any:
             complexity_distribution = []
 
         avg_complexity = total_complexity / file_count if file_count > 0 else 0
-        high_complexity_files = len([f for f in files if f["complexity"] > 10])
 
         return jsonify(
             {
@@ -2448,7 +3107,7 @@ def get_code_complexity() -> Any:
                 "totalFiles": file_count,
                 "totalFunctions": total_functions,
                 "complexityDistribution": complexity_distribution,
-                "files": files[:20],  # Return top 20 most complex files
+                "files": files,
             }
         )
 
@@ -2457,44 +3116,98 @@ def get_code_complexity() -> Any:
         return jsonify({"error": f"Failed to get complexity metrics: {str(e)}"}), 500
 
 
+# Seconds a health probe result is reused for
+HEALTH_CACHE_TTL = 1.0
+# Seconds to wait for the store before reporting it unhealthy
+HEALTH_PROBE_TIMEOUT = 2.0
+# Last probe as (monotonic time, health document, status code)
+_health_cache: Optional[Tuple[float, Dict[str, Any], int]] = None
+# Store probes run on one shared worker with a request timeout matching the
+# deadline, so a hung store holds at most one thread. A probe still in flight
+# is awaited again rather than queueing another behind it
+_HEALTH_PROBE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="health-probe"
+)
+_health_probe_future: Optional["Future[float]"] = None
+_HEALTH_PROBE_LOCK = threading.Lock()
+
+
 @app.route("/api/health", methods=["GET"])
 def health_check() -> Any:
     """
     Health check endpoint for the API.
 
+    Probes run at most once per HEALTH_CACHE_TTL seconds; requests in
+    between get the last result, so bursts of liveness and readiness
+    checks cost one round-trip to the store.
+
     Returns:
         JSON response with system health status.
     """
+    global _health_cache
+    now = time.monotonic()
+    cached = _health_cache
+    if cached is None or now - cached[0] >= HEALTH_CACHE_TTL:
+        cached = (now, *_probe_health())
+        _health_cache = cached
+    response = jsonify(cached[1])
+    response.status_code = cached[2]
+    response.cache_control.max_age = int(HEALTH_CACHE_TTL)
+    return response
+
+
+def _probe_health() -> Tuple[Dict[str, Any], int]:
+    """
+    Check the store, filesystem and host resources.
+
+    Returns:
+        The health document and the HTTP status code to send with it.
+    """
     try:
         # Test SPARQL endpoint with a simple query
-        test_query = "SELECT (COUNT(*) AS ?count) WHERE { ?s ?p ?o } LIMIT 1"
+        test_query = "SELECT ?s WHERE { ?s ?p ?o } LIMIT 1"
         sparql_healthy = False
-        sparql_response_time = 0
+        sparql_response_time = 0.0
+
+        def probe_sparql() -> float:
+            # Bypass the result cache so the store is actually reached and
+            # the timing is a real round-trip
+            start = time.perf_counter_ns()
+            _post_dashboard_sparql(
+                test_query, timeout=(HEALTH_PROBE_TIMEOUT, HEALTH_PROBE_TIMEOUT)
+            )
+            return round((time.perf_counter_ns() - start) / 1e6, 2)
 
-        try:
-            start = time.time()
-            run_dashboard_sparql(test_query)
-            sparql_response_time = int((time.time() - start) * 1000)  # ms
-            sparql_healthy = True
-        except Exception as e:
-            logger.warning(f"SPARQL health check failed: {e}")
-            sparql_healthy = False
+        # The store round-trip runs in the background while the local checks
+        # below run here, so the probe takes as long as the slowest check
+        global _health_probe_future
+        with _HEALTH_PROBE_LOCK:
+            sparql_future = _health_probe_future
+            if sparql_future is None or sparql_future.done():
+                sparql_future = _HEALTH_PROBE_EXECUTOR.submit(probe_sparql)
+                _health_probe_future = sparql_future
 
         # Check file system
-        import os
-
-        output_dir = os.path.join("output")
-        filesystem_healthy = os.path.exists(output_dir)
+        filesystem_healthy = os.path.exists(OUTPUT_DIR)
 
         # Get system info (make psutil optional)
-        try:
-            import psutil
+        if psutil is not None:
             memory_usage = psutil.virtual_memory().percent
             disk_usage = psutil.disk_usage("/").percent
-        except ImportError:
+        else:
             memory_usage = None
             disk_usage = None
 
+        try:
+            sparql_response_time = sparql_future.result(timeout=HEALTH_PROBE_TIMEOUT)
+            sparql_healthy = True
+        except FuturesTimeoutError:
+            logger.warning(
+                f"SPARQL health check timed out after {HEALTH_PROBE_TIMEOUT}s"
+            )
+        except Exception as e:
+            logger.warning(f"SPARQL health check failed: {e}")
+
         health_status = {
             "status": (
                 "healthy" if sparql_healthy and filesystem_healthy else "degraded"
@@ -2506,7 +3219,7 @@ def health_check() -> Any:
                 "api_server": True,
             },
             "performance": {
-                "sparql_response_time_ms": sparql_response_time,  # already in ms
+                "sparql_response_time_ms": sparql_response_time,
                 "memory_usage": memory_usage,
                 "disk_usage": disk_usage,
             },
@@ -2514,22 +3227,160 @@ def health_check() -> Any:
         }
 
         status_code = 200 if health_status["status"] == "healthy" else 503
-        return jsonify(health_status), status_code
+        return health_status, status_code
 
     except Exception as e:
         logger.error(f"Health check error: {str(e)}")
         return (
-            jsonify(
-                {
-                    "status": "unhealthy",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                }
-            ),
+            {
+                "status": "unhealthy",
+                "error": str(e),
+                "timestamp": datetime.now().isoformat(),
+            },
             503,
         )
 
 
+# Bytes read from the store per chunk of a streamed export
+EXPORT_CHUNK_SIZE = 64 * 1024
+# CSV export; the projected names become the header row of the store's CSV
+# Every triple except the materialized dashboard aggregates, which all share
+# one subject; filtering on it is cheaper than a per-triple graph check
+_EXPORT_WHERE = f"""
+WHERE {{
+    ?s ?p ?o .
+    FILTER(?s != <{_DASHBOARD_AGGREGATES_SUBJECT}>)
+}}
+"""
+EXPORT_CONSTRUCT_QUERY = "CONSTRUCT { ?s ?p ?o }" + _EXPORT_WHERE
+EXPORT_CSV_QUERY = (
+    "SELECT (?s AS ?Subject) (?p AS ?Predicate) (?o AS ?Object)" + _EXPORT_WHERE
+)
+
+
+def _stream_sparql_export(query: str, accept: str) -> Response:
+    """
+    Proxy a query's results from the store to the client without buffering.
+
+    The store serializes the results in the requested format and the body
+    is relayed chunk by chunk, never parsed into Python objects. Clients
+    that accept gzip get the store's compressed body as is, or, when the
+    store sent it uncompressed, a body gzipped chunk by chunk here.
+
+    Args:
+        query: The SPARQL query to run.
+        accept: The result media type to request and to respond with.
+
+    Returns:
+        A streamed response with the store's serialized results.
+
+    Raises:
+        requests.HTTPError: If the store rejects the query.
+    """
+    resp = post_sparql_form({"query": query}, accept, stream=True)
+    if resp.status_code != 200:
+        logger.error(f"Export query failed: {resp.text}")
+        resp.close()
+        resp.raise_for_status()
+
+    # Parsed quality values, so "gzip;q=0" counts as a refusal
+    client_gzip = request.accept_encodings["gzip"] > 0
+    if client_gzip and resp.headers.get("Content-Encoding") == "gzip":
+        # Skip inflating the store's gzip body only to compress it again
+        chunks = resp.raw.stream(EXPORT_CHUNK_SIZE, decode_content=False)
+    else:
+        chunks = resp.iter_content(chunk_size=EXPORT_CHUNK_SIZE)
+        if client_gzip:
+            chunks = _gzip_chunks(chunks)
+
+    def generate() -> Any:
+        try:
+            yield from chunks
+        finally:
+            resp.close()
+
+    response = Response(generate(), content_type=accept)
+    if client_gzip:
+        response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _gzip_chunks(chunks: Any) -> Any:
+    """
+    Gzip-compress a stream of byte chunks as a single gzip member.
+
+    Args:
+        chunks: Iterable of uncompressed byte chunks.
+
+    Yields:
+        Compressed byte chunks.
+    """
+    compressor = zlib.compressobj(RESPONSE_GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+# Serializes regeneration of the on-disk RDF/XML export so concurrent first
+# requests convert the Turtle file once rather than in parallel
+_EXPORT_RDF_LOCK = threading.Lock()
+
+
+def _export_rdf_file(ttl_path: str) -> str:
+    """
+    Return the RDF/XML copy of a Turtle file, writing it when out of date.
+
+    The copy sits next to the Turtle file and is regenerated only when the
+    Turtle file is newer, so it can be served straight from disk. With
+    pyoxigraph installed the triples are streamed from one file into the
+    other by its native parser; otherwise the file is parsed into a
+    temporary rdflib graph that is dropped once the copy is written.
+
+    Args:
+        ttl_path: Path to the Turtle file.
+
+    Returns:
+        Path to the RDF/XML file.
+    """
+    rdf_path = os.path.splitext(ttl_path)[0] + ".rdf"
+
+    def is_stale() -> bool:
+        return not os.path.exists(rdf_path) or (
+            os.path.getmtime(rdf_path) < os.path.getmtime(ttl_path)
+        )
+
+    if not is_stale():
+        return rdf_path
+    with _EXPORT_RDF_LOCK:
+        # Another request may have regenerated the copy while this one waited
+        if not is_stale():
+            return rdf_path
+        # Write then rename so concurrent requests never send a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(rdf_path), suffix=".rdf")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if pyoxigraph is not None:
+                    pyoxigraph.serialize(
+                        pyoxigraph.parse(
+                            path=ttl_path, format=pyoxigraph.RdfFormat.TURTLE
+                        ),
+                        f,
+                        pyoxigraph.RdfFormat.RDF_XML,
+                    )
+                else:
+                    graph = Graph()
+                    graph.parse(ttl_path, format="turtle")
+                    graph.serialize(destination=f, format="xml", encoding="utf-8")
+            os.replace(tmp_path, rdf_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return rdf_path
+
+
 @app.route("/api/export/<format>", methods=["GET"])
 def export_data(format: str) -> Any:
     """
@@ -2546,75 +3397,88 @@ def export_data(format: str) -> Any:
             return jsonify({"error": "Unsupported format"}), 400
 
         # Query all triples
-        export_query = """
-        CONSTRUCT { ?s ?p ?o }
-        WHERE { ?s ?p ?o }
-        """
+        export_query = EXPORT_CONSTRUCT_QUERY
 
         if format == "json":
-            # Convert to JSON-LD format using proper CONSTRUCT query handling
-            data = run_graph_sparql(export_query, accept="application/ld+json")
-            return jsonify(data)
+            # JSON-LD straight from the store, streamed like the other formats
+            return _stream_sparql_export(export_query, "application/ld+json")
 
         elif format == "ttl":
             # Return Turtle format - try file first, then live query
             ttl_path = get_output_path("wdkb.ttl")
             if os.path.exists(ttl_path):
-                from rdflib import Graph
-                g = Graph()
-                g.parse(ttl_path, format="turtle")
-                return (
-                    g.serialize(format="turtle"),
-                    200,
-                    {"Content-Type": "text/turtle"},
-                )
+                # Already Turtle on disk: send it as is, with conditional GET
+                return send_file(ttl_path, mimetype="text/turtle", conditional=True)
             else:
-                # Fallback to live CONSTRUCT query
-                ttl = run_graph_sparql(export_query, accept="text/turtle")
-                return ttl, 200, {"Content-Type": "text/turtle"}
+                # Fallback to live CONSTRUCT query, streamed from the store
+                return _stream_sparql_export(export_query, "text/turtle")
 
         elif format == "rdf":
             # Return RDF/XML format - try file first, then live query
             ttl_path = get_output_path("wdkb.ttl")
             if os.path.exists(ttl_path):
-                from rdflib import Graph
-                g = Graph()
-                g.parse(ttl_path, format="turtle")
-                return (
-                    g.serialize(format="xml"),
-                    200,
-                    {"Content-Type": "application/rdf+xml"},
+                return send_file(
+                    _export_rdf_file(ttl_path),
+                    mimetype="application/rdf+xml",
+                    conditional=True,
                 )
             else:
-                # Fallback to live CONSTRUCT query  
-                rdfxml = run_graph_sparql(export_query, accept="application/rdf+xml")
-                return rdfxml, 200, {"Content-Type": "application/rdf+xml"}
+                # Fallback to live CONSTRUCT query, streamed from the store
+                return _stream_sparql_export(export_query, "application/rdf+xml")
 
         elif format == "csv":
-            # Export as CSV with proper escaping
-            csv_data = "Subject,Predicate,Object\n"
-
-            # Get triples as CSV
-            triples_query = """
-            SELECT ?s ?p ?o
-            WHERE { ?s ?p ?o }
-            LIMIT 1000
-            """
-
-            triples_data = run_dashboard_sparql(triples_query)
-            for binding in triples_data["results"]["bindings"]:
-                s = binding["s"]["value"]
-                p = binding["p"]["value"]
-                o = binding["o"]["value"]
-                csv_data += f'{_csv_escape(s)},{_csv_escape(p)},{_csv_escape(o)}\n'
-
-            return csv_data, 200, {"Content-Type": "text/csv"}
+            # Have the store serialize the triples as CSV and relay its body
+            return _stream_sparql_export(EXPORT_CSV_QUERY, "text/csv")
 
     except Exception as e:
         logger.error(f"Export error: {str(e)}")
         return jsonify({"error": f"Failed to export data: {str(e)}"}), 500
 
 
+@lru_cache(maxsize=2)
+def _config_json(debug: bool) -> Tuple[str, str]:
+    """
+    Build and encode the configuration document served by /api/config.
+
+    Everything in it is fixed for the life of the process except the debug
+    flag, which is only known once the app runs, so the encoded document
+    is memoized per flag value.
+
+    Args:
+        debug: Whether the app is running in debug mode.
+
+    Returns:
+        The configuration as a JSON string and its content-hash ETag.
+    """
+    config = {
+        "backend": {
+            "version": "1.0.0",
+            "environment": os.environ.get("FLASK_ENV", "development"),
+            "debug": debug,
+        },
+        "database": {
+            "type": "AllegroGraph",
+            "url": AGRAPH_URL,
+            "repository": AGRAPH_REPO,
+            "connected": bool(AGRAPH_URL and AGRAPH_REPO),
+        },
+        "features": {
+            "sparql_endpoint": True,
+            "progress_tracking": True,
+            "file_upload": True,
+            "analytics": True,
+            "export": True,
+        },
+        "paths": {
+            "input_directory": get_default_input_dir(),
+            "output_directory": "output",
+            "logs_directory": "logs",
+        },
+    }
+    body = app.json.dumps(config)
+    return body, hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+
+
 @app.route("/api/config", methods=["GET"])
 def get_config() -> Any:
     """
@@ -2624,50 +3488,54 @@ def get_config() -> Any:
         JSON response with configuration details.
     """
     try:
-        config = {
-            "backend": {
-                "version": "1.0.0",
-                "environment": os.environ.get("FLASK_ENV", "development"),
-                "debug": app.debug,
-            },
-            "database": {
-                "type": "AllegroGraph",
-                "url": AGRAPH_URL,
-                "repository": AGRAPH_REPO,
-                "connected": bool(AGRAPH_URL and AGRAPH_REPO),
-            },
-            "features": {
-                "sparql_endpoint": True,
-                "progress_tracking": True,
-                "file_upload": True,
-                "analytics": True,
-                "export": True,
-            },
-            "paths": {
-                "input_directory": os.environ.get(
-                    "DEFAULT_INPUT_DIR", "~/downloads/repos/Thinkster/"
-                ),
-                "output_directory": "output",
-                "logs_directory": "logs",
-            },
-        }
-
-        return jsonify(config)
+        body, etag = _config_json(app.debug)
+        response = Response(body, mimetype="application/json")
+        response.set_etag(etag)
+        # Fixed for the life of the process, so browsers may keep it a while
+        response.cache_control.max_age = 3600
+        return response.make_conditional(request)
 
     except Exception as e:
         logger.error(f"Config error: {str(e)}")
         return jsonify({"error": f"Failed to get config: {str(e)}"}), 500
 
 
+@app.route("/api/cache/stats", methods=["GET"])
+def cache_stats() -> Any:
+    """
+    Get statistics for the dashboard SPARQL result cache.
+
+    Returns:
+        JSON response with cache size, limits, hit/miss counts and graph version.
+    """
+    return jsonify(get_sparql_cache_stats())
+
+
+@app.route("/api/cache/clear", methods=["POST"])
+def cache_clear() -> Any:
+    """
+    Drop all cached SPARQL results and cached endpoint responses.
+
+    Returns:
+        JSON response with the cache statistics after clearing.
+    """
+    clear_sparql_cache()
+    cache.clear()
+    return jsonify(get_sparql_cache_stats())
+
+
 @app.route("/api/dashboard_stats", methods=["GET"])
 def dashboard_stats_route():
-    return dashboard_stats()
+    # Conditional handling happens outside the cached function so a 304 is
+    # never stored as the cached response. When the cached copy expires,
+    # concurrent requests wait for one rebuild instead of each running it
+    response = _single_flight("dashboard_stats", dashboard_stats)
+    if response.get_etag()[0]:
+        # Matches the server-side cache timeout; fallback defaults carry no
+        # ETag and are not cached by the browser
+        response.cache_control.max_age = 60
+    return response.make_conditional(request)
 
 
 if __name__ == "__main__":
-    # Read host, port, and debug mode from environment variables, with sensible defaults
-    host = os.environ.get("API_HOST", "127.0.0.1")
-    port = int(os.environ.get("API_PORT", 8000))
-    debug = os.environ.get("API_DEBUG", "true").lower() == "true"
-
-    app.run(host=host, port=port, debug=debug)
+    app.run(host=API_HOST, port=API_PORT, debug=API_DEBUG)
@@ -1,26 +1,59 @@
 """Configuration constants and paths for Semantic Web KMS."""
 
 import os
+from functools import lru_cache
+from pathlib import Path
 
-# Always resolve project root as the parent of the 'app' directory
-APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if os.path.basename(APP_ROOT) == "app":
-    APP_ROOT = os.path.dirname(APP_ROOT)
-OUTPUT_DIR = os.path.join(APP_ROOT, "output")
-LOGS_DIR = os.path.join(APP_ROOT, "logs")
+# Project root: config.py lives in <root>/app/core/. Module paths are
+# already absolute, so the parents are taken lexically without touching the
+# filesystem; abspath (a getcwd call) only covers a relative __file__
+_CONFIG_FILE = __file__ if os.path.isabs(__file__) else os.path.abspath(__file__)
+APP_ROOT_PATH = Path(_CONFIG_FILE).parents[2]
+# String form for os.path callers, converted once
+APP_ROOT = str(APP_ROOT_PATH)
+
+# Every path below is a fixed name under a known directory, so it is built
+# by plain concatenation rather than a separator-checking os.path.join
+OUTPUT_DIR = f"{APP_ROOT}{os.sep}output"
+LOGS_DIR = f"{APP_ROOT}{os.sep}logs"
 
 # Main directories
-MAPPINGS_DIR = os.path.join(APP_ROOT, "mappings")
-ONTOLOGIES_DIR = os.path.join(APP_ROOT, "ontologies")
+MAPPINGS_DIR = f"{APP_ROOT}{os.sep}mappings"
+ONTOLOGIES_DIR = f"{APP_ROOT}{os.sep}ontologies"
 
 # Mapping/config files
-LANGUAGE_MAPPING_PATH = os.path.join(MAPPINGS_DIR, "language_mapping.json")
-CODE_QUERIES_PATH = os.path.join(MAPPINGS_DIR, "code_queries.json")
-CARRIER_TYPES_PATH = os.path.join(MAPPINGS_DIR, "carrier_types.json")
-EXCLUDED_DIRECTORIES_PATH = os.path.join(MAPPINGS_DIR, "excluded_directories.json")
-CONTENT_TYPES_PATH = os.path.join(MAPPINGS_DIR, "content_types.json")
-WEB_DEV_ONTOLOGY_PATH = os.path.join(ONTOLOGIES_DIR, "wdo.owl")
-BASIC_FORMAL_ONTOLOGY_PATH = os.path.join(ONTOLOGIES_DIR, "bfo.owl")
+LANGUAGE_MAPPING_PATH = f"{MAPPINGS_DIR}{os.sep}language_mapping.json"
+CODE_QUERIES_PATH = f"{MAPPINGS_DIR}{os.sep}code_queries.json"
+CARRIER_TYPES_PATH = f"{MAPPINGS_DIR}{os.sep}carrier_types.json"
+EXCLUDED_DIRECTORIES_PATH = f"{MAPPINGS_DIR}{os.sep}excluded_directories.json"
+CONTENT_TYPES_PATH = f"{MAPPINGS_DIR}{os.sep}content_types.json"
+WEB_DEV_ONTOLOGY_PATH = f"{ONTOLOGIES_DIR}{os.sep}wdo.owl"
+BASIC_FORMAL_ONTOLOGY_PATH = f"{ONTOLOGIES_DIR}{os.sep}bfo.owl"
 
 # Ontology cache filename (for use in paths)
 ONTOLOGY_CACHE_FILENAME = "ontology_cache.json"
+
+# Named graph holding the dashboard analytics precomputed by the API server.
+# Ingestion drops it, since its aggregates describe the previous graph
+DASHBOARD_AGGREGATES_GRAPH = "urn:dashboard:materialized"
+
+# API server bind address and debug mode, read once at import
+API_HOST = os.environ.get("API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("API_PORT", 8000))
+API_DEBUG = os.environ.get("API_DEBUG", "true").lower() == "true"
+
+
+@lru_cache(maxsize=1)
+def get_default_input_dir() -> str:
+    """
+    Return the directory analysed when a request names none.
+
+    Read from DEFAULT_INPUT_DIR on first use, with ``~`` expanded, so the
+    home directory lookup is skipped by processes that never need it.
+
+    Returns:
+        str: The default input directory.
+    """
+    return os.path.expanduser(
+        os.environ.get("DEFAULT_INPUT_DIR", "~/downloads/repos/Thinkster/")
+    )
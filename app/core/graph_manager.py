@@ -1,13 +1,59 @@
 """Graph management utilities for RDF graphs and ontologies."""
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from rdflib import Graph
+from rdflib import Graph, URIRef, plugin
+from rdflib.serializer import Serializer
+
+# oxrdflib registers a Rust-backed "Oxigraph" rdflib store; without it the
+# default in-memory store is used
+try:
+    import oxrdflib  # noqa: F401
+
+    GRAPH_STORE = "Oxigraph"
+except ImportError:
+    GRAPH_STORE = "default"
+
+# Native oxrdflib serializers used in place of rdflib's when the graph lives
+# in the Oxigraph store
+_OXIGRAPH_FORMATS = {
+    "turtle": "ox-turtle",
+    "ttl": "ox-turtle",
+    "nt": "ox-ntriples",
+    "ntriples": "ox-ntriples",
+}
+# Output buffer for serialization; serializers write many small rows
+SERIALIZE_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=16)
+def _namespace_bindings(
+    namespaces: Tuple[Tuple[str, Any], ...],
+) -> Tuple[Tuple[str, URIRef], ...]:
+    """
+    Return the prefix bindings a new graph ends up with for some namespaces.
+
+    Binds them on a throwaway graph once, including rdflib's default
+    prefixes and any renaming rdflib applies to clashing prefixes, so later
+    graphs for the same namespaces can copy the result.
+
+    Args:
+        namespaces (Tuple[Tuple[str, Any], ...]): (prefix, namespace) pairs to bind.
+    Returns:
+        Tuple[Tuple[str, URIRef], ...]: The resulting (prefix, namespace) bindings.
+    """
+    prototype = Graph()
+    for prefix, ns in namespaces:
+        prototype.bind(prefix, ns)
+    return tuple(prototype.namespaces())
 
 
 class GraphManager:
     """Manage an RDF graph using the provided ontology."""
 
+    __slots__ = ("ontology", "graph", "_stats")
+
     def __init__(self, ontology: Any) -> None:
         """
         Initialize the GraphManager with an ontology and bind its namespaces.
@@ -18,9 +64,14 @@ class GraphManager:
             AttributeError: If the ontology does not have a 'namespaces' attribute.
         """
         self.ontology = ontology
-        self.graph = Graph()
-        for prefix, ns in ontology.namespaces.items():
-            self.graph.bind(prefix, ns)
+        # Copy prebuilt bindings into the store rather than binding rdflib's
+        # default prefixes and the ontology's one by one for every graph
+        self.graph = Graph(store=GRAPH_STORE, bind_namespaces="none")
+        store = self.graph.store
+        for prefix, ns in _namespace_bindings(tuple(ontology.namespaces.items())):
+            store.bind(prefix, ns)
+        # Counts from the last stats() call, dropped whenever a triple is added
+        self._stats: Optional[Dict[str, int]] = None
 
     def add_triple(self, s: Any, p: Any, o: Any) -> None:
         """
@@ -36,11 +87,34 @@ class GraphManager:
             TypeError: If the triple is not valid for rdflib.Graph.add().
         """
         self.graph.add((s, p, o))
+        self._stats = None
+
+    def add_triples(self, triples: Iterable[Tuple[Any, Any, Any]]) -> None:
+        """
+        Add many triples to the graph in one call.
+
+        Hands the triples to rdflib's bulk ``addN`` so the store sees a
+        single loop instead of one ``add`` call per triple.
+
+        Args:
+            triples (Iterable[Tuple[Any, Any, Any]]): (subject, predicate, object) rdflib terms.
+        Returns:
+            None
+        Raises:
+            TypeError: If a triple is not valid for rdflib.Graph.addN().
+        """
+        graph = self.graph
+        graph.addN((s, p, o, graph) for s, p, o in triples)
+        self._stats = None
 
     def serialize(self, path: str, fmt: str = "turtle") -> None:
         """
         Serialize the graph to a file in the specified format.
 
+        The serializer streams into a large write buffer rather than building
+        the output in memory. Turtle and N-Triples go through oxrdflib's
+        native serializers when the graph uses the Oxigraph store.
+
         Args:
             path (str): The file path to serialize the graph to.
             fmt (str, optional): The serialization format (default: "turtle").
@@ -49,18 +123,36 @@ class GraphManager:
         Raises:
             Exception: If serialization fails or the format is not supported by rdflib.
         """
-        self.graph.serialize(destination=path, format=fmt)
+        if GRAPH_STORE == "Oxigraph":
+            fmt = _OXIGRAPH_FORMATS.get(fmt, fmt)
+        # Resolve the serializer first so an unknown format leaves no file
+        plugin.get(fmt, Serializer)
+        with open(path, "wb", buffering=SERIALIZE_BUFFER_SIZE) as f:
+            self.graph.serialize(destination=f, format=fmt, encoding="utf-8")
 
     def stats(self) -> Dict[str, int]:
         """
         Return statistics about the graph, including triple, subject, predicate, and object counts.
 
+        The counts are computed once and reused until triples are next added
+        through this manager; changes made to ``self.graph`` directly are not tracked.
+
         Returns:
             Dict[str, int]: A dictionary with counts of total triples, subjects, predicates, and objects.
         """
-        return {
-            "total_triples": len(self.graph),
-            "subjects": len(set(self.graph.subjects())),
-            "predicates": len(set(self.graph.predicates())),
-            "objects": len(set(self.graph.objects())),
-        }
+        if self._stats is None:
+            # One pass over the triples instead of one per term position
+            subjects, predicates, objects = set(), set(), set()
+            total = 0
+            for s, p, o in self.graph:
+                subjects.add(s)
+                predicates.add(p)
+                objects.add(o)
+                total += 1
+            self._stats = {
+                "total_triples": total,
+                "subjects": len(subjects),
+                "predicates": len(predicates),
+                "objects": len(objects),
+            }
+        return dict(self._stats)
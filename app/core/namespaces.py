@@ -1,18 +1,70 @@
 """Namespace definitions for Semantic Web KMS ontologies."""
 
-from rdflib import Namespace
+from rdflib import Namespace, URIRef
 from rdflib.namespace import SKOS as RDFlibSKOS
 
+
+class CachedNamespace(Namespace):
+    """
+    Namespace that builds each attribute term once.
+
+    rdflib's Namespace builds a new URIRef on every ``NS.Term`` access. Here
+    the first access stores the term on the instance, so later accesses are
+    plain attribute lookups. Only attribute access is cached, which keeps
+    the cache bounded by the names written in code.
+    """
+
+    def __getattr__(self, name: str) -> URIRef:
+        """
+        Build the term for ``name`` and keep it for later lookups.
+
+        Args:
+            name (str): The local name of the term.
+
+        Returns:
+            URIRef: The namespace IRI followed by ``name``.
+        """
+        term = super().__getattr__(name)
+        setattr(self, name, term)
+        return term
+
+
 # Web Development Ontology namespace
-WDO = Namespace("http://web-development-ontology.netlify.app/wdo#")
-# Instance namespace
+WDO = CachedNamespace("http://web-development-ontology.netlify.app/wdo#")
+# Instance namespace; its terms are built from data, so they are not cached
 INST = Namespace("http://web-development-ontology.netlify.app/wdo/instances/")
+INST_PREFIX = str(INST)
 # SKOS namespace (standard)
 SKOS = RDFlibSKOS
 # Dublin Core Terms namespace
-DCTERMS = Namespace("http://purl.org/dc/terms/")
+DCTERMS = CachedNamespace("http://purl.org/dc/terms/")
 # FOAF namespace (Friend of a Friend)
-FOAF = Namespace("http://xmlns.com/foaf/0.1/")
+FOAF = CachedNamespace("http://xmlns.com/foaf/0.1/")
 FOAF_PERSON_URI = FOAF.Person
 
-__all__ = ["WDO", "INST", "SKOS", "FOAF", "FOAF_PERSON_URI"]
+
+def inst_uri(local_name: str) -> URIRef:
+    """
+    Mint an instance URI by appending a local name to the INST prefix.
+
+    Equivalent to ``INST[local_name]`` without the Namespace method calls,
+    for extractors that mint URIs in tight loops.
+
+    Args:
+        local_name (str): The already URI-safe local part of the instance IRI.
+
+    Returns:
+        URIRef: The instance URI.
+    """
+    return URIRef(INST_PREFIX + local_name)
+
+
+__all__ = [
+    "WDO",
+    "INST",
+    "INST_PREFIX",
+    "SKOS",
+    "FOAF",
+    "FOAF_PERSON_URI",
+    "inst_uri",
+]
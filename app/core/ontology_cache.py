@@ -1,14 +1,39 @@
 """Ontology cache utilities for loading and accessing WDO ontology data."""
 
 import json
-from typing import Any, Dict, List, Optional, cast
+import sys
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, cast
 
 from app.core.paths import get_ontology_cache_path
 
+# orjson is optional; the stdlib json module parses the cache without it
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Cache entries holding lists of class or property names
+_NAME_LIST_KEYS = (
+    "classes",
+    "object_properties",
+    "data_properties",
+    "annotation_properties",
+)
+
 
 class OntologyCache:
     """A cache for WDO ontology classes and properties loaded from the JSON file."""
 
+    __slots__ = (
+        "cache_path",
+        "_cache",
+        "_all_properties_set",
+        "_classes_set",
+        "_extraction_properties",
+        "_extraction_classes",
+        "_wdo",
+    )
+
     def __init__(self, cache_path: Optional[str] = None):
         """
         Initialize the ontology cache and load data from a JSON file.
@@ -25,6 +50,14 @@ class OntologyCache:
 
         self.cache_path = cache_path
         self._cache: Dict[str, Any] = {}
+        # Name sets for membership tests, rebuilt whenever the cache is loaded
+        self._all_properties_set: FrozenSet[str] = frozenset()
+        self._classes_set: FrozenSet[str] = frozenset()
+        # Name tuples handed out by get_extraction_properties/classes
+        self._extraction_properties: Tuple[str, ...] = ()
+        self._extraction_classes: Tuple[str, ...] = ()
+        # Parsed WDO ontology, loaded on first use by the cache builders
+        self._wdo: Optional[Any] = None
         self._load_cache()
 
     def _load_cache(self):
@@ -36,12 +69,32 @@ class OntologyCache:
             ValueError: If the cache file contains invalid JSON.
         """
         try:
-            with open(self.cache_path, "r") as f:
-                self._cache = json.load(f)
+            with open(self.cache_path, "rb") as f:
+                data = f.read()
+            # orjson's JSONDecodeError subclasses json.JSONDecodeError
+            if orjson is not None:
+                self._cache = orjson.loads(data)
+            else:
+                self._cache = json.loads(data)
         except FileNotFoundError:
             raise FileNotFoundError(f"Ontology cache file not found: {self.cache_path}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in ontology cache file: {e}")
+        # Names are compared against caller strings on every lookup; interned
+        # copies let equal names compare by identity
+        for key in _NAME_LIST_KEYS:
+            names = self._cache.get(key)
+            if isinstance(names, list):
+                self._cache[key] = [
+                    sys.intern(name) if isinstance(name, str) else name
+                    for name in names
+                ]
+        self._all_properties_set = frozenset(self.all_properties)
+        self._classes_set = frozenset(self.classes)
+        self._extraction_properties = tuple(
+            self.object_properties + self.data_properties
+        )
+        self._extraction_classes = tuple(self.classes)
 
     @property
     def classes(self) -> List[str]:
@@ -99,43 +152,52 @@ class OntologyCache:
             self.object_properties + self.data_properties + self.annotation_properties
         )
 
-    def get_property_cache(self, property_names: List[str]) -> Dict[str, Any]:
+    def _get_wdo_ontology(self) -> Any:
+        """
+        Return the WDO ontology, parsing the OWL file only on first use.
+
+        Returns:
+            WDOOntology: The shared ontology instance for this cache.
+        """
+        if self._wdo is None:
+            from app.ontology.wdo import WDOOntology
+
+            self._wdo = WDOOntology()
+        return self._wdo
+
+    def get_property_cache(self, property_names: Sequence[str]) -> Dict[str, Any]:
         """
         Create a property cache for the given property names.
 
         Args:
-            property_names (List[str]): List of property names to include in the cache.
+            property_names (Sequence[str]): Property names to include in the cache.
         Returns:
             Dict[str, Any]: Dictionary mapping property names to their ontology objects.
         """
-        from app.ontology.wdo import WDOOntology
-
-        ontology = WDOOntology()
+        ontology = self._get_wdo_ontology()
         cache: Dict[str, Any] = {}
 
         for prop_name in property_names:
-            if prop_name in self.all_properties:
+            if prop_name in self._all_properties_set:
                 prop_obj = ontology.get_property(prop_name)
                 cache[prop_name] = prop_obj
 
         return cache
 
-    def get_class_cache(self, class_names: List[str]) -> Dict[str, Any]:
+    def get_class_cache(self, class_names: Sequence[str]) -> Dict[str, Any]:
         """
         Create a class cache for the given class names.
 
         Args:
-            class_names (List[str]): List of class names to include in the cache.
+            class_names (Sequence[str]): Class names to include in the cache.
         Returns:
             Dict[str, Any]: Dictionary mapping class names to their ontology objects.
         """
-        from app.ontology.wdo import WDOOntology
-
-        ontology = WDOOntology()
+        ontology = self._get_wdo_ontology()
         cache: Dict[str, Any] = {}
 
         for class_name in class_names:
-            if class_name in self.classes:
+            if class_name in self._classes_set:
                 class_obj = ontology.get_class(class_name)
                 cache[class_name] = class_obj
 
@@ -151,7 +213,7 @@ class OntologyCache:
             Dict[str, bool]: Dictionary mapping property names to their validation status (True if exists).
         """
         validation: Dict[str, bool] = {}
-        all_props = self.all_properties
+        all_props = self._all_properties_set
 
         for prop_name in property_names:
             validation[prop_name] = prop_name in all_props
@@ -170,7 +232,7 @@ class OntologyCache:
         validation: Dict[str, bool] = {}
 
         for class_name in class_names:
-            validation[class_name] = class_name in self.classes
+            validation[class_name] = class_name in self._classes_set
 
         return validation
 
@@ -192,23 +254,25 @@ def get_ontology_cache() -> OntologyCache:
     return _ontology_cache
 
 
-def get_extraction_properties() -> List[str]:
+def get_extraction_properties() -> Tuple[str, ...]:
     """
     Return all object and data properties from the ontology cache.
 
+    The tuple is built once when the cache loads and shared by all callers.
+
     Returns:
-        List[str]: List of all object and data property names.
+        Tuple[str, ...]: All object and data property names.
     """
-    cache = get_ontology_cache()
-    return cache.object_properties + cache.data_properties
+    return get_ontology_cache()._extraction_properties
 
 
-def get_extraction_classes() -> List[str]:
+def get_extraction_classes() -> Tuple[str, ...]:
     """
     Return all classes from the ontology cache.
 
+    The tuple is built once when the cache loads and shared by all callers.
+
     Returns:
-        List[str]: List of all class names.
+        Tuple[str, ...]: All class names.
     """
-    cache = get_ontology_cache()
-    return cache.classes
+    return get_ontology_cache()._extraction_classes
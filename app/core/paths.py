@@ -2,6 +2,7 @@
 
 import os
 import re
+from functools import lru_cache
 from typing import Optional
 
 from app.core.config import (
@@ -20,6 +21,21 @@ from app.core.config import (
 
 _current_input_dir: Optional[str] = None
 
+# Characters replaced by uri_safe_string (slashes kept for paths) and by
+# uri_safe_file_path within a single path component
+_URI_UNSAFE = re.compile(r"[^\w\-./]")
+_URI_UNSAFE_COMPONENT = re.compile(r"[^\w\-.]")
+_MULTI_UNDERSCORE = re.compile(r"_+")
+
+# ASCII input is sanitized with str.translate, derived from the patterns
+# above; only non-ASCII text (where \w is Unicode-aware) needs the regex
+_URI_UNSAFE_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if _URI_UNSAFE.match(c)}
+)
+_URI_UNSAFE_COMPONENT_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if _URI_UNSAFE_COMPONENT.match(c)}
+)
+
 
 def set_input_dir(path: str) -> None:
     """
@@ -183,6 +199,12 @@ def get_ontology_cache_path() -> str:
     return os.path.join(MAPPINGS_DIR, ONTOLOGY_CACHE_FILENAME)
 
 
+# Entity names and repository paths recur throughout an extraction run, so
+# the sanitizers are memoized. The public functions stay uncached and coerce
+# their argument with str() first, so the cache only ever sees hashable keys
+URI_SAFE_CACHE_SIZE = 65536
+
+
 def uri_safe_string(text: str) -> str:
     """
     Convert a string to URI-safe format by replacing problematic characters with underscores.
@@ -195,20 +217,36 @@ def uri_safe_string(text: str) -> str:
     """
     if not text:
         return ""
+    return _uri_safe_string(str(text))
+
 
+@lru_cache(maxsize=URI_SAFE_CACHE_SIZE)
+def _uri_safe_string(text: str) -> str:
+    """
+    Sanitize a non-empty string for uri_safe_string.
+
+    Args:
+        text (str): The input string to convert.
+
+    Returns:
+        str: The URI-safe version of the input string.
+    """
     # Replace spaces and other problematic characters with underscores
     # This includes: spaces, tabs, newlines, and other whitespace
     # Also includes: \, :, *, ?, ", <, >, |, and other filesystem-incompatible chars
     # Note: We preserve forward slashes for file paths
-    uri_safe = re.sub(r"[^\w\-./]", "_", str(text))
+    if text.isascii():
+        uri_safe = text.translate(_URI_UNSAFE_TABLE)
+    else:
+        uri_safe = _URI_UNSAFE.sub("_", text)
 
-    # Replace multiple consecutive underscores with a single one
-    uri_safe = re.sub(r"_+", "_", uri_safe)
+    # Replace multiple consecutive underscores with a single one; most
+    # names have none, which a substring check finds without the regex
+    if "__" in uri_safe:
+        uri_safe = _MULTI_UNDERSCORE.sub("_", uri_safe)
 
     # Remove leading/trailing underscores
-    uri_safe = re.sub(r"(^_+|_+$)", "", uri_safe)
-
-    return uri_safe
+    return uri_safe.strip("_")
 
 
 def uri_safe_file_path(file_path: str) -> str:
@@ -223,7 +261,20 @@ def uri_safe_file_path(file_path: str) -> str:
     """
     if not file_path:
         return ""
+    return _uri_safe_file_path(str(file_path))
+
+
+@lru_cache(maxsize=URI_SAFE_CACHE_SIZE)
+def _uri_safe_file_path(file_path: str) -> str:
+    """
+    Sanitize a non-empty file path for uri_safe_file_path.
 
+    Args:
+        file_path (str): The file path to convert.
+
+    Returns:
+        str: The URI-safe version of the file path with preserved directory structure.
+    """
     # Split the path into components
     path_components = file_path.split("/")
 
@@ -232,12 +283,15 @@ def uri_safe_file_path(file_path: str) -> str:
     for component in path_components:
         if component:
             # Replace problematic characters in each component, but preserve dots
-            safe_component = re.sub(r"[^\w\-.]", "_", component)
+            if component.isascii():
+                safe_component = component.translate(_URI_UNSAFE_COMPONENT_TABLE)
+            else:
+                safe_component = _URI_UNSAFE_COMPONENT.sub("_", component)
             # Replace multiple consecutive underscores with a single one
-            safe_component = re.sub(r"_+", "_", safe_component)
+            if "__" in safe_component:
+                safe_component = _MULTI_UNDERSCORE.sub("_", safe_component)
             # Remove leading/trailing underscores
-            safe_component = re.sub(r"(^_+|_+$)", "", safe_component)
-            safe_components.append(safe_component)
+            safe_components.append(safe_component.strip("_"))
 
     # Rejoin with forward slashes
     return "/".join(safe_components)
@@ -12,7 +12,7 @@ from rdflib.namespace import RDF, RDFS, XSD
 from rich.console import Console
 from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
 
-from app.core.namespaces import FOAF_PERSON_URI, INST
+from app.core.namespaces import FOAF_PERSON_URI, inst_uri
 from app.core.ontology_cache import (
     get_extraction_classes,
     get_extraction_properties,
@@ -84,7 +84,7 @@ class ContributorRegistry:
         if normalized_name not in self._contributor_uris:
             # Create a new URI for this contributor
             safe_name = uri_safe_string(normalized_name)
-            contributor_uri = URIRef(f"{INST[f'contributor_{safe_name}']}")
+            contributor_uri = inst_uri(f"contributor_{safe_name}")
             self._contributor_uris[normalized_name] = contributor_uri
         return self._contributor_uris[normalized_name]
 
@@ -134,7 +134,7 @@ def get_repo_uri(repo_name: str) -> URIRef:
     Returns:
         URIRef for the repository.
     """
-    return URIRef(f"{INST[uri_safe_string(repo_name)]}")
+    return inst_uri(uri_safe_string(repo_name))
 
 
 def get_file_uri(repo_name: str, file_path: str) -> URIRef:
@@ -149,7 +149,7 @@ def get_file_uri(repo_name: str, file_path: str) -> URIRef:
     """
     repo_enc = uri_safe_string(repo_name)
     path_enc = uri_safe_file_path(file_path)
-    return URIRef(f"{INST[f'{repo_enc}/{path_enc}']}")
+    return inst_uri(f"{repo_enc}/{path_enc}")
 
 
 def get_commit_uri(repo_name: str, commit_hash: str) -> URIRef:
@@ -164,7 +164,7 @@ def get_commit_uri(repo_name: str, commit_hash: str) -> URIRef:
     """
     repo_enc = uri_safe_string(repo_name)
     hash_enc = uri_safe_string(commit_hash)
-    return URIRef(f"{INST[f'{repo_enc}/commit/{hash_enc}']}")
+    return inst_uri(f"{repo_enc}/commit/{hash_enc}")
 
 
 def get_commit_message_uri(repo_name: str, commit_hash: str) -> URIRef:
@@ -179,7 +179,7 @@ def get_commit_message_uri(repo_name: str, commit_hash: str) -> URIRef:
     """
     repo_enc = uri_safe_string(repo_name)
     hash_enc = uri_safe_string(commit_hash)
-    return URIRef(f"{INST[f'{repo_enc}/commit/{hash_enc}_msg']}")
+    return inst_uri(f"{repo_enc}/commit/{hash_enc}_msg")
 
 
 def get_issue_uri(repo_name: str, issue_id: str) -> URIRef:
@@ -194,7 +194,7 @@ def get_issue_uri(repo_name: str, issue_id: str) -> URIRef:
     """
     repo_enc = uri_safe_string(repo_name)
     issue_enc = uri_safe_string(issue_id)
-    return URIRef(str(INST[f"{repo_enc}/issue/{issue_enc}"]))
+    return inst_uri(f"{repo_enc}/issue/{issue_enc}")
 
 
 def extract_issue_references(message: str) -> List[str]:
@@ -6,7 +6,7 @@ from typing import Any, Set
 from rdflib import Graph, Literal, Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, XSD
 
-from app.core.namespaces import INST, WDO
+from app.core.namespaces import INST, WDO, inst_uri
 from app.core.paths import uri_safe_file_path, uri_safe_string
 
 
@@ -171,7 +171,7 @@ def add_file_triples(
     path_clean = record.path.replace(" ", "_")
     repo_enc = uri_safe_string(repo_clean)
     path_enc = uri_safe_file_path(path_clean)
-    file_uri = INST[f"{repo_enc}/{path_enc}"]
+    file_uri = inst_uri(f"{repo_enc}/{path_enc}")
     wdo_class_uri = record.class_uri
     if repo_enc not in processed_repos:
         add_repository_metadata(g, repo_enc, repo_name, input_dir, processed_repos)
@@ -58,6 +58,8 @@ if args.input_dir:
 # Now import the rest
 # Remove: from typing import List (duplicate)
 
+from app.core.config import DASHBOARD_AGGREGATES_GRAPH
+
 # Paths
 from app.core.paths import get_output_path
 
@@ -65,9 +67,6 @@ from app.core.paths import get_output_path
 from app.core.progress_tracker import get_current_tracker
 from app.triplestore.agraph_connection import AllegroGraphRESTClient
 
-APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if os.path.basename(APP_ROOT) == "app":
-    APP_ROOT = os.path.dirname(APP_ROOT)
 # Remove all assignments to OUTPUT_DIR and TTL_PATH
 EXTRACTION_CMD = [sys.executable, "-m", "app.extraction.main_extractor"]
 ANNOTATION_CMD = [sys.executable, "-m", "app.annotation.semantic_annotator"]
@@ -264,6 +263,11 @@ def upload_ttl_to_allegrograph(ttl_path: str) -> None:
     try:
         with AllegroGraphRESTClient() as client:
             success = client.upload_ttl_file(ttl_path)
+            # The dashboard aggregates describe the previous graph. Without
+            # them the API server computes analytics live until it stores
+            # new ones
+            if success and not client.drop_graph(DASHBOARD_AGGREGATES_GRAPH):
+                logger.warning("Could not drop stale dashboard aggregates")
 
         if not success:
             error_msg = "Upload to AllegroGraph failed"
@@ -25,6 +25,7 @@ class AllegroGraphRESTClient:
         self.auth = HTTPBasicAuth(self.username, self.password)
         self.session = requests.Session()
         self.session.auth = self.auth
+        self.statements_url = self.repo_url.rstrip("/") + "/statements"
         print(f"REST client initialized for repository: {self.repo_url}")
 
     def upload_ttl_file(self, file_path):
@@ -44,8 +45,7 @@ class AllegroGraphRESTClient:
             print(f"Error: File not found at '{file_path}'")
             return False
 
-        repo_url: str = self.repo_url  # type: ignore
-        statements_url = repo_url.rstrip("/") + "/statements"
+        statements_url = self.statements_url
         headers = {"Content-Type": "application/x-turtle"}
 
         print(f"Uploading '{os.path.basename(file_path)}' to {statements_url}...")
@@ -66,6 +66,31 @@ class AllegroGraphRESTClient:
             print(f"An error occurred during file upload: {e}")
             return False
 
+    def drop_graph(self, graph_uri):
+        """
+        Drop a named graph from the repository, if it exists.
+
+        Args:
+            graph_uri (str): IRI of the named graph to drop.
+
+        Returns:
+            bool: True if the store accepted the update, False otherwise.
+
+        Raises:
+            None. All exceptions are caught and logged; returns False on error.
+        """
+        try:
+            response = self.session.post(
+                self.repo_url,
+                data={"update": f"DROP SILENT GRAPH <{graph_uri}>"},
+                timeout=60,
+            )
+            response.raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            print(f"Failed to drop graph <{graph_uri}>: {e}")
+            return False
+
     def test_connection(self):
         """
         Test connection to the AllegroGraph statements endpoint.
@@ -78,7 +103,7 @@ class AllegroGraphRESTClient:
         Raises:
             None. All exceptions are caught and logged; returns (None, error_message) on error.
         """
-        statements_url = self.repo_url.rstrip("/") + "/statements"  # type: ignore
+        statements_url = self.statements_url
         try:
             resp = self.session.get(statements_url, timeout=30, verify=False)
             print(f"GET {statements_url} -> {resp.status_code}")
@@ -1,11 +1,15 @@
+import gzip
 import importlib.util
 import json
 import os
 import sys
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
 from flask import Flask
+from rdflib import Graph
 
 # Dynamically import the app from app/api/server.py
 spec = importlib.util.spec_from_file_location(
@@ -46,9 +50,9 @@ def test_dashboard_stats_success(client):
 
 def test_sparql_query_success(client):
     mock_sparql_result = {"results": {"bindings": [{"foo": {"value": "bar"}}]}}
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = mock_sparql_result
+        mock_post.return_value.content = json.dumps(mock_sparql_result).encode()
         response = client.post(
             "/api/sparql", json={"query": "SELECT * WHERE {?s ?p ?o}"}
         )
@@ -64,7 +68,7 @@ def test_sparql_query_missing_query(client):
 
 
 def test_sparql_query_error_response(client):
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.status_code = 500
         mock_post.return_value.text = "SPARQL error"
         response = client.post(
@@ -73,3 +77,965 @@ def test_sparql_query_error_response(client):
         assert response.status_code == 500
         data = response.get_json()
         assert "error" in data
+
+
+def test_dashboard_stats_etag_not_modified(client):
+    mock_response = {"results": {"bindings": [{"count": {"value": "5"}}]}}
+    with patch("server.run_dashboard_sparql", return_value=mock_response):
+        response = client.get("/api/dashboard_stats")
+        etag = response.headers.get("ETag")
+        assert etag
+        assert response.cache_control.max_age == 60
+        response = client.get("/api/dashboard_stats", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+def test_list_repositories_aggregated_query(client):
+    mock_response = {
+        "results": {
+            "bindings": [
+                {
+                    "repo": {"value": "http://example.org/repo1"},
+                    "name": {"value": "repo1"},
+                    "language": {"value": "python"},
+                    "avgComplexity": {"value": "2.5"},
+                    "files": {"value": "7"},
+                    "entityCount": {"value": "42"},
+                }
+            ]
+        }
+    }
+    with patch(
+        "server.run_dashboard_sparql", return_value=mock_response
+    ) as mock_sparql:
+        response = client.get("/api/repositories")
+        assert response.status_code == 200
+        data = response.get_json()
+        assert mock_sparql.call_count == 1
+        assert data[0]["language"] == "python"
+        assert data[0]["complexity"] == {"average": 2.5}
+        assert data[0]["files"] == 7
+        assert data[0]["contributors"] == 0
+        assert data[0]["entities"] == 42
+
+
+def test_run_dashboard_sparql_caches_results():
+    server.clear_sparql_cache()
+    mock_response = {"results": {"bindings": []}}
+    with patch(
+        "server._post_dashboard_sparql", return_value=mock_response
+    ) as mock_post:
+        with app.test_request_context("/api/repositories"):
+            assert server.run_dashboard_sparql("SELECT * WHERE {}") == mock_response
+            server.run_dashboard_sparql("SELECT * WHERE {}")
+        assert mock_post.call_count == 1
+        with app.test_request_context("/api/repositories?no_cache=1"):
+            server.run_dashboard_sparql("SELECT * WHERE {}")
+        assert mock_post.call_count == 2
+    server.clear_sparql_cache()
+
+
+def test_list_repositories_fallback_fetches_metrics_concurrently(client):
+    import requests
+
+    basic = {
+        "results": {
+            "bindings": [
+                {"repo": {"value": f"http://example.org/repo{i}"}} for i in range(3)
+            ]
+        }
+    }
+    files = {"results": {"bindings": [{"files": {"value": "4"}}]}}
+    entities = {
+        "results": {
+            "bindings": [
+                {
+                    "repo": {"value": "http://example.org/repo1"},
+                    "entityCount": {"value": "9"},
+                }
+            ]
+        }
+    }
+    empty = {"results": {"bindings": []}}
+
+    def fake_sparql(query):
+        if "?entityCount" in query and "GROUP BY ?repo ?name" in query:
+            raise requests.RequestException("aggregated query failed")
+        if "MAX(?mod)" in query:
+            return basic
+        if "?files" in query:
+            return files
+        if "?entityCount" in query:
+            return entities
+        return empty
+
+    with patch("server.run_dashboard_sparql", side_effect=fake_sparql) as mock_sparql:
+        response = client.get("/api/repositories")
+        data = response.get_json()
+        assert len(data) == 3
+        assert all(repo["files"] == 4 for repo in data)
+        assert all(repo["language"] == "Unknown" for repo in data)
+        assert all(repo["complexity"] == {"average": 0.0} for repo in data)
+        assert [repo["entities"] for repo in data] == [0, 9, 0]
+        # 1 aggregated attempt + 1 basic query + 5 metrics per repository
+        # + 1 batched entity count
+        assert mock_sparql.call_count == 2 + 3 * 5 + 1
+
+
+def test_get_organization_single_query(client):
+    org_id = "http://example.org/org1"
+    mock_response = {
+        "results": {
+            "bindings": [
+                {
+                    "name": {"value": "Org One"},
+                    "repo": {"value": f"http://example.org/repo{i}"},
+                    "totalFiles": {"value": "12"},
+                    "totalRelationships": {"value": "34"},
+                }
+                for i in range(2)
+            ]
+        }
+    }
+    with patch(
+        "server.run_dashboard_sparql", return_value=mock_response
+    ) as mock_sparql:
+        response = client.get(f"/api/organizations/{org_id}")
+        assert response.status_code == 200
+        data = response.get_json()
+        assert mock_sparql.call_count == 1
+        assert data["name"] == "Org One"
+        assert data["totalFiles"] == 12
+        assert data["totalRelations"] == 34
+        assert [repo["name"] for repo in data["repositories"]] == ["repo0", "repo1"]
+
+
+def test_graph_data_clamps_max_nodes(client):
+    mock_response = {"results": {"bindings": []}}
+    with patch(
+        "server.run_dashboard_sparql", return_value=mock_response
+    ) as mock_sparql:
+        response = client.get("/api/graph?maxNodes=1000000")
+        assert response.status_code == 200
+        query = mock_sparql.call_args[0][0]
+        assert query.rstrip().endswith(f"LIMIT {server.GRAPH_MAX_NODES}")
+
+
+def test_graph_data_edges_query_skips_invalid_uris(client):
+    nodes = {
+        "results": {
+            "bindings": [
+                {
+                    "entity": {"value": "http://example.org/a"},
+                    "entityType": {"value": "http://example.org/wdo#Repository"},
+                },
+                {
+                    "entity": {"value": "http://example.org/b> } ; DROP ALL"},
+                    "entityType": {"value": "http://example.org/wdo#File"},
+                },
+            ]
+        }
+    }
+    edges = {"results": {"bindings": []}}
+    with patch(
+        "server.run_dashboard_sparql", side_effect=[nodes, edges]
+    ) as mock_sparql:
+        response = client.get("/api/graph")
+        assert response.status_code == 200
+        edges_query = mock_sparql.call_args_list[1][0][0]
+        assert "<http://example.org/a>" in edges_query
+        assert "DROP ALL" not in edges_query
+
+
+@pytest.mark.parametrize(
+    "uri, expected",
+    [
+        ("http://example.org/repo", True),
+        ("https://example.org/a#b", True),
+        ("ftp://example.org/repo", False),
+        ("http://example.org/a b", False),
+        ("http://example.org/a>", False),
+        ("http://example.org/{a}", False),
+        ('http://example.org/"a', False),
+        ("http://example.org/a;", False),
+    ],
+)
+def test_is_valid_uri(uri, expected):
+    assert server.is_valid_uri(uri) is expected
+
+
+def test_jsonify_fast_round_trips():
+    with app.app_context():
+        response = server.jsonify_fast({"nodes": [1, 2], "name": "é"}, status=201)
+        assert response.status_code == 201
+        assert response.mimetype == "application/json"
+        assert json.loads(response.get_data()) == {"nodes": [1, 2], "name": "é"}
+
+
+def test_graph_data_node_and_edge_styles(client):
+    wdo = "http://web-development-ontology.netlify.app/wdo#"
+    nodes = {
+        "results": {
+            "bindings": [
+                {
+                    "entity": {"value": "http://example.org/repo"},
+                    "entityType": {"value": f"{wdo}Repository"},
+                },
+                {
+                    "entity": {"value": "http://example.org/thing"},
+                    "entityType": {"value": f"{wdo}Thing"},
+                },
+            ]
+        }
+    }
+    edges = {
+        "results": {
+            "bindings": [
+                {
+                    "source": {"value": "http://example.org/repo"},
+                    "target": {"value": "http://example.org/thing"},
+                    "relationship": {"value": f"{wdo}hasFile"},
+                }
+            ]
+        }
+    }
+    with patch("server.run_dashboard_sparql", side_effect=[nodes, edges]):
+        data = client.get("/api/graph").get_json()
+        styles = {n["id"]: (n["type"], n["size"], n["color"]) for n in data["nodes"]}
+        assert styles["http://example.org/repo"] == ("repository", 20, "#10b981")
+        assert styles["http://example.org/thing"] == ("concept", 10, "#3b82f6")
+        assert (data["edges"][0]["type"], data["edges"][0]["weight"]) == (
+            "contains",
+            1.0,
+        )
+
+
+def test_repositories_etag_not_modified(client):
+    mock_response = {"results": {"bindings": []}}
+    with patch("server.run_dashboard_sparql", return_value=mock_response):
+        response = client.get("/api/repositories")
+        etag = response.headers.get("ETag")
+        assert etag
+        assert response.headers.get("Cache-Control") == "max-age=30"
+        response = client.get("/api/repositories", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.get_data() == b""
+
+
+def test_fallback_payload_gets_no_etag(client):
+    with patch("server.run_dashboard_sparql", side_effect=RuntimeError("down")):
+        for path in ("/api/repositories", "/api/organizations"):
+            response = client.get(path, headers={"If-None-Match": "*"})
+            assert response.status_code == 200
+            assert response.get_json() == []
+            assert "ETag" not in response.headers
+            assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_repositories_org_filter_in_every_subselect(client):
+    mock_response = {"results": {"bindings": []}}
+    org = "http://example.org/org"
+    with patch(
+        "server.run_dashboard_sparql", return_value=mock_response
+    ) as mock_sparql:
+        client.get("/api/repositories", query_string={"organization": org})
+    query = mock_sparql.call_args.args[0]
+    restriction = f"VALUES ?org {{ <{org}> }} ?org wdo:hasRepository ?repo ."
+    assert query.count(restriction) == query.count("GROUP BY ?repo") == 7
+
+
+def test_search_binds_escaped_pattern_once(client):
+    mock_response = {"results": {"bindings": []}}
+    with patch(
+        "server.run_dashboard_sparql", return_value=mock_response
+    ) as mock_sparql:
+        response = client.get("/api/search", query_string={"query": '"\n'})
+        assert response.status_code == 200
+        query = mock_sparql.call_args[0][0]
+        assert 'VALUES ?q { "\\"\\\\\\n" }' in query
+        assert query.count("REGEX(") == 2
+        assert "REGEX(?name, ?q" in query
+
+
+def test_get_organizations_groups_repositories(client):
+    mock_response = {
+        "results": {
+            "bindings": [
+                {
+                    "org": {"value": "http://example.org/org1"},
+                    "name": {"value": "Org One"},
+                    "repo": {"value": "http://example.org/repo1"},
+                },
+                {
+                    "org": {"value": "http://example.org/org2"},
+                    "repo": {"value": "http://example.org/repo2"},
+                },
+                {
+                    "org": {"value": "http://example.org/org1"},
+                    "name": {"value": "Org One"},
+                    "repo": {"value": "http://example.org/repo3"},
+                },
+            ]
+        }
+    }
+    with patch("server.run_dashboard_sparql", return_value=mock_response):
+        data = client.get("/api/organizations").get_json()
+        assert [(o["name"], len(o["repositories"])) for o in data] == [
+            ("Org One", 2),
+            ("org2", 1),
+        ]
+
+
+def test_post_sparql_form_gzips_large_bodies():
+    import gzip
+
+    query = "SELECT * WHERE { ?s ?p ?o }" + " " * 2000
+    with patch.object(server, "AGRAPH_GZIP_REQUESTS", True), patch(
+        "requests.Session.post"
+    ) as mock_post:
+        server.post_sparql_form({"query": query}, "application/sparql-results+json")
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert b"SELECT" in gzip.decompress(kwargs["data"])
+        server.post_sparql_form({"query": "ASK {}"}, "application/sparql-results+json")
+        assert "Content-Encoding" not in mock_post.call_args.kwargs["headers"]
+
+
+def test_analytics_counts_single_query(client):
+    counts = {
+        "codebaseMetrics.totalRepositories": "2",
+        "codebaseMetrics.totalFiles": "10",
+        "entityDistribution.functions": "7",
+        "developmentMetrics.totalContributors": "3",
+    }
+    counts_response = {
+        "results": {
+            "bindings": [
+                {"bucket": {"value": bucket}, "count": {"value": count}}
+                for bucket, count in counts.items()
+            ]
+        }
+    }
+    empty = {"results": {"bindings": []}}
+
+    def fake_sparql(query):
+        return counts_response if "GROUP BY ?bucket" in query else empty
+
+    server.clear_sparql_cache()
+    with patch(
+        "server.run_dashboard_sparql", side_effect=fake_sparql
+    ) as mock_sparql, patch(
+        "server.run_dashboard_sparql_scalar", return_value=None
+    ) as mock_scalar:
+        data = client.get("/api/analytics").get_json()
+        assert data["codebaseMetrics"] == {
+            "totalRepositories": 2,
+            "totalFiles": 10,
+            "sourceCodeFiles": 0,
+            "documentationFiles": 0,
+            "assetFiles": 0,
+        }
+        assert data["entityDistribution"]["functions"] == 7
+        assert data["developmentMetrics"]["totalContributors"] == 3
+        assert data["assetMetrics"]["fontFiles"] == 0
+        # The materialized sections are missing, so one closure lookup, one
+        # count query and the language query, plus the three scalar
+        # complexity queries
+        assert mock_sparql.call_count == 4
+        assert mock_scalar.call_count == 3
+        queries = [c.args[0] for c in mock_sparql.call_args_list]
+        assert queries.count(server.SUBCLASS_CLOSURE_QUERY) == 1
+        assert queries[0] == server.MATERIALIZED_ANALYTICS_QUERY
+        assert not any(
+            "subClassOf*" in q for q in queries if q != server.SUBCLASS_CLOSURE_QUERY
+        )
+
+
+def test_cache_clear_route_invalidates_sparql_cache(client):
+    server.clear_sparql_cache()
+    mock_response = {"results": {"bindings": []}}
+    with patch("server._post_dashboard_sparql", return_value=mock_response):
+        with app.test_request_context("/api/analytics"):
+            server.run_dashboard_sparql("SELECT * WHERE {}")
+            server.run_dashboard_sparql("SELECT * WHERE {}")
+    stats = client.get("/api/cache/stats").get_json()
+    assert stats["size"] == 1
+    assert stats["hits"] >= 1
+    version = stats["graphVersion"]
+    stats = client.post("/api/cache/clear").get_json()
+    assert stats["size"] == 0
+    assert stats["graphVersion"] == version + 1
+
+
+def test_redis_cache_config_sets_key_prefix():
+    config = server._cache_config("redis://localhost:6379/0")
+    assert config["CACHE_TYPE"] == "RedisCache"
+    assert config["CACHE_KEY_PREFIX"] == "semantic-web-kms:"
+    assert "CACHE_KEY_PREFIX" not in server._cache_config(None)
+
+
+def test_entity_details_relationships_both_directions(client):
+    entity = {"results": {"bindings": [{"type": {"value": "wdo#Function"}}]}}
+
+    def fake_sparql(query):
+        if "?editorialNote" in query:
+            return entity
+        outgoing = "?relationshipType ?relatedEntity ." in query
+        related = "http://example.org/" + ("callee" if outgoing else "caller")
+        return {
+            "results": {
+                "bindings": [
+                    {
+                        "relatedEntity": {"value": related},
+                        "relationshipType": {"value": "wdo#invokes"},
+                    }
+                ]
+            }
+        }
+
+    with patch("server.run_dashboard_sparql", side_effect=fake_sparql):
+        data = client.get("/api/entities/f").get_json()
+        assert "file" not in data and "repository" not in data
+        assert [(r["entity"], r["direction"]) for r in data["relationships"]] == [
+            ("http://example.org/callee", "outgoing"),
+            ("http://example.org/caller", "incoming"),
+        ]
+
+
+def test_entity_details_rejects_unsafe_id(client):
+    with patch("server.run_dashboard_sparql") as mock_sparql:
+        response = client.get("/api/entities/a%3E%20%7D%20DROP%20ALL")
+        assert response.status_code == 400
+        mock_sparql.assert_not_called()
+
+
+def test_code_complexity_single_aggregation_query(client):
+    files = {
+        "results": {
+            "bindings": [
+                {
+                    "fileName": {"value": "a.py"},
+                    "totalComplexity": {"value": "12"},
+                    "avgComplexity": {"value": "4"},
+                    "functionCount": {"value": "3"},
+                    "lineCount": {"value": "40"},
+                    "tokenCount": {"value": "300"},
+                }
+            ]
+        }
+    }
+    empty = {"results": {"bindings": []}}
+
+    def fake_sparql(query):
+        return files if "GROUP BY ?fileName" in query else empty
+
+    with patch("server.run_dashboard_sparql", side_effect=fake_sparql) as mock_sparql:
+        data = client.get("/api/metrics/code-complexity").get_json()
+        assert data["files"] == [
+            {
+                "file": "a.py",
+                "complexity": 12.0,
+                "avgComplexity": 4.0,
+                "lines": 40,
+                "functions": 3,
+                "tokens": 300,
+            }
+        ]
+        assert data["highComplexityFiles"] == 1
+        grouped = [
+            c.args[0]
+            for c in mock_sparql.call_args_list
+            if "GROUP BY ?fileName" in c.args[0]
+        ]
+        assert len(grouped) == 1
+        assert grouped[0].count("SELECT") == 1
+
+
+def test_analytics_counts_query_inlines_subclass_closure():
+    root = f"{server._WDO_IRI}Repository"
+    closure_response = {
+        "results": {
+            "bindings": [
+                {"root": {"value": root}, "class": {"value": root}},
+                {
+                    "root": {"value": root},
+                    "class": {"value": "http://example.org/GitRepository"},
+                },
+            ]
+        }
+    }
+    server.clear_sparql_cache()
+    with patch("server.run_dashboard_sparql", return_value=closure_response) as m:
+        closure = server.get_subclass_closure()
+        assert server.get_subclass_closure() is closure
+        assert m.call_count == 1
+    assert closure[root] == [root, "http://example.org/GitRepository"]
+    query = server.build_analytics_counts_query(closure)
+    assert (
+        '("codebaseMetrics.totalRepositories" <http://example.org/GitRepository>)'
+        in query
+    )
+    assert "subClassOf" not in query
+
+
+def test_binding_value_defaults_unbound_variables():
+    binding = {"label": {"type": "literal", "value": "Foo"}}
+    assert server._binding_value(binding, "label") == "Foo"
+    assert server._binding_value(binding, "file") == ""
+    assert server._binding_value(binding, "count", 0) == 0
+
+
+def test_code_complexity_distribution_bucketed_locally(client):
+    counts = {"3": "4", "5": "1", "7": "2", "25": "1"}
+    counts_response = {
+        "results": {
+            "bindings": [
+                {"complexity": {"value": c}, "count": {"value": n}}
+                for c, n in counts.items()
+            ]
+        }
+    }
+    empty = {"results": {"bindings": []}}
+
+    def fake_sparql(query):
+        return counts_response if "GROUP BY ?complexity" in query else empty
+
+    with patch("server.run_dashboard_sparql", side_effect=fake_sparql) as mock_sparql:
+        data = client.get("/api/metrics/code-complexity").get_json()
+        assert data["complexityDistribution"] == [
+            {"range": "Low (1-5)", "count": 5},
+            {"range": "Medium (6-10)", "count": 2},
+            {"range": "Very High (>20)", "count": 1},
+        ]
+        assert data["totalFunctions"] == 8
+        assert data["overallAverageComplexity"] == 7.0
+        assert mock_sparql.call_count == 2
+
+
+def test_run_dashboard_sparql_scalar_parses_csv():
+    server.clear_sparql_cache()
+    response = server.requests.Response()
+    response.status_code = 200
+    response._content = b"count\r\n42\r\n"
+    with patch("server.post_sparql_form", return_value=response) as mock_post:
+        assert server.run_dashboard_sparql_scalar("SELECT (1 AS ?c) {}") == "42"
+        assert server.run_dashboard_sparql_scalar("SELECT (1 AS ?c) {}") == "42"
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.args[1] == "text/csv"
+    response._content = b"avg\r\n\r\n"
+    with patch("server.post_sparql_form", return_value=response):
+        assert server.run_dashboard_sparql_scalar("SELECT (2 AS ?c) {}") is None
+
+
+def test_language_distribution_percentages():
+    language_response = {
+        "results": {
+            "bindings": [
+                {"language": {"value": "python"}, "count": {"value": "3"}},
+                {"language": {"value": "go"}, "count": {"value": "1"}},
+            ]
+        }
+    }
+    with patch("server.get_subclass_closure", return_value={}), patch(
+        "server.run_dashboard_sparql", return_value=language_response
+    ):
+        data = server._fetch_language_distribution()
+    assert data["languageDistribution"] == [
+        {"language": "python", "entities": 3, "percentage": 75.0},
+        {"language": "go", "entities": 1, "percentage": 25.0},
+    ]
+
+
+def test_analytics_graph_version_etag_skips_queries(client):
+    empty = {"results": {"bindings": []}}
+    with patch("server.run_dashboard_sparql", return_value=empty), patch(
+        "server.run_dashboard_sparql_scalar", return_value=None
+    ):
+        response = client.get("/api/analytics")
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    with patch("server.run_dashboard_sparql") as mock_sparql:
+        response = client.get("/api/analytics", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        mock_sparql.assert_not_called()
+
+    server.clear_sparql_cache()
+    with patch("server.run_dashboard_sparql", return_value=empty), patch(
+        "server.run_dashboard_sparql_scalar", return_value=None
+    ):
+        response = client.get("/api/analytics", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+
+def test_analytics_degraded_response_gets_no_etag(client):
+    server.clear_sparql_cache()
+    with patch("server.run_dashboard_sparql", side_effect=RuntimeError("down")):
+        response = client.get("/api/analytics")
+    assert response.status_code == 200
+    assert response.get_json()["codebaseMetrics"] == {}
+    assert "ETag" not in response.headers
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_large_json_responses_are_gzipped(client):
+    import gzip
+
+    with patch("server._count_predicate", return_value=7):
+        response = client.get("/api/relationships", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        data = json.loads(gzip.decompress(response.data))
+        assert len(data["relationships"]) == len(server.RELATIONSHIP_PREDICATES)
+
+        response = client.get("/api/relationships")
+        assert "Content-Encoding" not in response.headers
+
+        response = client.get(
+            "/api/relationships", headers={"Accept-Encoding": "gzip;q=0"}
+        )
+        assert "Content-Encoding" not in response.headers
+
+
+def test_analytics_queries_rendered_once_per_closure():
+    empty = {"results": {"bindings": []}}
+    server.clear_sparql_cache()
+    with patch("server.run_dashboard_sparql", return_value=empty):
+        queries = server.get_analytics_queries()
+        assert server.get_analytics_queries() is queries
+        assert "subClassOf" not in queries["language"]
+        server.clear_sparql_cache()
+        assert server.get_analytics_queries() is not queries
+
+
+def test_relationships_counted_per_predicate(client):
+    counts = {
+        f"{server._WDO_IRI}invokes": "5",
+        f"{server._WDO_IRI}imports": "9",
+    }
+
+    threads = set()
+
+    def fake_scalar(query):
+        threads.add(threading.current_thread().name)
+        for predicate, count in counts.items():
+            if f"<{predicate}>" in query:
+                return count
+        return "0"
+
+    with patch(
+        "server.run_dashboard_sparql_scalar", side_effect=fake_scalar
+    ) as mock_scalar:
+        data = client.get("/api/relationships").get_json()
+        assert mock_scalar.call_count == len(server.RELATIONSHIP_PREDICATES)
+    assert data["relationships"] == [
+        {"type": f"{server._WDO_IRI}imports", "name": "imports", "count": 9},
+        {"type": f"{server._WDO_IRI}invokes", "name": "invokes", "count": 5},
+    ]
+    assert data["totalRelationships"] == 14
+    # Counts run on the shared, bounded fan-out pool
+    assert all(name.startswith("sparql-fanout") for name in threads)
+    assert len(threads) <= server.SPARQL_FANOUT_WORKERS
+
+
+def test_analytics_served_from_materialized_sections(client):
+    sections = {name: {"stored": name} for name in server.ANALYTICS_SECTIONS}
+    stored = {
+        "results": {
+            "bindings": [
+                {
+                    "section": {"value": f"urn:dashboard:section:{name}"},
+                    "value": {"value": json.dumps(value)},
+                }
+                for name, value in sections.items()
+            ]
+        }
+    }
+    server.clear_sparql_cache()
+    with patch("server.run_dashboard_sparql", return_value=stored) as mock_sparql:
+        data = client.get("/api/analytics").get_json()
+        mock_sparql.assert_called_once_with(server.MATERIALIZED_ANALYTICS_QUERY)
+    assert data["languageDistribution"] == {"stored": "languageDistribution"}
+    assert data["assetMetrics"] == {"stored": "assetMetrics"}
+
+
+def test_compute_and_store_dashboard_aggregates_replaces_graph():
+    def fetch():
+        return {"codebaseMetrics": {"totalFiles": 3}, "languageDistribution": []}
+
+    with patch("server._ANALYTICS_SECTION_FETCHERS", (fetch,)), patch(
+        "requests.Session.post"
+    ) as mock_post:
+        mock_post.return_value.status_code = 200
+        assert server.compute_and_store_dashboard_aggregates()
+    update = mock_post.call_args.kwargs["data"]["update"]
+    assert "DROP SILENT GRAPH <urn:dashboard:materialized>" in update
+    assert '<urn:dashboard:section:codebaseMetrics> "{\\"totalFiles\\": 3}"' in update
+
+
+def test_dashboard_stats_single_combined_query(client):
+    stats = {
+        "results": {
+            "bindings": [
+                {
+                    "totalRepos": {"value": "2"},
+                    "totalFiles": {"value": "10"},
+                    "totalAllEntities": {"value": "40"},
+                    "totalImports": {"value": "6"},
+                    "averageComplexity": {"value": "2.345"},
+                }
+            ]
+        }
+    }
+    empty = {"results": {"bindings": []}}
+
+    threads = set()
+
+    def fake_sparql(query):
+        threads.add(threading.current_thread().name)
+        return stats if query == server.DASHBOARD_STATS_QUERY else empty
+
+    server.cache.clear()
+    with patch("server.run_dashboard_sparql", side_effect=fake_sparql) as mock_sparql:
+        data = client.get("/api/dashboard_stats").get_json()
+        # The combined statistics query plus the language distribution
+        assert mock_sparql.call_count == 2
+    # Both run on the shared fan-out pool rather than a per-request one
+    assert all(name.startswith("sparql-fanout") for name in threads)
+    server.cache.clear()
+    assert data["totalRepositories"] == 2
+    assert data["totalFiles"] == 10
+    assert data["totalEntities"] == 40
+    assert data["totalImports"] == 6
+    assert data["totalRelationships"] == 0
+    assert data["averageComplexity"] == 2.35
+
+
+def test_export_csv_streams_store_body(client):
+    body = b'Subject,Predicate,Object\r\nhttp://example.org/s,http://example.org/p,"say ""hi"""\r\n'
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.iter_content.return_value = iter([body[:10], body[10:]])
+        response = client.get("/api/export/csv")
+        assert response.get_data() == body
+        assert mock_post.call_args.kwargs["stream"] is True
+        assert mock_post.call_args.kwargs["headers"]["Accept"] == "text/csv"
+        mock_post.return_value.close.assert_called()
+    assert response.mimetype == "text/csv"
+
+
+def test_export_rdf_regenerated_only_when_stale(client, tmp_path):
+    ttl = tmp_path / "wdkb.ttl"
+    ttl.write_text(
+        "<http://example.org/s> <http://example.org/p> <http://example.org/o> .\n"
+    )
+    original_parse = Graph.parse
+    with patch.object(server, "get_output_path", return_value=str(ttl)), patch(
+        "rdflib.Graph.parse", autospec=True, side_effect=original_parse
+    ) as mock_parse:
+        first = client.get("/api/export/rdf")
+        second = client.get("/api/export/rdf")
+        assert mock_parse.call_count == 1
+        os.utime(ttl, (time.time() + 10, time.time() + 10))
+        client.get("/api/export/rdf")
+        assert mock_parse.call_count == 2
+    assert first.status_code == 200
+    assert first.get_data() == second.get_data()
+    assert b"http://example.org/o" in first.get_data()
+    assert (tmp_path / "wdkb.rdf").exists()
+    assert not hasattr(server, "_export_graph_cache")
+
+
+def test_export_ttl_sent_from_disk(client, tmp_path):
+    ttl = tmp_path / "wdkb.ttl"
+    ttl.write_bytes(b"<http://example.org/s> <http://example.org/p> 1 .\n")
+    with patch.object(server, "get_output_path", return_value=str(ttl)), patch(
+        "rdflib.Graph.parse"
+    ) as mock_parse:
+        response = client.get("/api/export/ttl")
+        assert response.get_data() == ttl.read_bytes()
+        assert response.mimetype == "text/turtle"
+        cached = client.get(
+            "/api/export/ttl", headers={"If-None-Match": response.headers["ETag"]}
+        )
+        mock_parse.assert_not_called()
+    assert cached.status_code == 304
+
+
+def test_config_encoded_once(client):
+    server._config_json.cache_clear()
+    with patch.object(app.json, "dumps", wraps=app.json.dumps) as mock_dumps:
+        first = client.get("/api/config")
+        second = client.get("/api/config")
+        assert mock_dumps.call_count == 1
+    assert first.get_data() == second.get_data()
+    assert first.get_json()["features"]["export"] is True
+    assert first.get_json()["backend"]["debug"] is app.debug
+
+
+def test_health_probes_coalesced(client):
+    server._health_cache = None
+    with patch.object(server, "_post_dashboard_sparql") as mock_sparql:
+        first = client.get("/api/health")
+        second = client.get("/api/health")
+        assert mock_sparql.call_count == 1
+        server._health_cache = (
+            server._health_cache[0] - server.HEALTH_CACHE_TTL,
+            *server._health_cache[1:],
+        )
+        client.get("/api/health")
+        assert mock_sparql.call_count == 2
+    assert first.get_json() == second.get_json()
+    assert first.get_json()["services"]["sparql_endpoint"] is True
+
+
+def test_health_probe_skips_result_cache(client):
+    server._health_cache = None
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"results": {"bindings": []}}
+        mock_post.return_value.content = b'{"results": {"bindings": []}}'
+        client.get("/api/health")
+        server._health_cache = None
+        data = client.get("/api/health").get_json()
+    assert mock_post.call_count == 2
+    assert isinstance(data["performance"]["sparql_response_time_ms"], float)
+
+
+def test_health_reports_slow_store_without_waiting(client):
+    server._health_cache = None
+    release = threading.Event()
+    with patch.object(
+        server, "_post_dashboard_sparql", side_effect=lambda q, **kw: release.wait(5)
+    ) as mock_sparql, patch.object(server, "HEALTH_PROBE_TIMEOUT", 0.05):
+        start = time.monotonic()
+        response = client.get("/api/health")
+        elapsed = time.monotonic() - start
+        # A probe still stuck on the store is awaited again, not duplicated
+        server._health_cache = None
+        assert client.get("/api/health").status_code == 503
+        assert mock_sparql.call_count == 1
+        assert mock_sparql.call_args.kwargs["timeout"] == (0.05, 0.05)
+        release.set()
+        server._health_probe_future.result()
+    assert response.status_code == 503
+    assert response.get_json()["services"]["sparql_endpoint"] is False
+    assert elapsed < 2
+
+
+def test_export_json_streams_store_body(client):
+    body = b'[{"@id": "http://example.org/s"}]'
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.iter_content.return_value = iter([body])
+        response = client.get("/api/export/json")
+        assert response.get_data() == body
+        assert mock_post.call_args.kwargs["headers"]["Accept"] == "application/ld+json"
+        mock_post.return_value.json.assert_not_called()
+    assert response.mimetype == "application/ld+json"
+
+
+def test_browser_cache_headers(client):
+    server._config_json.cache_clear()
+    config = client.get("/api/config")
+    assert config.cache_control.max_age == 3600
+    revalidated = client.get(
+        "/api/config", headers={"If-None-Match": config.headers["ETag"]}
+    )
+    assert revalidated.status_code == 304
+
+    server._health_cache = None
+    with patch.object(server, "_post_dashboard_sparql"):
+        assert client.get("/api/health").cache_control.max_age == 1
+
+
+def test_code_complexity_totals_cover_all_files(client):
+    rows = [
+        {"fileName": {"value": f"f{i}.py"}, "totalComplexity": {"value": str(50 - i)}}
+        for i in range(30)
+    ]
+
+    def fake_sparql(query):
+        bindings = rows if "GROUP BY ?fileName" in query else []
+        return {"results": {"bindings": bindings}}
+
+    with patch("server.run_dashboard_sparql", side_effect=fake_sparql):
+        data = client.get("/api/metrics/code-complexity").get_json()
+    assert [f["file"] for f in data["files"]] == [f"f{i}.py" for i in range(20)]
+    assert data["totalFiles"] == 30
+    assert data["highComplexityFiles"] == 30
+    assert data["averageComplexity"] == 35.5
+
+
+def test_dashboard_stats_concurrent_misses_rebuild_once(client):
+    calls = []
+    mock_response = {"results": {"bindings": [{"count": {"value": "5"}}]}}
+
+    def slow_sparql(query):
+        calls.append(query)
+        time.sleep(0.1)
+        return mock_response
+
+    def fetch():
+        with app.test_client() as c:
+            statuses.append(c.get("/api/dashboard_stats").status_code)
+
+    statuses = []
+    server.cache.clear()
+    with patch("server.run_dashboard_sparql", side_effect=slow_sparql):
+        fetch()
+        single = len(calls)
+        server.cache.clear()
+        calls.clear()
+        threads = [threading.Thread(target=fetch) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert statuses == [200] * 5
+    assert len(calls) == single
+
+
+def test_export_csv_gzip_for_accepting_clients(client):
+    body = b"Subject,Predicate,Object\r\n" * 50
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.headers = {}
+        mock_post.return_value.iter_content.return_value = iter(
+            [body[:100], body[100:]]
+        )
+        response = client.get("/api/export/csv", headers={"Accept-Encoding": "gzip"})
+        data = response.get_data()
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(data) == body
+
+    compressed = gzip.compress(body)
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.headers = {"Content-Encoding": "gzip"}
+        mock_post.return_value.raw.stream.return_value = iter([compressed])
+        response = client.get("/api/export/csv", headers={"Accept-Encoding": "gzip"})
+        assert response.get_data() == compressed
+        mock_post.return_value.iter_content.assert_not_called()
+
+
+def test_exports_exclude_dashboard_aggregates(client):
+    with patch("server._stream_sparql_export", return_value="") as mock_export:
+        client.get("/api/export/json")
+        client.get("/api/export/csv")
+    for call in mock_export.call_args_list:
+        assert "FILTER(?s != <urn:dashboard:analytics>)" in call.args[0]
+
+
+def test_export_csv_not_gzipped_when_refused(client):
+    body = b"Subject,Predicate,Object\r\n" * 50
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.headers = {}
+        mock_post.return_value.iter_content.return_value = iter([body])
+        response = client.get(
+            "/api/export/csv", headers={"Accept-Encoding": "gzip;q=0, identity"}
+        )
+        assert response.get_data() == body
+    assert "Content-Encoding" not in response.headers
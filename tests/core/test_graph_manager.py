@@ -85,3 +85,70 @@ def test_serialize_invalid_format(tmp_path):
     out_path = tmp_path / "graph.invalid"
     with pytest.raises(Exception):
         gm.serialize(str(out_path), fmt="invalidformat")
+
+
+def test_stats_cached_until_next_add():
+    """Test stats are reused until a triple is added."""
+    gm = GraphManager(DummyOntology())
+    s = URIRef("http://example.org/subject")
+    p = URIRef("http://example.org/predicate")
+    gm.add_triple(s, p, URIRef("http://example.org/a"))
+    assert gm.stats()["objects"] == 1
+    gm.graph.add((s, p, URIRef("http://example.org/untracked")))
+    assert gm.stats()["objects"] == 1
+    gm.add_triple(s, p, URIRef("http://example.org/b"))
+    assert gm.stats() == {
+        "total_triples": 3,
+        "subjects": 1,
+        "predicates": 1,
+        "objects": 3,
+    }
+
+
+def test_add_triples_bulk():
+    """Test adding several triples at once updates the graph and stats."""
+    gm = GraphManager(DummyOntology())
+    s = URIRef("http://example.org/subject")
+    p = URIRef("http://example.org/predicate")
+    assert gm.stats()["total_triples"] == 0
+    gm.add_triples((s, p, URIRef(f"http://example.org/o{i}")) for i in range(3))
+    assert len(gm.graph) == 3
+    assert gm.stats()["objects"] == 3
+
+
+def test_serialize_ntriples(tmp_path):
+    """Test serializing to N-Triples writes one line per triple."""
+    gm = GraphManager(DummyOntology())
+    s = URIRef("http://example.org/subject")
+    p = URIRef("http://example.org/predicate")
+    gm.add_triples((s, p, URIRef(f"http://example.org/o{i}")) for i in range(3))
+    out_path = tmp_path / "graph.nt"
+    gm.serialize(str(out_path), fmt="nt")
+    lines = out_path.read_text().splitlines()
+    assert len(lines) == 3
+    assert "<http://example.org/o0> ." in "\n".join(lines)
+
+
+def test_serialize_invalid_format_writes_no_file(tmp_path):
+    """Test an unknown format is rejected before the output file is created."""
+    gm = GraphManager(DummyOntology())
+    out_path = tmp_path / "graph.invalid"
+    with pytest.raises(Exception):
+        gm.serialize(str(out_path), fmt="invalidformat")
+    assert not out_path.exists()
+
+
+def test_namespace_bindings_match_direct_binding():
+    """Test graphs get the same prefixes as binding the ontology directly."""
+    from rdflib import Graph
+
+    expected = Graph()
+    for prefix, ns in DummyOntology.namespaces.items():
+        expected.bind(prefix, ns)
+    first = GraphManager(DummyOntology())
+    second = GraphManager(DummyOntology())
+    assert sorted(first.graph.namespaces()) == sorted(expected.namespaces())
+    assert sorted(second.graph.namespaces()) == sorted(expected.namespaces())
+    assert (
+        first.graph.namespace_manager.compute_qname("http://example.org/x")[0] == "ex"
+    )
@@ -1,4 +1,5 @@
 import pytest
+from rdflib import URIRef
 from rdflib.namespace import SKOS as RDFlibSKOS
 
 from app.core import namespaces
@@ -25,3 +26,18 @@ def test_skos_namespace():
 def test_dcterms_namespace():
     """Test that DCTERMS namespace is defined correctly."""
     assert str(namespaces.DCTERMS) == "http://purl.org/dc/terms/"
+
+
+def test_wdo_terms_built_once():
+    """Test that WDO attribute terms are reused across accesses."""
+    term = namespaces.WDO.SomeCachedTestTerm
+    assert str(term) == str(namespaces.WDO) + "SomeCachedTestTerm"
+    assert namespaces.WDO.SomeCachedTestTerm is term
+    assert namespaces.WDO["SomeCachedTestTerm"] == term
+
+
+def test_inst_uri_matches_namespace_item():
+    """Test inst_uri mints the same URI as indexing INST."""
+    uri = namespaces.inst_uri("repo/src/main.py")
+    assert isinstance(uri, URIRef)
+    assert uri == namespaces.INST["repo/src/main.py"]
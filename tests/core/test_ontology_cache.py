@@ -1,4 +1,5 @@
 import json
+import sys
 import tempfile
 from typing import Any, Dict, List
 from unittest.mock import patch
@@ -89,8 +90,9 @@ def test_global_cache_and_extraction_functions(tmp_path, monkeypatch):
     get_extraction_classes = oc_mod.get_extraction_classes
     cache = get_ontology_cache()
     assert cache.classes == ["ClassA", "ClassB"]
-    assert get_extraction_properties() == ["objProp1", "dataProp1"]
-    assert get_extraction_classes() == ["ClassA", "ClassB"]
+    assert get_extraction_properties() == ("objProp1", "dataProp1")
+    assert get_extraction_classes() == ("ClassA", "ClassB")
+    assert get_extraction_properties() is get_extraction_properties()
 
 
 @patch("app.ontology.wdo.WDOOntology", DummyWDOOntology)
@@ -108,3 +110,25 @@ def test_load_cache_invalid_json(tmp_path):
     bad_path.write_text("not a json")
     with pytest.raises(ValueError):
         OntologyCache(str(bad_path))
+
+
+def test_wdo_ontology_loaded_once(tmp_path):
+    """Test the property and class caches share one WDO ontology instance."""
+    cache_path = tmp_path / "ontology_cache.json"
+    cache_path.write_text(json.dumps(MOCK_CACHE))
+    cache = OntologyCache(str(cache_path))
+    with patch("app.ontology.wdo.WDOOntology", return_value=DummyWDOOntology()) as wdo:
+        assert cache.get_property_cache(["objProp1"]) == {
+            "objProp1": "Property:objProp1"
+        }
+        assert cache.get_class_cache(["ClassA"]) == {"ClassA": "Class:ClassA"}
+    wdo.assert_called_once()
+
+
+def test_names_interned_on_load(tmp_path):
+    """Test class and property names are interned when the cache loads."""
+    cache_path = tmp_path / "ontology_cache.json"
+    cache_path.write_text(json.dumps(MOCK_CACHE))
+    cache = OntologyCache(str(cache_path))
+    assert cache.classes[0] is sys.intern("ClassA")
+    assert cache.annotation_properties[0] is sys.intern("annProp1")
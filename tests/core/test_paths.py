@@ -78,6 +78,53 @@ def test_uri_safe_string():
     assert paths.uri_safe_string("a---b") == "a---b"
     assert paths.uri_safe_string("a__b__c") == "a_b_c"
     assert paths.uri_safe_string("a__b__c!!") == "a_b_c"
+    assert paths.uri_safe_string("a_b c") == "a_b_c"
+    assert paths.uri_safe_string("a _b") == "a_b"
+
+
+def test_uri_safe_file_path():
+    """Test uri_safe_file_path sanitizes each component and keeps slashes."""
+    assert paths.uri_safe_file_path("") == ""
+    assert paths.uri_safe_file_path("src/app.js") == "src/app.js"
+    assert paths.uri_safe_file_path("/my dir//__x__/a:b.py") == "my_dir/x/a_b.py"
+    assert paths.uri_safe_file_path("a  b/c__d") == "a_b/c_d"
+
+
+def test_uri_safe_ascii_fast_path_matches_regex():
+    """Test the ASCII translate tables agree with the regex fallback."""
+    for code in range(128):
+        char = chr(code)
+        expected = re.sub(r"[^\w\-./]", "_", f"a{char}b")
+        expected = re.sub(r"_+", "_", expected)
+        assert paths.uri_safe_string(f"a{char}b") == expected
+        if char != "/":
+            expected = re.sub(r"[^\w\-.]", "_", f"a{char}b")
+            expected = re.sub(r"_+", "_", expected)
+            assert paths.uri_safe_file_path(f"a{char}b") == expected
+    # Non-ASCII word characters are kept via the regex fallback
+    assert paths.uri_safe_string("caf\u00e9 \u00fc") == "caf\u00e9_\u00fc"
+    assert (
+        paths.uri_safe_file_path("d\u00e9j\u00e0/\u00e9 t") == "d\u00e9j\u00e0/\u00e9_t"
+    )
+
+
+def test_uri_safe_functions_are_memoized():
+    """Test repeated sanitizer calls are served from the LRU cache."""
+    paths._uri_safe_string.cache_clear()
+    paths._uri_safe_file_path.cache_clear()
+    for _ in range(3):
+        assert paths.uri_safe_string("my func") == "my_func"
+        assert paths.uri_safe_file_path("src/my file.py") == "src/my_file.py"
+    assert paths._uri_safe_string.cache_info().hits == 2
+    assert paths._uri_safe_file_path.cache_info().hits == 2
+
+
+def test_uri_safe_string_accepts_unhashable_values():
+    """Test non-str arguments are converted with str() before caching."""
+    value = {"name": "x y"}
+    assert paths.uri_safe_string(value) == paths.uri_safe_string(str(value))
+    assert paths.uri_safe_string(value) == "name_x_y"
+    assert paths.uri_safe_string(42) == "42"
 
 
 def test_get_carrier_types_path():
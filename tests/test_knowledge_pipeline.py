@@ -31,6 +31,8 @@ def test_upload_ttl_to_allegrograph_success():
     ):
         kp.upload_ttl_to_allegrograph("fake.ttl")
         mock_client.upload_ttl_file.assert_called_once_with("fake.ttl")
+        # Aggregates computed over the previous graph are dropped
+        mock_client.drop_graph.assert_called_once_with(kp.DASHBOARD_AGGREGATES_GRAPH)
 
 
 def test_upload_ttl_to_allegrograph_failure():
@@ -44,6 +46,7 @@ def test_upload_ttl_to_allegrograph_failure():
         with patch("sys.exit") as mock_exit:
             kp.upload_ttl_to_allegrograph("fail.ttl")
             mock_exit.assert_called_once_with(1)
+        mock_client.drop_graph.assert_not_called()
 
 
 def test_main_success():
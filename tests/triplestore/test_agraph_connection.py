@@ -68,6 +68,24 @@ def test_upload_ttl_file_success(mock_session, tmp_path):
     assert client.upload_ttl_file(str(file_path)) is True
 
 
+@patch.dict(
+    os.environ,
+    {
+        "AGRAPH_CLOUD_URL": "http://repo",
+        "AGRAPH_USERNAME": "user",
+        "AGRAPH_PASSWORD": "pass",
+    },
+)
+@patch("requests.Session", return_value=DummySession())
+def test_drop_graph_posts_update(mock_session):
+    """Test drop_graph sends a silent DROP GRAPH update to the repository."""
+    client = ag_mod.AllegroGraphRESTClient()
+    assert client.drop_graph("urn:g") is True
+    url, data, _, _ = client.session.last_post
+    assert url == "http://repo"
+    assert data == {"update": "DROP SILENT GRAPH <urn:g>"}
+
+
 @patch.dict(
     os.environ,
     {